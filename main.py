@@ -1,10 +1,13 @@
-from video2md.agents.summarize_host import summarize_host
+from video2md.agents.summarize_host import make_summarize_semaphore, summarize_host
 from video2md.agents.research_host import research_host
-from video2md.agents.whisper_host import whisper_host
+from video2md.agents.whisper_host import whisper_host_stream
 from video2md.utils.dependency_checker import DependencyChecker
 from dotenv import load_dotenv
+import asyncio
+import logging
 import sys
 from pathlib import Path as _Path
+from typing import Any, Dict, List
 
 # Ensure src/ is on sys.path when running from source tree
 _SRC = _Path(__file__).resolve().parent / "src"
@@ -15,20 +18,42 @@ if _SRC.exists():
 # Load environment variables
 load_dotenv(override=True)
 
+logger = logging.getLogger(__name__)
+
 
 async def run():
-    # End-to-end: transcribe (or reuse), research, summarize
-    srts = await whisper_host()
+    # End-to-end: transcribe (or reuse), research, summarize.
+    # Stages are pipelined per file: research starts as soon as a file's SRT
+    # exists, and summarizing as soon as that file's research is done.
+    summary_srts: List[str] = []
+    summary_tasks: List[asyncio.Task] = []
+    # One bound for all per-file summarize_host calls
+    summary_sem = make_summarize_semaphore()
+
+    async def summarize(srt: str, research_result: Dict[str, Any]) -> None:
+        summary_srts.append(srt)
+        summary_tasks.append(asyncio.create_task(
+            summarize_host([srt], [research_result], semaphore=summary_sem)))
+
     # For quick testing, you can hardcode SRTs:
-    # srts = ['whisper_output/windrecorder.srt']
-    researcher_results = await research_host(srts)
-    summaries = await summarize_host(srts, researcher_results)
+    # await research_host(['whisper_output/windrecorder.srt'], on_result=summarize)
+    await research_host(whisper_host_stream(), on_result=summarize)
+    # A failed summary must not cancel the others still in flight
+    outcomes = await asyncio.gather(*summary_tasks, return_exceptions=True)
+    summaries: List[str] = []
+    for srt, outcome in zip(summary_srts, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning("Summary failed for %s: %s", _Path(srt).name, outcome)
+            continue
+        summaries.extend(outcome)
     print("Generated summaries:\n" + "\n".join(summaries))
 
 
 if __name__ == "__main__":
-    import asyncio
-    
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    # Per-file progress from the agents is logged at INFO
+    logging.getLogger("video2md.agents").setLevel(logging.INFO)
+
     # Check dependencies before running
     DependencyChecker.validate_or_exit(require_ffmpeg=True, require_node=True)
 
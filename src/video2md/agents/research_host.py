@@ -1,6 +1,9 @@
+import asyncio
 from contextlib import AsyncExitStack
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+import logging
 import os
 
 from agents import Agent, Runner, trace
@@ -9,18 +12,33 @@ from agents.mcp import MCPServerStdio
 from video2md.prompt_loader import default_loader as prompts
 from video2md.server.mcp_params import files_params, researcher_mcp_server_params
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+@lru_cache(maxsize=None)
+def _load_prompts(prompt_variant: str) -> Tuple[str, Callable[..., str]]:
+    """Read a variant's instructions and compile the input template once per process."""
+    return (
+        prompts.load(f"researcher_instructions/{prompt_variant}"),
+        prompts.compile("researcher_input"),
+    )
+
 
 async def research_host(
-    srts: List[str],
+    srts: Union[Iterable[str], AsyncIterable[str]],
     model: str = "gpt-5-nano",
     prompt_variant: str = "github_project",
     user_notes: str | None = None,
     enable_trace: bool = True,
+    max_concurrent: Optional[int] = None,
+    on_result: Optional[Callable[[str, Dict[str, Any]], Awaitable[Any]]] = None,
 ) -> List[Dict[str, Any]]:
     """Run the Researcher agent across transcripts and return results per file.
 
     Args:
-        srts: List of transcript file paths (.srt or .txt).
+        srts: Transcript file paths (.srt or .txt). May be an async iterable,
+            in which case each transcript is researched as soon as it arrives.
         model: LLM model name.
         prompt_variant: One of the researcher prompt variants inside
             prompts/researcher_instructions/ (e.g., github_project, general,
@@ -29,10 +47,13 @@ async def research_host(
             (e.g., product spec hints, author commentary). Strongly prioritized
             over raw transcript tokens when conflicts arise.
         enable_trace: Whether to create trace for this agent (set False if parent already has trace)
+        max_concurrent: Maximum number of transcripts researched at the same time
+            (default: RESEARCH_MAX_CONCURRENT, or 4)
+        on_result: Optional coroutine called with (srt, result) as soon as each
+            transcript's research succeeds
     """
     # Load variant system instructions
-    system_prompt = prompts.load(f"researcher_instructions/{prompt_variant}")
-    results: List[Dict[str, Any]] = []
+    system_prompt, render_input = _load_prompts(prompt_variant)
 
     # Per-tool client session timeout in seconds: if a tool call hangs (e.g., fetch to a blocked site),
     # the client will cut it off so the agent can try other sources. Keep Runner.run unbounded to
@@ -43,57 +64,93 @@ async def research_host(
     except ValueError:
         tool_session_timeout_s = 60
 
-    for srt in srts:
-        srt_path = Path(srt)
-        file_name = srt_path.stem
-        # Prefer .txt transcript to reduce tokens; fallback to provided .srt
-        txt_candidate = srt_path.with_suffix(".txt")
-        transcript_path = txt_candidate if txt_candidate.exists() else srt_path
-        async with AsyncExitStack() as stack:
-            mcp_servers = [
-                await stack.enter_async_context(
-                    MCPServerStdio(
-                        params=param,
-                        client_session_timeout_seconds=tool_session_timeout_s,
-                    )
+    if not isinstance(srts, AsyncIterable):
+        srts = list(srts)
+        if not srts:
+            return []
+
+    # Read at call time, after the application has loaded .env
+    if max_concurrent is None:
+        max_concurrent = int(os.getenv("RESEARCH_MAX_CONCURRENT", "4"))
+    sem = asyncio.Semaphore(max(1, max_concurrent))
+
+    # Spawn the MCP servers once and share them across all transcripts;
+    # Runner.run keeps no per-call state on the agent
+    async with AsyncExitStack() as stack:
+        mcp_servers = [
+            await stack.enter_async_context(
+                MCPServerStdio(
+                    params=param,
+                    client_session_timeout_seconds=tool_session_timeout_s,
                 )
-                for param in [files_params] + researcher_mcp_server_params
-            ]
-
-            agent = Agent(
-                name="Researcher",
-                model=model,
-                instructions=system_prompt,
-                mcp_servers=mcp_servers,
             )
+            for param in [files_params] + researcher_mcp_server_params
+        ]
+
+        agent = Agent(
+            name="Researcher",
+            model=model,
+            instructions=system_prompt,
+            mcp_servers=mcp_servers,
+        )
+
+        async def _one(srt: str) -> Dict[str, Any]:
+            srt_path = Path(srt)
+            file_name = srt_path.stem
+            # Prefer .txt transcript to reduce tokens; fallback to provided .srt
+            txt_candidate = srt_path.with_suffix(".txt")
+            transcript_path = txt_candidate if txt_candidate.exists() else srt_path
             # Prepare structured input expected by the Researcher prompt
-            message = prompts.render(
-                "researcher_input",
+            message = render_input(
                 TRANSCRIPT_PATH=str(transcript_path),
                 FILENAME_HINT=file_name,
                 USER_NOTES=(user_notes or ""),
                 PROMPT_VARIANT=prompt_variant,
             )
 
-            # Only create trace if enable_trace is True
-            if enable_trace:
-                # Use file_name as group_id to group all agents for the same media file
-                with trace(
-                    workflow_name=f"Researcher Agent Runner: {file_name}",
-                    group_id=file_name
-                ):
+            async with sem:
+                # Only create trace if enable_trace is True
+                if enable_trace:
+                    # Use file_name as group_id to group all agents for the same media file
+                    with trace(
+                        workflow_name=f"Researcher Agent Runner: {file_name}",
+                        group_id=file_name
+                    ):
+                        res = await Runner.run(
+                            agent,
+                            input=message,
+                            max_turns=20,
+                        )
+                else:
+                    # Run without creating a new trace (parent trace will be used)
                     res = await Runner.run(
                         agent,
                         input=message,
                         max_turns=20,
                     )
-            else:
-                # Run without creating a new trace (parent trace will be used)
-                res = await Runner.run(
-                    agent,
-                    input=message,
-                    max_turns=20,
-                )
-            results.append({file_name: res.final_output})
+            result = {file_name: res.final_output}
+            if on_result is not None:
+                await on_result(srt, result)
+            return result
+
+        # Transcripts are independent MCP/LLM round-trips, so research them
+        # concurrently, starting each one as soon as it is available
+        received: List[str] = []
+        tasks: List[asyncio.Task] = []
+        if isinstance(srts, AsyncIterable):
+            async for srt in srts:
+                received.append(srt)
+                tasks.append(asyncio.create_task(_one(srt)))
+        else:
+            received = srts
+            tasks = [asyncio.create_task(_one(srt)) for srt in srts]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results: List[Dict[str, Any]] = []
+    for srt, outcome in zip(received, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning("Research failed for %s: %s", Path(srt).name, outcome)
+            continue
+        results.append(outcome)
 
     return results
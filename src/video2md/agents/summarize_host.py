@@ -1,10 +1,39 @@
+import asyncio
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from agents import Agent, Runner, trace
 
 from video2md.prompt_loader import default_loader as prompts
 from video2md.services.media_utils import read_transcript_text, find_moved_media
+from video2md.utils.text_io import write_text_file
+
+
+def make_summarize_semaphore(max_concurrent: Optional[int] = None) -> asyncio.Semaphore:
+    """Create the semaphore bounding concurrent summaries.
+
+    Pass one to several summarize_host() calls (e.g. one call per file) so the
+    bound applies across all of them instead of per call.
+
+    Args:
+        max_concurrent: Maximum summaries at the same time
+            (default: SUMMARIZE_MAX_CONCURRENT, or 6; read at call time,
+            after the application has loaded .env)
+    """
+    if max_concurrent is None:
+        max_concurrent = int(os.getenv("SUMMARIZE_MAX_CONCURRENT", "6"))
+    return asyncio.Semaphore(max(1, max_concurrent))
+
+
+@lru_cache(maxsize=None)
+def _load_prompts() -> Tuple[str, Callable[..., str]]:
+    """Read the instructions and compile the input template once per process."""
+    return (
+        prompts.load("summarizer_instructions"),
+        prompts.compile("summarizer_input"),
+    )
 
 
 async def summarize_host(
@@ -12,6 +41,8 @@ async def summarize_host(
     researcher_results: List[Dict],
     model: str = "gpt-5-nano",
     enable_trace: bool = True,
+    max_concurrent: Optional[int] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
 ) -> List[str]:
     """Create markdown summaries integrating transcript and research; embed original media.
 
@@ -20,10 +51,13 @@ async def summarize_host(
         researcher_results: Research results from research_host
         model: LLM model name
         enable_trace: Whether to create trace for this agent (set False if parent already has trace)
+        max_concurrent: Maximum number of summaries generated at the same time
+            (default: SUMMARIZE_MAX_CONCURRENT, or 6)
+        semaphore: Shared bound from make_summarize_semaphore(); overrides
+            max_concurrent
 
     Returns a list of generated markdown file paths.
     """
-    output_paths: List[str] = []
     root_output_dir = Path("output")
     root_output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -33,45 +67,50 @@ async def summarize_host(
             for k, v in item.items():
                 research_map[str(k)] = str(v)
 
-    system_prompt = prompts.load("summarizer_instructions")
+    system_prompt, render_input = _load_prompts()
 
-    for srt in srts:
+    agent = Agent(
+        name="Summarizer",
+        model=model,
+        instructions=system_prompt,
+    )
+    sem = semaphore or make_summarize_semaphore(max_concurrent)
+
+    async def _one(srt: str) -> str:
         srt_path = Path(srt)
         file_name = srt_path.stem
         # With unified layout, media and transcripts live in ./output/<file_name>/
         per_file_dir = srt_path.parent if srt_path.parent.name == file_name else root_output_dir / file_name
-        per_file_dir.mkdir(parents=True, exist_ok=True)
-        media_file = find_moved_media(file_name, per_file_dir)
         research_text = research_map.get(file_name, "")
-        # Prefer TXT transcript if available; otherwise, clean SRT to plain text
-        transcript_text = read_transcript_text(srt_path)
 
-        agent_input = prompts.render(
-            "summarizer_input",
+        def _prepare():
+            per_file_dir.mkdir(parents=True, exist_ok=True)
+            # Prefer TXT transcript if available; otherwise, clean SRT to plain text
+            return find_moved_media(file_name, per_file_dir), read_transcript_text(srt_path)
+
+        # Directory and file access runs in a thread, off the event loop
+        media_file, transcript_text = await asyncio.to_thread(_prepare)
+
+        agent_input = render_input(
             FILENAME=file_name,
             TRANSCRIPT_TEXT=transcript_text,
             RESEARCH_TEXT=research_text,
         )
 
-        agent = Agent(
-            name="Summarizer",
-            model=model,
-            instructions=system_prompt,
-        )
-
-        # Only create trace if enable_trace is True
-        if enable_trace:
-            # Use file_name as group_id to group all agents for the same media file
-            with trace(
-                workflow_name=f"Summarizer Agent Runner: {file_name}",
-                group_id=file_name
-            ):
+        async with sem:
+            # Only create trace if enable_trace is True
+            if enable_trace:
+                # Use file_name as group_id to group all agents for the same media file
+                with trace(
+                    workflow_name=f"Summarizer Agent Runner: {file_name}",
+                    group_id=file_name
+                ):
+                    res = await Runner.run(agent, input=agent_input)
+                    body_md = res.final_output or ""
+            else:
+                # Run without creating a new trace (parent trace will be used)
                 res = await Runner.run(agent, input=agent_input)
                 body_md = res.final_output or ""
-        else:
-            # Run without creating a new trace (parent trace will be used)
-            res = await Runner.run(agent, input=agent_input)
-            body_md = res.final_output or ""
 
         lines = [f"# {file_name}"]
         if media_file and media_file.exists():
@@ -91,7 +130,11 @@ async def summarize_host(
         lines.append(body_md.strip())
 
         out_path = per_file_dir / f"{file_name}.md"
-        out_path.write_text("\n\n".join(lines) + "\n", encoding="utf-8")
-        output_paths.append(str(out_path))
-
-    return output_paths
+        # Write off the event loop so other in-flight summaries keep running;
+        # the atomic write never leaves a truncated .md behind
+        await asyncio.to_thread(
+            write_text_file, out_path, "\n\n".join(lines) + "\n")
+        return str(out_path)
+
+    # Summaries share no state, so run the LLM calls concurrently
+    return list(await asyncio.gather(*(_one(srt) for srt in srts)))
@@ -1,19 +1,133 @@
-from contextlib import AsyncExitStack
+import asyncio
+import os
+import shutil
+import stat
+from collections import Counter
+from contextlib import AsyncExitStack, nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from agents import Agent, Runner, trace
 from agents.mcp import MCPServerStdio
 
-from video2md.prompt_loader import default_loader as prompts
+from video2md.prompt_loader import default_loader as prompts, to_json
 from video2md.server.mcp_params import whisper_params, openai_transcribe_params, files_params
+from video2md.services.media_utils import MEDIA_EXTENSIONS
+from video2md.utils.file_scanner import DEFAULT_EXCLUDED_DIRS, iter_by_extension
+from video2md.utils.video_converter import get_default_converter
 
 
 import logging
 
-# Configure logging to capture tool calls
-logging.basicConfig(level=logging.WARNING)
+# Per-file progress is logged at INFO with deferred %-formatting, so it costs
+# nothing when disabled; entry points configure handlers and levels
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# MCP servers kept alive across whisper_host calls, per (event loop, method).
+# Each set is owned by a background task so its stack is entered and exited
+# in the same task, as the MCP stdio client requires.
+_persistent_servers: Dict[Tuple[int, str], Tuple[asyncio.Task, asyncio.Future, asyncio.Event]] = {}
+
+
+async def _enter_mcp_servers(stack: AsyncExitStack, params: List[Dict[str, Any]]) -> List[MCPServerStdio]:
+    """Start one MCPServerStdio per param entry inside stack."""
+    return [
+        await stack.enter_async_context(
+            MCPServerStdio(
+                params=param["param"],
+                client_session_timeout_seconds=param["client_session_timeout_seconds"],
+            )
+        )
+        for param in params
+    ]
+
+
+async def _own_mcp_servers(params: List[Dict[str, Any]], ready: asyncio.Future, shutdown: asyncio.Event) -> None:
+    """Start servers, publish them through ready, and keep them open until shutdown."""
+    try:
+        async with AsyncExitStack() as stack:
+            ready.set_result(await _enter_mcp_servers(stack, params))
+            await shutdown.wait()
+    except BaseException as e:
+        # Includes cancellation: waiters shielded on ready must never hang
+        if not ready.done():
+            if isinstance(e, Exception):
+                ready.set_exception(e)
+            else:
+                ready.set_exception(RuntimeError(f"MCP server startup aborted: {e!r}"))
+        elif isinstance(e, Exception):
+            logger.warning("Error while closing persistent MCP servers: %s", e)
+        if not isinstance(e, Exception):
+            raise
+
+
+async def _get_persistent_mcp_servers(transcribe_method: str, params: List[Dict[str, Any]]) -> List[MCPServerStdio]:
+    """Return the persistent MCP servers for transcribe_method, starting them on first use."""
+    key = (id(asyncio.get_running_loop()), transcribe_method)
+    entry = _persistent_servers.get(key)
+    if entry is None:
+        ready = asyncio.get_running_loop().create_future()
+        shutdown = asyncio.Event()
+        task = asyncio.create_task(_own_mcp_servers(params, ready, shutdown))
+        entry = _persistent_servers[key] = (task, ready, shutdown)
+
+    try:
+        # Shield so one cancelled caller does not fail the shared startup
+        return await asyncio.shield(entry[1])
+    except Exception:
+        # Let the next call retry a failed startup
+        if _persistent_servers.get(key) is entry:
+            del _persistent_servers[key]
+        raise
+
+
+async def _discard_persistent_mcp_servers(transcribe_method: str, mcp_servers: List[MCPServerStdio]) -> None:
+    """Forget and shut down a persistent server set after a failed run.
+
+    A crashed server process (e.g. CUDA out-of-memory) would otherwise be
+    reused by every later call; the next call starts a fresh set instead.
+    """
+    key = (id(asyncio.get_running_loop()), transcribe_method)
+    entry = _persistent_servers.get(key)
+    if entry is None:
+        return
+    task, ready, shutdown = entry
+    # Only drop the set this run used; another call may have replaced it
+    if not (ready.done() and not ready.cancelled() and ready.exception() is None
+            and ready.result() is mcp_servers):
+        return
+    del _persistent_servers[key]
+    shutdown.set()
+    try:
+        await task
+    except Exception as e:
+        logger.warning("Error while closing persistent MCP servers: %s", e)
+
+
+async def close_mcp_servers() -> None:
+    """Shut down MCP servers kept alive by whisper_host(reuse_mcp_servers=True).
+
+    Servers left open at interpreter exit are not leaked: their stdin closes
+    with the parent process and they exit on their own.
+    """
+    loop_id = id(asyncio.get_running_loop())
+    for key in [k for k in _persistent_servers if k[0] == loop_id]:
+        task, _, shutdown = _persistent_servers.pop(key)
+        shutdown.set()
+        await task
+
+
+@lru_cache(maxsize=None)
+def _load_prompts() -> Tuple[str, Callable[..., str], Callable[..., str]]:
+    """Read the instructions and compile the message templates once per process."""
+    return (
+        prompts.load("whisper_host_instructions"),
+        prompts.compile("whisper_host_message"),
+        prompts.compile("whisper_batch_message"),
+    )
+
 
 async def whisper_host(
     input_dir: str = "input",
@@ -22,6 +136,11 @@ async def whisper_host(
     selected_files: Optional[List[str]] = None,
     transcribe_method: str = "local",
     enable_trace: bool = True,
+    max_concurrent: Optional[int] = None,
+    on_srt: Optional[Callable[[str], Awaitable[Any]]] = None,
+    batch_size: Optional[int] = None,
+    skip_existing: bool = True,
+    reuse_mcp_servers: bool = False,
 ) -> List[str]:
     """Transcribe media in a directory via MCP tools, then move files.
 
@@ -32,10 +151,91 @@ async def whisper_host(
         selected_files: List of specific files to process (relative paths)
         transcribe_method: 'local' for faster-whisper or 'openai' for OpenAI API
         enable_trace: Whether to create trace for this agent (set False if parent already has trace)
+        max_concurrent: Maximum number of files transcribed at the same time
+            (default: WHISPER_HOST_MAX_CONCURRENT, or 4)
+        on_srt: Optional coroutine called with each SRT path as soon as that
+            file is done, so later stages can start before the batch finishes
+        batch_size: With local Whisper, group up to this many files of similar
+            duration into one transcribe_media_batch call (1 disables batching;
+            default: WHISPER_HOST_BATCH_SIZE, or 1)
+        skip_existing: Move files that already have an SRT directly instead of
+            running the agent for them
+        reuse_mcp_servers: Keep the MCP server processes running after this call
+            and reuse them in later calls on the same event loop (close them
+            with close_mcp_servers())
 
     Returns a list of generated SRT paths.
     """
-    system_prompt = prompts.load("whisper_host_instructions")
+    system_prompt, render_message, render_batch_message = _load_prompts()
+
+    # Read at call time, after the application has loaded .env
+    if max_concurrent is None:
+        max_concurrent = int(os.getenv("WHISPER_HOST_MAX_CONCURRENT", "4"))
+    if batch_size is None:
+        batch_size = int(os.getenv("WHISPER_HOST_BATCH_SIZE", "1"))
+
+    target = Path(input_dir)
+    if not target.exists() or not target.is_dir():
+        raise ValueError(f"Input must be a directory. Provided: {target}")
+
+    # If a selection is provided, use only those files; otherwise, scan the directory
+    if selected_files:
+        resolved: List[Path] = []
+        target_str = str(target)
+        for f in selected_files:
+            full = f if os.path.isabs(f) else os.path.join(target_str, f)
+            # Extension check first, then a single stat for existence and type
+            is_media = os.path.splitext(full)[1].lower() in MEDIA_EXTENSIONS
+            try:
+                is_regular = is_media and stat.S_ISREG(os.stat(full).st_mode)
+            except OSError:
+                is_regular = False
+            if is_regular:
+                resolved.append(Path(full))
+            else:
+                logger.warning("Skipping invalid or unsupported media: %s", full)
+        media_files = resolved
+    else:
+        # Single os.scandir walk; DirEntry type info avoids a stat per path
+        media_files = [
+            p
+            for p, _ in iter_by_extension(
+                target, {"media": MEDIA_EXTENSIONS},
+                recursive=True, exclude_dirs=DEFAULT_EXCLUDED_DIRS)
+        ]
+    if not media_files:
+        logger.info("No media files found under %s", target)
+        return []
+
+    # Files whose SRT already exists only need moving; handle them here so
+    # they never cost an agent run (or MCP server startup)
+    srt_by_file: Dict[Path, Optional[str]] = {}
+    if skip_existing:
+        pending: List[Path] = []
+        # One listing of the output root; files without an output folder
+        # (the usual case for new media) then need no stat at all
+        output_dirs = _list_subdirs(media_move_root)
+        for mf in media_files:
+            srt_path = _expected_srt(media_move_root, mf)
+            if mf.stem in output_dirs and srt_path.exists():
+                srt_by_file[mf] = str(srt_path)
+            else:
+                pending.append(mf)
+        if srt_by_file:
+            logger.info("Skipping %d already-transcribed files", len(srt_by_file))
+            for mf in sorted(srt_by_file):
+                try:
+                    dest = await asyncio.to_thread(
+                        _move_media, mf, Path(media_move_root) / mf.stem)
+                    logger.info("SKIPPED: %s -> MOVED TO: %s", mf.stem, dest)
+                except OSError as e:
+                    logger.warning("Could not move %s: %s", mf.name, e)
+                if on_srt is not None:
+                    await on_srt(srt_by_file[mf])
+        media_files = pending
+
+    if not media_files:
+        return [srt_by_file[mf] for mf in sorted(srt_by_file)]
 
     # Configure MCP servers based on transcription method
     if transcribe_method == "openai":
@@ -50,16 +250,14 @@ async def whisper_host(
         ]
 
     async with AsyncExitStack() as stack:
-        mcp_servers = [
-            await stack.enter_async_context(
-                MCPServerStdio(
-                    params=param["param"],
-                    client_session_timeout_seconds=param["client_session_timeout_seconds"],
-                )
-            )
-            for param in params
-        ]
+        if reuse_mcp_servers:
+            mcp_servers = await _get_persistent_mcp_servers(transcribe_method, params)
+        else:
+            mcp_servers = await _enter_mcp_servers(stack, params)
 
+        # One agent serves every concurrent run: Agent is plain configuration
+        # and Runner.run keeps all per-run state in its own context, so no
+        # agent pool is needed. The MCP sessions multiplex concurrent calls.
         agent = Agent(
             name="WhisperHostAgent",
             model=model,
@@ -67,39 +265,17 @@ async def whisper_host(
             mcp_servers=mcp_servers,
         )
 
-        target = Path(input_dir)
-        media_exts = {
-            ".mp4",
-            ".avi",
-            ".mkv",
-            ".mov",
-            ".wmv",
-            ".flv",
-            ".webm",  # video
-            ".mp3",
-            ".wav",
-            ".flac",
-            ".aac",
-            ".ogg",
-            ".m4a",
-            ".wma",  # audio
-        }
-
         async def run_for_file(media_file: Path):
             media_path_str = str(media_file)
             base_name = media_file.stem
             # Unified per-media folder under ./output/<basename>
             dest_dir = f"{media_move_root}/{base_name}"
             srt_rel = f"{dest_dir}/{base_name}.srt"
-            print(
-                f"Configurations:\n"
-                f"MEDIA_PATH: {media_path_str}\n"
-                f"SRT_PATH: {srt_rel}\n"
-                f"DEST_DIR: {dest_dir}\n"
-            )
+            logger.debug(
+                "Configurations:\nMEDIA_PATH: %s\nSRT_PATH: %s\nDEST_DIR: %s",
+                media_path_str, srt_rel, dest_dir)
 
-            message = prompts.render(
-                "whisper_host_message",
+            message = render_message(
                 MEDIA_PATH=media_path_str,
                 SRT_PATH=srt_rel,
                 DEST_DIR=dest_dir,
@@ -118,59 +294,182 @@ async def whisper_host(
                 # Run without creating a new trace (parent trace will be used)
                 return await Runner.run(agent, input=message)
 
-        if not target.exists() or not target.is_dir():
-            raise ValueError(f"Input must be a directory. Provided: {target}")
-
-        # If a selection is provided, use only those files; otherwise, scan the directory
-        if selected_files:
-            resolved: List[Path] = []
-            for f in selected_files:
-                p = Path(f)
-                if not p.is_absolute():
-                    p = target / p
-                if p.exists() and p.is_file() and p.suffix.lower() in media_exts:
-                    resolved.append(p)
-                else:
-                    print(f"Skipping invalid or unsupported media: {p}")
-            media_files = resolved
-        else:
-            media_files = [
-                p
-                for p in target.rglob("*")
-                if p.is_file() and p.suffix.lower() in media_exts
+        async def run_for_bucket(media_batch: List[Path]):
+            items = [
+                {
+                    "MEDIA_PATH": str(mf),
+                    "SRT_PATH": f"{media_move_root}/{mf.stem}/{mf.stem}.srt",
+                    "DEST_DIR": f"{media_move_root}/{mf.stem}",
+                    "BASENAME": mf.stem,
+                }
+                for mf in media_batch
             ]
-        if not media_files:
-            print(f"No media files found under {target}")
-            return []
-
-        srt_paths: List[str] = []
-        for idx, mf in enumerate(sorted(media_files), 1):
-            print(f"\n[{idx}/{len(media_files)}] Processing: {mf}")
-            
-            # Check for expected SRT before running (might already exist)
-            srt_path = Path(media_move_root) / mf.stem / f"{mf.stem}.srt"
-            
+            message = render_batch_message(
+                ITEMS_JSON=to_json(items, indent=True),
+            )
+
+            # Only create trace if enable_trace is True
+            if enable_trace:
+                with trace(
+                    workflow_name=f"Whisper Host Agent Runner: batch of {len(media_batch)}",
+                    group_id=media_batch[0].stem
+                ):
+                    return await Runner.run(agent, input=message)
+            else:
+                # Run without creating a new trace (parent trace will be used)
+                return await Runner.run(agent, input=message)
+
+        ordered = sorted(media_files)
+
+        # Files from different subdirectories with the same stem share one
+        # output/<stem>/ folder; their writes and moves would race, so they
+        # are never batched and run one at a time under a per-stem lock
+        stem_counts = Counter(mf.stem for mf in ordered)
+        shared_stems = {stem for stem, count in stem_counts.items() if count > 1}
+        if shared_stems:
+            logger.warning(
+                "Files sharing an output folder are transcribed one at a time: %s",
+                ", ".join(sorted(shared_stems)))
+        stem_locks = {stem: asyncio.Lock() for stem in shared_stems}
+        batchable = [mf for mf in ordered if mf.stem not in shared_stems]
+
+        units: List[List[Path]] = [[mf] for mf in batchable]
+        if batch_size > 1 and transcribe_method != "openai" and len(batchable) > 1:
+            # Only the local Whisper server exposes transcribe_media_batch
             try:
-                result = await run_for_file(mf)
-                print(f"Whisper Host Agent Result for {mf.name}: {result.final_output}")
+                units = await asyncio.to_thread(
+                    _batch_by_duration, batchable, batch_size)
             except Exception as e:
-                error_msg = str(e)
-                # Check if this is the known benign MCP tool error
-                if "Invalid structured content for tool move_file" in error_msg:
-                    logger.debug(f"Ignored benign MCP error for move_file: {error_msg}")
-                    # Assume success if SRT exists (which we check below)
-                elif "move_file" in error_msg and srt_path.exists():
-                    print(f"Warning: MCP tool error occurred but SRT exists, continuing: {error_msg[:100]}")
-                else:
-                    print(f"Error processing {mf.name}: {e}")
-                    # Check if SRT was still created despite the error
-                    if not srt_path.exists():
-                        continue  # Skip this file
-
-            # Check for expected SRT in per-file output folder
-            if srt_path.exists():
+                logger.warning("Could not batch by duration, processing files one by one: %s", e)
+        units += [[mf] for mf in ordered if mf.stem in shared_stems]
+
+        total = len(units)
+        sem = asyncio.Semaphore(max(1, max_concurrent))
+        # Set when a run fails, so reused servers are replaced afterwards
+        run_failed = False
+
+        def _srt_path(mf: Path) -> Path:
+            return _expected_srt(media_move_root, mf)
+
+        async def _process(idx: int, unit: List[Path]) -> List[Optional[str]]:
+            nonlocal run_failed
+            label = ", ".join(mf.name for mf in unit)
+            failed = False
+
+            # Only single-file units can have a shared stem (see above)
+            stem_lock = stem_locks.get(unit[0].stem) if len(unit) == 1 else None
+            async with stem_lock or nullcontext(), sem:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[%d/%d] Processing: %s",
+                                idx, total, ", ".join(str(mf) for mf in unit))
+                try:
+                    if len(unit) == 1:
+                        result = await run_for_file(unit[0])
+                    else:
+                        result = await run_for_bucket(unit)
+                    logger.info("Whisper Host Agent Result for %s: %s", label, result.final_output)
+                except Exception as e:
+                    error_msg = str(e)
+                    # Check if this is the known benign MCP tool error
+                    if "Invalid structured content for tool move_file" in error_msg:
+                        logger.debug("Ignored benign MCP error for move_file: %s", error_msg)
+                        # Assume success if SRT exists (which we check below)
+                    elif "move_file" in error_msg and any(_srt_path(mf).exists() for mf in unit):
+                        logger.warning("MCP tool error occurred but SRT exists, continuing: %.100s", error_msg)
+                    else:
+                        logger.error("Error processing %s: %s", label, e)
+                        # SRTs created despite the error are still picked up below
+                        failed = True
+                        run_failed = True
+
+            srt_paths: List[Optional[str]] = []
+            for mf in unit:
+                srt_path = _srt_path(mf)
+                if not srt_path.exists():
+                    if not failed:
+                        logger.warning("Expected SRT not found: %s", srt_path)
+                    srt_paths.append(None)
+                    continue
+                if on_srt is not None:
+                    await on_srt(str(srt_path))
                 srt_paths.append(str(srt_path))
-            else:
-                print(f"Warning: Expected SRT not found: {srt_path}")
+            return srt_paths
+
+        # Each unit is an independent MCP round-trip, so run them concurrently
+        results = await asyncio.gather(
+            *(_process(idx, unit) for idx, unit in enumerate(units, 1))
+        )
+        if reuse_mcp_servers and run_failed:
+            # Once every run is done, so no in-flight call loses its session
+            await _discard_persistent_mcp_servers(transcribe_method, mcp_servers)
+        for unit, srts in zip(units, results):
+            srt_by_file.update(zip(unit, srts))
+        return [
+            srt_by_file[mf]
+            for mf in sorted(srt_by_file)
+            if srt_by_file[mf] is not None
+        ]
+
+
+async def whisper_host_stream(**kwargs: Any) -> AsyncIterator[str]:
+    """Run whisper_host and yield each SRT path as soon as its file is done.
+
+    Takes the same keyword arguments as whisper_host (except on_srt), so a
+    consumer such as research_host can start on the first transcript while
+    the rest of the batch is still being transcribed.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def _run() -> None:
+        try:
+            await whisper_host(**kwargs, on_srt=queue.put)
+        finally:
+            await queue.put(None)
+
+    task = asyncio.create_task(_run())
+    try:
+        while (srt := await queue.get()) is not None:
+            yield srt
+        # Surface errors from whisper_host once the stream is drained
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def _expected_srt(media_move_root: str, media_file: Path) -> Path:
+    """Expected SRT in the per-file output folder."""
+    return Path(media_move_root) / media_file.stem / f"{media_file.stem}.srt"
+
+
+def _list_subdirs(directory: str) -> Set[str]:
+    """Names of the subdirectories of directory (empty if it is missing)."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return set()
+
+
+def _move_media(media_file: Path, dest_dir: Path) -> Path:
+    """Move media into dest_dir, adding a _N suffix on name collisions."""
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    if media_file.parent.resolve() == dest_dir.resolve():
+        return media_file
+    dest = dest_dir / media_file.name
+    counter = 1
+    while dest.exists():
+        dest = dest_dir / f"{media_file.stem}_{counter}{media_file.suffix}"
+        counter += 1
+    shutil.move(str(media_file), str(dest))
+    return dest
+
 
-        return srt_paths
+def _batch_by_duration(media_files: List[Path], batch_size: int) -> List[List[Path]]:
+    """Group files of similar duration into batches of at most batch_size."""
+    buckets = get_default_converter().bucket_by_duration(media_files)
+    batches: List[List[Path]] = []
+    for bucket in buckets:
+        for i in range(0, len(bucket), batch_size):
+            batches.append([Path(p) for p in bucket[i:i + batch_size]])
+    return batches
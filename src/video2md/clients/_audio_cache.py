@@ -0,0 +1,88 @@
+"""
+In-process cache of decoded 16 kHz audio for the local Whisper client
+
+Retrying a file or transcribing it again with another language or task
+reuses the samples instead of running the ffmpeg/PyAV decode again.
+"""
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# (path, mtime_ns, size) -> samples, least recently used first
+_CACHE: "OrderedDict[Tuple[str, int, int], np.ndarray]" = OrderedDict()
+_CACHE_BYTES = 0
+_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _max_bytes() -> int:
+    """
+    Upper bound on cached samples from WHISPER_AUDIO_CACHE_MB
+
+    Read on first use rather than at import, so a value loaded from .env
+    after this module is imported still applies. One hour of 16 kHz float32
+    audio is ~230 MB. Off by default: identical re-runs are served by the
+    transcript cache, so this only pays off when a file is transcribed again
+    with other options.
+    """
+    return int(float(os.getenv("WHISPER_AUDIO_CACHE_MB", "0")) * 1024 * 1024)
+
+
+def load_audio(path: Union[str, Path], decode: Callable[[], "np.ndarray"]) -> "np.ndarray":
+    """
+    Return decoded samples for path, calling decode() only on a cache miss
+
+    Entries are keyed by the file's path, mtime and size, so edited files are
+    decoded again. Arrays larger than the cache budget, and every array while
+    WHISPER_AUDIO_CACHE_MB is 0, are returned uncached.
+
+    Args:
+        path: Media file the samples come from
+        decode: Decodes the file to 16 kHz mono float32 samples
+
+    Returns:
+        float32 sample array, read-only if it was cached
+    """
+    global _CACHE_BYTES
+
+    max_bytes = _max_bytes()
+    if max_bytes <= 0:
+        return decode()
+
+    st = os.stat(path)
+    key = (os.fspath(path), st.st_mtime_ns, st.st_size)
+    with _LOCK:
+        audio = _CACHE.get(key)
+        if audio is not None:
+            _CACHE.move_to_end(key)
+            return audio
+
+    audio = decode()
+    if audio.nbytes > max_bytes:
+        return audio
+    # Shared between callers, so make sure nobody modifies it in place
+    audio.setflags(write=False)
+
+    with _LOCK:
+        if key not in _CACHE:
+            _CACHE[key] = audio
+            _CACHE_BYTES += audio.nbytes
+            while _CACHE_BYTES > max_bytes:
+                _, evicted = _CACHE.popitem(last=False)
+                _CACHE_BYTES -= evicted.nbytes
+    return audio
+
+
+def clear_audio_cache() -> None:
+    """Drop all cached samples"""
+    global _CACHE_BYTES
+    with _LOCK:
+        _CACHE.clear()
+        _CACHE_BYTES = 0
@@ -0,0 +1,177 @@
+"""
+Persistent transcript cache shared by the transcription clients
+
+Results are stored in a SQLite file keyed by a hash of the media content plus
+the model and options that affect the output, so re-running the pipeline on
+the same files skips inference entirely.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+import logging
+
+from video2md.models.transcription_models import TranscriptResult
+from video2md.utils.transcript_converter import transcript_from_json, transcript_to_json
+
+logger = logging.getLogger(__name__)
+
+# Read size for hashing media files
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Larger files are identified by their size plus the first and last window,
+# so a cache lookup reads at most 2 * _HASH_WINDOW bytes however long the
+# recording is; V2M_CACHE_FULL_HASH=true hashes whole files instead
+_HASH_WINDOW = 4 * 1024 * 1024
+
+# Content digests keyed by (path, mtime_ns, size, full hash), so a file is
+# hashed once per process even when it is looked up and then stored
+_DIGEST_CACHE: Dict[Tuple[str, int, int, bool], str] = {}
+_DIGEST_LOCK = threading.Lock()
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    Hash a file's content with BLAKE2b (128-bit hex digest)
+
+    Files over 2 * _HASH_WINDOW are sampled (size, head and tail) unless
+    V2M_CACHE_FULL_HASH is set; smaller files are always hashed whole.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest of the file content
+    """
+    # Read per call, not at import, so a value loaded from .env applies
+    full_hash = os.getenv("V2M_CACHE_FULL_HASH", "false").lower() in ("1", "true", "yes", "on")
+    st = os.stat(path)
+    stat_key = (os.fspath(path), st.st_mtime_ns, st.st_size, full_hash)
+    with _DIGEST_LOCK:
+        digest = _DIGEST_CACHE.get(stat_key)
+    if digest is not None:
+        return digest
+
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        if full_hash or st.st_size <= 2 * _HASH_WINDOW:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        else:
+            # Distinct prefix keeps sampled digests apart from full ones
+            hasher.update(b"sampled:%d:" % st.st_size)
+            hasher.update(f.read(_HASH_WINDOW))
+            f.seek(-_HASH_WINDOW, os.SEEK_END)
+            hasher.update(f.read(_HASH_WINDOW))
+    digest = hasher.hexdigest()
+
+    with _DIGEST_LOCK:
+        _DIGEST_CACHE[stat_key] = digest
+    return digest
+
+
+def make_key(path: Union[str, Path], *options: object) -> str:
+    """
+    Build a cache key from a media file's content and the transcription options
+
+    Args:
+        path: Media file that is transcribed
+        *options: Model name and every option that changes the output
+
+    Returns:
+        Cache key string
+    """
+    return "|".join([file_digest(path)] + ["" if o is None else str(o) for o in options])
+
+
+class TranscriptCache:
+    """
+    SQLite-backed key -> TranscriptResult store
+
+    Safe to share between threads; several processes (e.g. the MCP servers)
+    can use the same file since SQLite serializes their writes.
+    """
+
+    def __init__(self, directory: Union[str, Path], ttl: Optional[float] = None):
+        """
+        Open (or create) the cache database
+
+        Args:
+            directory: Directory holding transcripts.sqlite3
+            ttl: Seconds an entry stays valid (None or 0 = forever)
+        """
+        self.ttl = ttl or None
+        directory = Path(directory).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(directory / "transcripts.sqlite3"),
+            timeout=30,
+            check_same_thread=False,
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS transcripts ("
+                "key TEXT PRIMARY KEY, created REAL NOT NULL, data TEXT NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[TranscriptResult]:
+        """Return the cached result for key, or None if missing or expired"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT created, data FROM transcripts WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Transcript cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        created, data = row
+        if self.ttl is not None and time.time() - created > self.ttl:
+            return None
+        return transcript_from_json(data)
+
+    def set(self, key: str, result: TranscriptResult) -> None:
+        """Store result under key, replacing any previous entry"""
+        data = transcript_to_json(result, pretty=False)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO transcripts (key, created, data) VALUES (?, ?, ?)",
+                    (key, time.time(), data),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            # A failed write only costs a future cache miss
+            logger.warning(f"Transcript cache write failed: {e}")
+
+
+@lru_cache(maxsize=1)
+def get_default_cache() -> Optional[TranscriptCache]:
+    """
+    Return the process-wide cache configured from the environment
+
+    V2M_CACHE_ENABLED=false turns caching off, V2M_CACHE_DIR sets the
+    location (default ~/.cache/video2md) and V2M_CACHE_TTL the lifetime
+    in seconds (default 0 = no expiry).
+
+    Returns:
+        Shared TranscriptCache, or None if disabled or it cannot be opened
+    """
+    if os.getenv("V2M_CACHE_ENABLED", "true").lower() in ("0", "false", "no", "off"):
+        return None
+    try:
+        return TranscriptCache(
+            os.getenv("V2M_CACHE_DIR", "~/.cache/video2md"),
+            ttl=float(os.getenv("V2M_CACHE_TTL", "0")),
+        )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Transcript cache unavailable, continuing without it: {e}")
+        return None
@@ -2,22 +2,98 @@
 OpenAI Transcription Client using whisper-1 model
 Provides similar interface to WhisperClient for compatibility
 """
+import asyncio
+import importlib.util
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import logging
 
 from dotenv import load_dotenv
+import httpx
 import openai
 
+from video2md.clients._transcript_cache import get_default_cache, make_key
 from video2md.models.transcription_models import TranscriptSegment, TranscriptResult
+from video2md.utils.text_io import write_text_file
+from video2md.utils.transcript_converter import transcript_to_json, write_batch_outputs
+from video2md.utils.video_converter import VideoConverter, get_default_converter
 
 # Load environment variables
 load_dotenv(override=True)
 
 # Set up logging
-logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
+# Library module: leave handler/level configuration to the application
+logger.addHandler(logging.NullHandler())
+
+# Sync OpenAI clients shared per API key so every OpenAITranscribeClient
+# reuses one httpx connection pool instead of opening new connections
+_CLIENT_CACHE: Dict[Optional[str], "openai.OpenAI"] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# Retries per request; the SDK backs off and honors Retry-After on 429
+MAX_RETRIES = 5
+
+# One keep-alive pool per client, large enough for parallel chunk and batch
+# uploads to reuse connections instead of paying a TLS handshake per file.
+# HTTP/2 multiplexes them over one connection when h2 is installed.
+_HTTP_OPTIONS = dict(
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=httpx.Timeout(600.0, connect=10.0),
+)
+
+# Longest chunk (seconds) a long file is split into for parallel requests
+CHUNK_SECONDS = 300
+
+# Files above this are split and re-encoded instead of uploaded as-is
+# (the API rejects uploads over 25 MB)
+MAX_UPLOAD_BYTES = 24 * 1024 * 1024
+
+# Read buffer for uploads; the SDK streams the file in multipart chunks
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Content types sent with uploaded files
+_AUDIO_MIME_TYPES = {
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.m4a': 'audio/mp4',
+    '.flac': 'audio/flac',
+    '.ogg': 'audio/ogg',
+    '.aac': 'audio/aac',
+    '.wma': 'audio/x-ms-wma',
+}
+
+
+def _split_on_silence(duration: float,
+                      silences: List[Tuple[float, float]],
+                      max_len_s: float = CHUNK_SECONDS) -> List[Tuple[float, float]]:
+    """
+    Plan (start, end) chunks of at most max_len_s seconds covering the media
+
+    Each cut is placed in the middle of the last silence in the second half
+    of the chunk, so words are not split; without one the chunk is cut at
+    max_len_s.
+    """
+    spans = []
+    pos = 0.0
+    while duration - pos > max_len_s:
+        limit = pos + max_len_s
+        cut = limit
+        for start, end in silences:
+            mid = (start + end) / 2
+            if mid > limit:
+                break
+            if mid > pos + max_len_s / 2:
+                cut = mid
+        spans.append((pos, cut))
+        pos = cut
+    spans.append((pos, duration))
+    return spans
 
 
 class OpenAITranscribeClient:
@@ -34,6 +110,8 @@ class OpenAITranscribeClient:
         self,
         model: str = "whisper-1",
         api_key: Optional[str] = None,
+        parallel_chunks: Optional[int] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize OpenAI transcription client
@@ -41,15 +119,80 @@ class OpenAITranscribeClient:
         Args:
             model: OpenAI model to use (default: whisper-1)
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            parallel_chunks: Requests in flight when a file longer than
+                CHUNK_SECONDS is split at silences (defaults to
+                OPENAI_TRANSCRIBE_PARALLEL_CHUNKS env var, else 1 = no splitting)
+            use_cache: Reuse results stored in the persistent transcript cache
+                for unchanged files (see V2M_CACHE_* variables)
         """
         self.model = model
-        self.client = openai.OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+        self.client = self._get_client(api_key or os.getenv("OPENAI_API_KEY"))
+        self.parallel_chunks = max(1, parallel_chunks or int(
+            os.getenv("OPENAI_TRANSCRIBE_PARALLEL_CHUNKS", "1")))
+        self.cache = get_default_cache() if use_cache else None
+        # Request fields shared by every upload; per-call ones are overlaid
+        self._base_params = MappingProxyType({
+            "model": self.model,
+            "response_format": "verbose_json",  # Get timestamps
+            "timestamp_granularities": ["segment"],
+        })
         
         logger.info(f"Initialized OpenAI transcription client with model: {self.model}")
     
+    @staticmethod
+    def _get_client(api_key: Optional[str]) -> "openai.OpenAI":
+        """Return the shared OpenAI client for api_key, creating it once"""
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(api_key)
+            if client is None:
+                client = openai.OpenAI(
+                    api_key=api_key,
+                    max_retries=MAX_RETRIES,
+                    http_client=httpx.Client(**_HTTP_OPTIONS),
+                )
+                _CLIENT_CACHE[api_key] = client
+            return client
+
+    @staticmethod
+    def clear_client_cache() -> None:
+        """Forget shared OpenAI clients (existing instances keep theirs)"""
+        with _CLIENT_LOCK:
+            _CLIENT_CACHE.clear()
+
+    def _cache_key(self, media_path: Path, language: Optional[str],
+                   prompt: Optional[str]) -> Optional[str]:
+        """
+        Build the transcript cache key, or None if caching is off or the file is unreadable
+
+        Every entry point (transcribe, transcribe_with_video, atranscribe_many)
+        goes through here, so the same file and settings always map to one key.
+        """
+        if self.cache is None:
+            return None
+        chunked = self.parallel_chunks > 1
+        try:
+            return make_key(media_path, "openai", self.model, language, prompt, chunked)
+        except OSError:
+            return None
+
+    def _cached_transcription(self, media_path: Path, language: Optional[str],
+                              prompt: Optional[str],
+                              run: Callable[[], TranscriptResult]) -> TranscriptResult:
+        """Return the cached result for media_path, or call run() and cache its result"""
+        key = self._cache_key(media_path, language, prompt)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info(f"Using cached transcript for: {media_path.name}")
+                return cached
+        result = run()
+        if key is not None:
+            self.cache.set(key, result)
+        return result
+
     def transcribe(
         self,
-        audio_file_path: str,
+        audio_file_path: Union[str, os.PathLike],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
     ) -> TranscriptResult:
@@ -68,75 +211,357 @@ class OpenAITranscribeClient:
             FileNotFoundError: If audio file doesn't exist
             Exception: If transcription fails
         """
+        # One Path object, reused for the name/suffix/size lookups of the upload
         audio_path = Path(audio_file_path)
-        if not audio_path.exists():
+        if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
         
+        return self._cached_transcription(
+            audio_path, language, prompt,
+            lambda: self._transcribe_audio(audio_path, language, prompt))
+
+    def _transcribe_audio(
+        self,
+        audio_path: Path,
+        language: Optional[str],
+        prompt: Optional[str],
+    ) -> TranscriptResult:
+        """Upload an audio file (split into chunks if configured) and parse the response"""
         logger.info(f"Transcribing with OpenAI: {audio_path.name}")
         logger.info(f"Language: {language or 'auto-detect'}")
         
+        too_large = audio_path.stat().st_size > MAX_UPLOAD_BYTES
+        chunked = self._transcribe_chunked(audio_path, language, prompt, force=too_large)
+        if chunked is not None:
+            return chunked
+        
         try:
-            with open(audio_path, "rb") as f:
-                transcribe_params = {
-                    "model": self.model,
-                    "file": f,
-                    "response_format": "verbose_json",  # Get timestamps
-                    "timestamp_granularities": ["segment"],
-                }
-                
-                if language:
-                    transcribe_params["language"] = language
-                
-                if prompt:
-                    transcribe_params["prompt"] = prompt
-                
+            with open(audio_path, "rb", buffering=UPLOAD_BUFFER_SIZE) as f:
+                transcribe_params = self._build_params(
+                    self._upload_file(audio_path, f), language, prompt)
                 response = self.client.audio.transcriptions.create(**transcribe_params)
             
-            # Process response
-            segments = []
-            for seg in getattr(response, 'segments', []):
-                # OpenAI returns TranscriptionSegment objects with attributes, not dicts
-                segments.append(TranscriptSegment(
-                    start=seg.start,
-                    end=seg.end,
-                    text=seg.text.strip()
-                ))
+            result = self._build_result(response, language)
             
-            # If no segments, create one from full text
-            if not segments and hasattr(response, 'text'):
-                segments.append(TranscriptSegment(
-                    start=0.0,
-                    end=0.0,
-                    text=response.text.strip()
-                ))
-            
-            full_text = response.text if hasattr(response, 'text') else " ".join(s.text for s in segments)
-            detected_language = getattr(response, 'language', language or 'unknown')
-            
-            result = TranscriptResult(
-                language=detected_language,
-                full_text=full_text.strip(),
-                segments=segments,
-                raw={
-                    "language": detected_language,
-                    "duration": getattr(response, 'duration', 0.0),
-                    "provider": "openai",
-                    "model": self.model,
-                }
-            )
-            
-            logger.info(f"Transcription completed: {len(segments)} segments")
-            logger.info(f"Detected language: {detected_language}")
+            logger.info(
+                f"Transcription completed: {len(result.segments)} segments, "
+                f"language {result.language}")
             
             return result
             
         except Exception as e:
             logger.error(f"OpenAI transcription failed: {e}")
             raise
+
+    @staticmethod
+    def _extract_upload_audio(converter: VideoConverter, video_path: Path) -> Tuple[str, bytes]:
+        """
+        Get a video's audio as an in-memory (filename, bytes) upload
+
+        MP3/Opus/Vorbis/FLAC tracks are stream-copied, which skips the encoder
+        entirely; anything else (or a copy too large to upload) is re-encoded
+        to 16 kHz mono MP3. The MP3 can still exceed MAX_UPLOAD_BYTES for long
+        videos, so callers must check the size before uploading.
+        """
+        copied = converter.copy_audio_bytes(video_path)
+        if copied is not None and len(copied[0]) <= MAX_UPLOAD_BYTES:
+            data, extension = copied
+            return f"{video_path.stem}.{extension}", data
+        data = converter.video_to_audio_bytes(
+            input_path=video_path,
+            audio_format='mp3',  # OpenAI accepts mp3
+            sample_rate=16000,
+            channels=1
+        )
+        return f"{video_path.stem}.mp3", data
+
+    @staticmethod
+    def _upload_file(audio_path: Path, f) -> Tuple[str, object, str]:
+        """Wrap an open audio file as a (name, file, content type) upload tuple"""
+        mime_type = _AUDIO_MIME_TYPES.get(audio_path.suffix.lower(), 'application/octet-stream')
+        return (audio_path.name, f, mime_type)
+
+    def _build_params(self, file, language: Optional[str], prompt: Optional[str]) -> dict:
+        """Build keyword arguments for audio.transcriptions.create"""
+        transcribe_params = {**self._base_params, "file": file}
+
+        if language:
+            transcribe_params["language"] = language
+
+        if prompt:
+            transcribe_params["prompt"] = prompt
+
+        return transcribe_params
+
+    def _build_result(self, response, language: Optional[str]) -> TranscriptResult:
+        """Convert an OpenAI verbose_json response into a TranscriptResult"""
+        segments = []
+        for seg in getattr(response, 'segments', None) or []:
+            # OpenAI returns TranscriptionSegment objects with attributes, not dicts
+            segments.append(TranscriptSegment(
+                start=seg.start,
+                end=seg.end,
+                text=seg.text.strip()
+            ))
+
+        # If no segments, create one from full text
+        if not segments and hasattr(response, 'text'):
+            segments.append(TranscriptSegment(
+                start=0.0,
+                end=0.0,
+                text=response.text.strip()
+            ))
+
+        full_text = response.text if hasattr(response, 'text') else " ".join(s.text for s in segments)
+        detected_language = getattr(response, 'language', language or 'unknown')
+
+        return TranscriptResult(
+            language=detected_language,
+            full_text=full_text.strip(),
+            segments=segments,
+            raw={
+                "language": detected_language,
+                "duration": getattr(response, 'duration', 0.0),
+                "provider": "openai",
+                "model": self.model,
+            }
+        )
+
+    def _transcribe_chunked(
+        self,
+        media_path: Path,
+        language: Optional[str],
+        prompt: Optional[str],
+        converter: Optional[VideoConverter] = None,
+        force: bool = False,
+    ) -> Optional[TranscriptResult]:
+        """
+        Transcribe a long file as silence-aligned chunks sent in parallel
+
+        Returns None when chunking is disabled or the file is short enough
+        for a single request, so the caller falls back to that. With force
+        (file too large to upload) even a short file is re-encoded as chunks.
+        """
+        if self.parallel_chunks <= 1 and not force:
+            return None
+        converter = converter or get_default_converter()
+        duration = converter.probe_duration(media_path)
+        if duration is None or (duration <= CHUNK_SECONDS and not force):
+            return None
+
+        spans = _split_on_silence(duration, converter.detect_silences(media_path))
+        logger.info(
+            f"Splitting {media_path.name} ({duration:.0f}s) into {len(spans)} chunks")
+
+        def transcribe_span(idx: int, span: Tuple[float, float]) -> TranscriptResult:
+            start, end = span
+            audio_bytes = converter.video_to_audio_bytes(
+                media_path,
+                audio_format='mp3',  # OpenAI accepts mp3
+                sample_rate=16000,
+                channels=1,
+                start=start,
+                duration=end - start,
+            )
+            transcribe_params = self._build_params(
+                (f"{media_path.stem}_{idx}.mp3", audio_bytes), language, prompt)
+            response = self.client.audio.transcriptions.create(**transcribe_params)
+            return self._build_result(response, language)
+
+        # The sync client is thread-safe and keeps one connection pool, so
+        # chunks are uploaded from worker threads rather than a new event loop
+        with ThreadPoolExecutor(
+                max_workers=min(self.parallel_chunks, len(spans)),
+                thread_name_prefix="openai-chunk") as executor:
+            chunk_results = list(executor.map(transcribe_span, range(len(spans)), spans))
+
+        # Shift every chunk's timestamps by where the chunk starts in the file
+        segments = [
+            TranscriptSegment(start=seg.start + start, end=seg.end + start, text=seg.text)
+            for (start, _), chunk in zip(spans, chunk_results)
+            for seg in chunk.segments
+            if seg.text
+        ]
+        detected_language = chunk_results[0].language
+        result = TranscriptResult(
+            language=detected_language,
+            full_text=" ".join(c.full_text for c in chunk_results if c.full_text),
+            segments=segments,
+            raw={
+                "language": detected_language,
+                "duration": duration,
+                "provider": "openai",
+                "model": self.model,
+                "chunks": len(spans),
+            }
+        )
+        logger.info(f"Transcription completed: {len(segments)} segments")
+        return result
+
+    async def _atranscribe(
+        self,
+        async_client: "openai.AsyncOpenAI",
+        audio: Union[str, Tuple[str, bytes]],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+    ) -> TranscriptResult:
+        """Transcribe one audio file path or in-memory (filename, bytes) with the async OpenAI client"""
+        if isinstance(audio, tuple):
+            logger.info(f"Transcribing with OpenAI: {audio[0]}")
+            transcribe_params = self._build_params(audio, language, prompt)
+            response = await async_client.audio.transcriptions.create(**transcribe_params)
+            return self._build_result(response, language)
+
+        audio_path = Path(audio)
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio}")
+
+        logger.info(f"Transcribing with OpenAI: {audio_path.name}")
+
+        if audio_path.stat().st_size > MAX_UPLOAD_BYTES:
+            # Too large for one upload; split and re-encode like transcribe()
+            chunked = await asyncio.to_thread(
+                self._transcribe_chunked, audio_path, language, prompt, None, True)
+            if chunked is not None:
+                return chunked
+
+        with open(audio_path, "rb", buffering=UPLOAD_BUFFER_SIZE) as f:
+            transcribe_params = self._build_params(
+                self._upload_file(audio_path, f), language, prompt)
+            response = await async_client.audio.transcriptions.create(**transcribe_params)
+
+        return self._build_result(response, language)
+
+    async def atranscribe_many(
+        self,
+        media_file_paths: List[str],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        concurrency: int = 4,
+    ) -> Dict[str, object]:
+        """
+        Transcribe multiple audio/video files with concurrent API requests
+        
+        Requests are network-bound, so up to `concurrency` uploads run at once on
+        a single event loop. Audio extraction for videos runs in worker threads
+        and is pipelined with the uploads: the next files are extracted while
+        earlier ones are still being transcribed.
+        Rate-limited (429) requests are retried after the server's Retry-After.
+        Long files are split into chunks exactly as in transcribe(): always
+        when the upload would exceed MAX_UPLOAD_BYTES, otherwise when
+        parallel_chunks is above 1.
+        
+        Args:
+            media_file_paths: Paths to audio or video files
+            language: Language code (e.g., 'zh', 'en'). None for auto-detection
+            prompt: Optional prompt to guide transcription
+            concurrency: Maximum number of in-flight requests
+        
+        Returns:
+            Dict with 'results' (media path -> TranscriptResult) and 'failed'
+            (list of (media path, error message) tuples)
+        """
+        converter = get_default_converter()
+        concurrency = max(1, concurrency)
+        # Three bounds: requests in flight, ffmpeg extractions (CPU-bound) and
+        # files admitted at all. The last lets a couple of files be prepared
+        # while every upload slot is busy, without extracting the whole batch
+        # into memory ahead of the uploads.
+        semaphore = asyncio.Semaphore(concurrency)
+        extract_semaphore = asyncio.Semaphore(max(1, (os.cpu_count() or 2) // 2))
+        admitted = asyncio.Semaphore(concurrency + 2)
+        results: Dict[str, TranscriptResult] = {}
+        failed: List[tuple] = []
+
+        async with openai.AsyncOpenAI(
+                api_key=self.client.api_key,
+                max_retries=MAX_RETRIES,
+                http_client=httpx.AsyncClient(**_HTTP_OPTIONS)) as async_client:
+
+            async def transcribe_chunked(media_path: Path, force: bool) -> Optional[TranscriptResult]:
+                if not force and self.parallel_chunks <= 1:
+                    return None
+                # Chunks are uploaded from _transcribe_chunked's own threads;
+                # hold an upload slot so the batch stays within concurrency
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        self._transcribe_chunked, media_path, language, prompt, converter, force)
+
+            async def transcribe_one(media_file: str):
+                media_path = Path(media_file)
+                async with admitted:
+                    try:
+                        async with extract_semaphore:
+                            # Hash in a worker thread; large videos take a while to read
+                            key = await asyncio.to_thread(
+                                self._cache_key, media_path, language, prompt)
+                            if key is not None:
+                                cached = await asyncio.to_thread(self.cache.get, key)
+                                if cached is not None:
+                                    logger.info(f"Using cached transcript for: {media_path.name}")
+                                    results[media_file] = cached
+                                    return
+
+                            kind = converter.media_kind(media_path)
+                            if kind not in ('video', 'audio'):
+                                raise ValueError(f"Unsupported file format: {media_path.suffix}")
+                            if not media_path.exists():
+                                raise FileNotFoundError(f"Media file not found: {media_file}")
+
+                        # Same routing as transcribe()/transcribe_with_video():
+                        # split long files when parallel_chunks is set, and
+                        # always split audio that is too large to upload
+                        force = kind == 'audio' and media_path.stat().st_size > MAX_UPLOAD_BYTES
+                        result = await transcribe_chunked(media_path, force)
+
+                        if result is None:
+                            if kind == 'video':
+                                async with extract_semaphore:
+                                    # Extracted in memory; uploaded without a temp file
+                                    audio = await asyncio.to_thread(
+                                        self._extract_upload_audio, converter, media_path)
+                                if len(audio[1]) > MAX_UPLOAD_BYTES:
+                                    result = await transcribe_chunked(media_path, True)
+                            else:
+                                audio = str(media_path)
+
+                        if result is None:
+                            async with semaphore:
+                                result = await self._atranscribe(
+                                    async_client, audio, language=language, prompt=prompt)
+                        if key is not None:
+                            await asyncio.to_thread(self.cache.set, key, result)
+                        results[media_file] = result
+                    except Exception as e:
+                        logger.error(f"Failed to transcribe {media_file}: {e}")
+                        failed.append((media_file, str(e)))
+
+            await asyncio.gather(*(transcribe_one(mf) for mf in media_file_paths))
+
+        return {"results": results, "failed": failed}
+
+    def transcribe_many(
+        self,
+        media_file_paths: List[str],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        concurrency: int = 4,
+    ) -> Dict[str, object]:
+        """
+        Synchronous wrapper around atranscribe_many
+        
+        Must not be called from a running event loop; await atranscribe_many there.
+        """
+        return asyncio.run(self.atranscribe_many(
+            media_file_paths,
+            language=language,
+            prompt=prompt,
+            concurrency=concurrency,
+        ))
     
     def transcribe_with_video(
         self,
-        video_file_path: str,
+        video_file_path: Union[str, os.PathLike],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
     ) -> TranscriptResult:
@@ -151,66 +576,97 @@ class OpenAITranscribeClient:
         Returns:
             TranscriptResult with language, full text, and segments
         """
-        from video2md.utils.video_converter import VideoConverter
-        import tempfile
-        
         video_path = Path(video_file_path)
-        if not video_path.exists():
+        if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_file_path}")
         
-        converter = VideoConverter()
+        converter = get_default_converter()
         
         # Check if it's a video file
-        if not converter.is_video_file(video_path):
+        kind = converter.media_kind(video_path)
+        if kind != 'video':
             # If it's already an audio file, just transcribe directly
-            if converter.is_audio_file(video_path):
+            if kind == 'audio':
                 logger.info("File is already audio, transcribing directly")
                 return self.transcribe(
-                    audio_file_path=str(video_path),
+                    audio_file_path=video_path,
                     language=language,
                     prompt=prompt,
                 )
             else:
                 raise ValueError(f"Unsupported file format: {video_path.suffix}")
         
-        logger.info(f"Extracting audio from video: {video_path.name}")
+        def run() -> TranscriptResult:
+            chunked = self._transcribe_chunked(video_path, language, prompt, converter)
+            if chunked is not None:
+                return chunked
         
-        # Convert video to audio
-        temp_dir = tempfile.gettempdir()
-        audio_file = converter.video_to_audio(
-            input_path=video_path,
-            output_dir=temp_dir,
-            audio_format='mp3',  # OpenAI accepts mp3
-            sample_rate=16000,
-            channels=1
-        )
+            logger.info(f"Extracting audio from video: {video_path.name}")
+        
+            # Extract in memory and upload the bytes directly, so no
+            # temporary audio file is written and read back
+            upload = self._extract_upload_audio(converter, video_path)
+            if len(upload[1]) > MAX_UPLOAD_BYTES:
+                # Even the re-encoded MP3 is over the API limit (long video)
+                chunked = self._transcribe_chunked(
+                    video_path, language, prompt, converter, force=True)
+                if chunked is not None:
+                    return chunked
         
-        try:
-            # Transcribe the extracted audio
-            result = self.transcribe(
-                audio_file_path=audio_file,
-                language=language,
-                prompt=prompt,
-            )
-            return result
-            
-        finally:
-            # Clean up temporary audio file
             try:
-                os.unlink(audio_file)
-                logger.info(f"Cleaned up temporary audio file")
+                transcribe_params = self._build_params(upload, language, prompt)
+                response = self.client.audio.transcriptions.create(**transcribe_params)
+                result = self._build_result(response, language)
+            
+                logger.info(
+                    f"Transcription completed: {len(result.segments)} segments, "
+                    f"language {result.language}")
+            
+                return result
+            
             except Exception as e:
-                logger.warning(f"Failed to clean up temporary file: {e}")
+                logger.error(f"OpenAI transcription failed: {e}")
+                raise
+        
+        # Cached by the video's content, so a hit also skips audio extraction
+        return self._cached_transcription(video_path, language, prompt, run)
 
 
 def main():
     """Command-line interface for OpenAI transcription client"""
     import argparse
+
+    logging.basicConfig(level=logging.WARNING)
     
     parser = argparse.ArgumentParser(
         description="OpenAI transcription client using whisper-1 model"
     )
-    parser.add_argument("input_file", type=str, help="Audio or video file to transcribe")
+    parser.add_argument("input_file", type=str, nargs="?", help="Audio or video file to transcribe")
+    parser.add_argument(
+        "--batch",
+        type=str,
+        nargs="+",
+        metavar="FILE",
+        default=None,
+        help="Transcribe several audio/video files concurrently"
+    )
+    parser.add_argument(
+        "--parallel-chunks",
+        type=int,
+        default=None,
+        help=f"Split files longer than {CHUNK_SECONDS}s at silences and send this many chunks at once"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the persistent transcript cache"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum in-flight requests with --batch (default: 4)"
+    )
     parser.add_argument(
         "--language",
         type=str,
@@ -227,7 +683,7 @@ def main():
         "--output",
         type=str,
         default=None,
-        help="Output file path (optional)"
+        help="Output file path (optional; output directory with --batch)"
     )
     parser.add_argument(
         "--format",
@@ -238,9 +694,24 @@ def main():
     )
     
     args = parser.parse_args()
+    if not args.input_file and not args.batch:
+        parser.error("an input file or --batch is required")
     
     # Initialize client
-    client = OpenAITranscribeClient()
+    client = OpenAITranscribeClient(
+        parallel_chunks=args.parallel_chunks,
+        use_cache=not args.no_cache,
+    )
+    
+    if args.batch:
+        outcome = client.transcribe_many(
+            args.batch,
+            language=args.language,
+            prompt=args.prompt,
+            concurrency=args.concurrency,
+        )
+        write_batch_outputs(outcome, args.format, args.output)
+        return 1 if outcome["failed"] else 0
     
     # Transcribe
     input_path = Path(args.input_file)
@@ -249,34 +720,31 @@ def main():
         return 1
     
     # Check if it's video or audio
-    from video2md.utils.video_converter import VideoConverter
     converter = VideoConverter()
     
     if converter.is_video_file(input_path):
         result = client.transcribe_with_video(
-            video_file_path=str(input_path),
+            video_file_path=input_path,
             language=args.language,
             prompt=args.prompt,
         )
     else:
         result = client.transcribe(
-            audio_file_path=str(input_path),
+            audio_file_path=input_path,
             language=args.language,
             prompt=args.prompt,
         )
     
     # Output results
     if args.format == "json":
-        import json
-        from dataclasses import asdict
-        output = json.dumps(asdict(result), ensure_ascii=False, indent=2)
+        output = transcript_to_json(result)
     else:
         output = result.full_text
     
     if args.output:
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(output, encoding="utf-8")
+        write_text_file(output_path, output)
         print(f"Results saved to: {args.output}")
     else:
         print(output)
@@ -3,21 +3,42 @@ Local Whisper Client using faster-whisper
 Adapted from BiliNote project with Hugging Face model support
 """
 import os
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import logging
 
 from dotenv import load_dotenv
-from faster_whisper import WhisperModel
 
+# Let CTranslate2 accumulate float16 reductions in float16 on GPU (faster,
+# negligible accuracy impact); must be set before ctranslate2 is loaded
+os.environ.setdefault("CT2_CUDA_ALLOW_FP16_REDUCTION", "1")
+
+from faster_whisper import WhisperModel, decode_audio
+
+from video2md.clients._audio_cache import load_audio
+from video2md.clients._transcript_cache import get_default_cache, make_key
 from video2md.models.transcription_models import TranscriptSegment, TranscriptResult
+from video2md.utils.text_io import write_text_file
+from video2md.utils.transcript_converter import transcript_to_json, write_batch_outputs
+from video2md.utils.video_converter import VideoConverter, get_default_converter
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # Load environment variables
 load_dotenv(override=True)
 
 # Set up logging
-logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
+# Library module: leave handler/level configuration to the application
+logger.addHandler(logging.NullHandler())
 
 
 # Model name to Hugging Face repository mapping
@@ -32,6 +53,64 @@ MODEL_MAP = {
     "large-v3": "Systran/faster-whisper-large-v3",
 }
 
+# Loaded models shared by every WhisperClient in the process, keyed by
+# (model, device, compute_type, cpu_threads, num_workers, model_dir), so creating another
+# client with the same settings skips the multi-second weight load
+_MODEL_CACHE: Dict[tuple, WhisperModel] = {}
+_MODEL_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """
+    Check once per process if CUDA is available for GPU acceleration
+
+    Asks CTranslate2 (already loaded by faster-whisper) for CUDA devices, which
+    is what the model actually runs on; importing torch only for this check
+    costs hundreds of milliseconds, so it is the fallback.
+
+    Returns:
+        True if CUDA is available, False otherwise
+    """
+    try:
+        import ctranslate2
+        available = ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        try:
+            import torch
+            available = torch.cuda.is_available()
+        except ImportError:
+            logger.info("✗ PyTorch not installed, using CPU")
+            return False
+    if available:
+        logger.info("✓ CUDA available, using GPU")
+    else:
+        logger.info("✗ CUDA unavailable, using CPU")
+    return available
+
+
+def _get_or_create_model(key: tuple, factory: Callable[[], WhisperModel]) -> WhisperModel:
+    """
+    Return the cached model for key, building it with factory on first use
+
+    Args:
+        key: Model configuration tuple
+        factory: Builds the model; called at most once per key
+
+    Returns:
+        Shared WhisperModel instance
+    """
+    model = _MODEL_CACHE.get(key)
+    if model is not None:
+        return model
+    with _MODEL_LOCK:
+        # Another thread may have finished loading while we waited
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            model = factory()
+            _MODEL_CACHE[key] = model
+        return model
+
 
 class WhisperClient:
     """
@@ -49,8 +128,11 @@ class WhisperClient:
         model_size: str = None,
         device: str = None,
         compute_type: str = None,
-        cpu_threads: int = 4,
+        cpu_threads: int = None,
+        num_workers: int = None,
         model_dir: str = None,
+        batch_size: int = None,
+        use_cache: bool = True,
     ):
         """
         Initialize Whisper client
@@ -58,9 +140,15 @@ class WhisperClient:
         Args:
             model_size: Model size (tiny/base/small/medium/large-v1/large-v2/large-v3)
             device: Compute device ('cpu', 'cuda', or None for auto-detect)
-            compute_type: Computation precision (None for auto: 'float16' on GPU, 'int8' on CPU)
-            cpu_threads: Number of CPU threads to use
+            compute_type: Computation precision (None for auto: 'int8_float16' on GPU, 'int8' on CPU)
+            cpu_threads: Number of CPU threads per worker (None for auto: available cores / workers)
+            num_workers: Parallel model workers, so concurrent transcribe() calls
+                from several threads run at the same time (default: 2)
             model_dir: Directory to store models (default: ./models/whisper/)
+            batch_size: 30-second windows decoded together by the batched
+                pipeline (None for auto: 16 on GPU, 1 on CPU; 1 disables batching)
+            use_cache: Reuse results stored in the persistent transcript cache
+                for unchanged files (see V2M_CACHE_* variables)
         """
         # Get configuration from environment variables with fallbacks
         # Priority: environment variable > explicit parameter > default value
@@ -79,23 +167,24 @@ class WhisperClient:
             device = os.getenv("WHISPER_DEVICE", "auto")
 
         if device == "auto" or device is None:
-            self.device = "cuda" if self._is_cuda_available() else "cpu"
+            self.device = "cuda" if _cuda_available() else "cpu"
         elif device == "cpu":
             self.device = "cpu"
         else:
             # User requested CUDA, check if available
-            self.device = "cuda" if self._is_cuda_available() else "cpu"
+            self.device = "cuda" if _cuda_available() else "cpu"
             if device == "cuda" and self.device == "cpu":
                 logger.warning(
                     "CUDA requested but not available, falling back to CPU")
 
         # Compute type configuration
-        # GPU uses float16, CPU uses int8 quantization for efficiency
+        # GPU uses int8 weights with float16 activations (half the weight memory
+        # and bandwidth of float16, negligible accuracy change), CPU uses int8
         if compute_type is None:
             compute_type = os.getenv("WHISPER_COMPUTE_TYPE")
 
         self.compute_type = compute_type or (
-            "float16" if self.device == "cuda" else "int8"
+            "int8_float16" if self.device == "cuda" else "int8"
         )
 
         # Model directory setup
@@ -105,50 +194,179 @@ class WhisperClient:
         self.model_dir = Path(model_dir)
         self.model_dir.mkdir(parents=True, exist_ok=True)
 
-        # CPU threads
-        self.cpu_threads = int(os.getenv("WHISPER_CPU_THREADS", cpu_threads))
+        # Workers and CPU threads: by default the available cores are split
+        # between the workers so they do not oversubscribe the CPU
+        self.num_workers = max(1, int(os.getenv("WHISPER_NUM_WORKERS", num_workers or 2)))
+        env_cpu_threads = os.getenv("WHISPER_CPU_THREADS")
+        if env_cpu_threads:
+            self.cpu_threads = int(env_cpu_threads)
+        elif cpu_threads is not None:
+            self.cpu_threads = cpu_threads
+        else:
+            self.cpu_threads = max(1, self._available_cores() // self.num_workers)
 
         # Get model path or Hugging Face repo ID
         model_path = self._get_model_path()
+        self._model_path = model_path
 
         logger.info(f"Initializing Whisper model: {self.model_size}")
         logger.info(
             f"Device: {self.device}, Compute type: {self.compute_type}")
         logger.info(f"Model directory: {self.model_dir}")
 
-        # Initialize Whisper model
+        # Initialize Whisper model (shared with other clients using the same settings)
         # If model_path is a Hugging Face repo ID, faster-whisper will download it automatically
-        self.model = WhisperModel(
-            model_size_or_path=model_path,
+        cache_key = (model_path, self.device, self.compute_type,
+                     self.cpu_threads, self.num_workers, str(self.model_dir.resolve()))
+        self.model = _get_or_create_model(cache_key, self._load_model)
+
+        # Batched inference: VAD splits the audio into chunks and the windows
+        # are encoded/decoded as one padded batch, which keeps a GPU busy
+        # instead of decoding one window at a time
+        env_batch_size = os.getenv("WHISPER_BATCH_SIZE")
+        if env_batch_size:
+            self.batch_size = int(env_batch_size)
+        elif batch_size is not None:
+            self.batch_size = batch_size
+        else:
+            self.batch_size = 16 if self.device == "cuda" else 1
+
+        self.pipeline = None
+        if self.batch_size > 1:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+                self.pipeline = BatchedInferencePipeline(model=self.model)
+                logger.info(f"Batched inference enabled (batch size: {self.batch_size})")
+            except ImportError:
+                logger.warning(
+                    "BatchedInferencePipeline not available in this faster-whisper version, "
+                    "using sequential decoding")
+
+        # Decode entry point and the options that never change per call,
+        # resolved once instead of re-checked on every transcription
+        if self.pipeline is not None:
+            # The batched pipeline needs VAD to cut the audio into chunks
+            self._transcribe_fn = self.pipeline.transcribe
+            self._base_params = MappingProxyType(
+                {"batch_size": self.batch_size, "vad_filter": True})
+        else:
+            self._transcribe_fn = self.model.transcribe
+            self._base_params = MappingProxyType({})
+
+        self.cache = get_default_cache() if use_cache else None
+
+        logger.info("Whisper model initialized successfully")
+
+    @staticmethod
+    def clear_model_cache() -> None:
+        """
+        Drop all cached models so their memory can be reclaimed
+
+        Clients that already hold a model keep working; the next new client
+        loads its model again.
+        """
+        with _MODEL_LOCK:
+            _MODEL_CACHE.clear()
+
+    def _cache_key(self, media_path: Union[str, os.PathLike], options: tuple) -> Optional[str]:
+        """
+        Build the transcript cache key for a media file and transcribe options
+
+        Returns:
+            Key string, or None if caching is off or the file cannot be read
+        """
+        if self.cache is None:
+            return None
+        try:
+            return make_key(media_path, self._model_path, self.compute_type,
+                            self.pipeline is not None, *options)
+        except OSError:
+            return None
+
+    def _cached_transcription(self, media_path: Union[str, os.PathLike], options: tuple,
+                              run: Callable[[], TranscriptResult]) -> TranscriptResult:
+        """
+        Return the cached result for media_path, or call run() and cache its result
+        """
+        key = self._cache_key(media_path, options)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info(f"Using cached transcript for: {os.path.basename(media_path)}")
+                return cached
+        result = run()
+        if key is not None:
+            self.cache.set(key, result)
+        return result
+
+    def _load_model(self) -> WhisperModel:
+        """
+        Load the model; on CUDA also run it once so the first real request
+        does not pay for kernel selection and memory pool setup
+
+        Returns:
+            Ready WhisperModel
+        """
+        model_kwargs = {}
+        if self.device == "cuda" and self._supports_flash_attention():
+            model_kwargs["flash_attention"] = True
+            logger.info("Using Flash Attention")
+
+        model = WhisperModel(
+            model_size_or_path=self._model_path,
             device=self.device,
             compute_type=self.compute_type,
             cpu_threads=self.cpu_threads,
-            download_root=str(self.model_dir)
+            num_workers=self.num_workers,
+            download_root=str(self.model_dir),
+            **model_kwargs
         )
 
-        logger.info("Whisper model initialized successfully")
+        if self.device == "cuda":
+            import numpy as np
+
+            start = time.perf_counter()
+            segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32), language="en")
+            list(segments)
+            logger.info(f"CUDA warmup finished in {time.perf_counter() - start:.2f}s")
+
+        return model
 
     @staticmethod
-    def _is_cuda_available() -> bool:
+    def _supports_flash_attention() -> bool:
         """
-        Check if CUDA is available for GPU acceleration
+        Check whether Flash Attention can be enabled
+
+        Needs CTranslate2 >= 4.4 and an Ampere or newer GPU (compute capability 8+,
+        detected by bfloat16 support); set WHISPER_FLASH_ATTENTION=false to turn it off.
 
         Returns:
-            True if CUDA is available, False otherwise
+            True if the model should be loaded with flash_attention=True
         """
+        if os.getenv("WHISPER_FLASH_ATTENTION", "true").lower() in ("0", "false", "no", "off"):
+            return False
         try:
-            import torch
-            if torch.cuda.is_available():
-                logger.info("✓ CUDA available, using GPU")
-                return True
-            else:
-                logger.info(
-                    "✗ PyTorch installed but CUDA unavailable, using CPU")
+            import ctranslate2
+            major, minor = (int(part) for part in ctranslate2.__version__.split(".")[:2])
+            if (major, minor) < (4, 4):
                 return False
-        except ImportError:
-            logger.info("✗ PyTorch not installed, using CPU")
+            return "bfloat16" in ctranslate2.get_supported_compute_types("cuda")
+        except Exception:
+            # Unknown version string or no device: stay on the default kernels
             return False
 
+    @staticmethod
+    def _available_cores() -> int:
+        """
+        Count the CPU cores this process may run on
+
+        Returns:
+            Cores in the process's affinity mask where supported, else all cores
+        """
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count() or 1
+
     def _get_model_path(self) -> str:
         """
         Get model path or Hugging Face repository ID
@@ -181,7 +399,7 @@ class WhisperClient:
 
     def transcribe(
         self,
-        audio_file_path: str,
+        audio_file_path: Union[str, os.PathLike],
         language: str = None,
         task: str = "transcribe",
         initial_prompt: str = None,
@@ -197,7 +415,8 @@ class WhisperClient:
             task: 'transcribe' or 'translate' (to English)
             initial_prompt: Initial prompt to guide the model
             word_timestamps: Enable word-level timestamps
-            vad_filter: Enable voice activity detection filter
+            vad_filter: Enable voice activity detection filter (always on
+                when batched inference is enabled)
 
         Returns:
             TranscriptResult with language, full text, and segments
@@ -206,48 +425,138 @@ class WhisperClient:
             FileNotFoundError: If audio file doesn't exist
             Exception: If transcription fails
         """
-        # Check if file exists
-        audio_path = Path(audio_file_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+        # Convert once; everything below takes plain string paths
+        audio_path = os.fspath(audio_file_path)
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        return self._cached_transcription(
+            audio_path,
+            (language, task, initial_prompt, word_timestamps, vad_filter),
+            # Decoded samples are kept briefly so a retry or a second pass with
+            # other options skips decoding the file again
+            lambda: self._run_transcription(
+                load_audio(audio_path, lambda: decode_audio(
+                    audio_path, sampling_rate=16000)),
+                os.path.basename(audio_path),
+                language=language,
+                task=task,
+                initial_prompt=initial_prompt,
+                word_timestamps=word_timestamps,
+                vad_filter=vad_filter,
+            ),
+        )
 
-        logger.info(f"Transcribing: {audio_path.name}")
-        logger.info(f"Language: {language or 'auto-detect'}, Task: {task}")
+    def _start_transcription(
+        self,
+        audio: Union[str, "np.ndarray"],
+        language: str = None,
+        task: str = "transcribe",
+        initial_prompt: str = None,
+        word_timestamps: bool = False,
+        vad_filter: bool = False,
+    ) -> Tuple[Iterator[TranscriptSegment], object]:
+        """
+        Start decoding and return (lazy segment iterator, transcription info)
 
-        try:
-            # Prepare transcription parameters
-            transcribe_params = {
-                "language": language,
-                "task": task,
-            }
+        faster-whisper detects the language up front but decodes each window
+        only when the iterator advances, so segments come out as they are ready.
+        """
+        # Overlay per-call options on the fixed ones
+        transcribe_params = {
+            "language": language,
+            "task": task,
+        }
 
-            if initial_prompt:
-                transcribe_params["initial_prompt"] = initial_prompt
+        if initial_prompt:
+            transcribe_params["initial_prompt"] = initial_prompt
 
-            if word_timestamps:
-                transcribe_params["word_timestamps"] = True
+        if word_timestamps:
+            transcribe_params["word_timestamps"] = True
 
-            if vad_filter:
-                transcribe_params["vad_filter"] = True
+        if vad_filter:
+            transcribe_params["vad_filter"] = True
 
-            # Perform transcription
-            segments_raw, info = self.model.transcribe(
-                str(audio_path),
-                **transcribe_params
-            )
+        transcribe_params.update(self._base_params)
+
+        # Perform transcription
+        segments_raw, info = self._transcribe_fn(audio, **transcribe_params)
+
+        segments = (
+            TranscriptSegment(start=seg.start, end=seg.end, text=seg.text.strip())
+            for seg in segments_raw
+        )
+        return segments, info
+
+    def stream_segments(
+        self,
+        audio_file_path: Union[str, os.PathLike],
+        language: str = None,
+        task: str = "transcribe",
+        initial_prompt: str = None,
+        word_timestamps: bool = False,
+        vad_filter: bool = False,
+    ) -> Iterator[TranscriptSegment]:
+        """
+        Yield transcript segments as soon as each one is decoded
+
+        Use this instead of transcribe() to show or save the first segments
+        before the whole file is done.
+
+        Args:
+            audio_file_path: Path to audio file
+            language: Language code (e.g., 'zh', 'en'). None for auto-detection
+            task: 'transcribe' or 'translate' (to English)
+            initial_prompt: Initial prompt to guide the model
+            word_timestamps: Enable word-level timestamps
+            vad_filter: Enable voice activity detection filter
+
+        Yields:
+            TranscriptSegment objects in time order
+
+        Raises:
+            FileNotFoundError: If audio file doesn't exist
+        """
+        audio_path = os.fspath(audio_file_path)
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        logger.info(f"Streaming transcription: {os.path.basename(audio_path)}")
+        segments, _ = self._start_transcription(
+            audio_path, language, task, initial_prompt, word_timestamps, vad_filter)
+        yield from segments
+
+    def _run_transcription(
+        self,
+        audio: Union[str, "np.ndarray"],
+        name: str,
+        language: str = None,
+        task: str = "transcribe",
+        initial_prompt: str = None,
+        word_timestamps: bool = False,
+        vad_filter: bool = False,
+    ) -> TranscriptResult:
+        """
+        Run the model on an audio file path or 16 kHz mono float32 samples
+
+        Args:
+            audio: Audio file path, or decoded samples as a float32 array
+            name: Display name used in log and error messages
+            language, task, initial_prompt, word_timestamps, vad_filter: As in transcribe()
+
+        Returns:
+            TranscriptResult with language, full text, and segments
+        """
+        logger.info(f"Transcribing: {name}")
+        logger.info(f"Language: {language or 'auto-detect'}, Task: {task}")
 
-            # Process segments
-            segments = []
-            full_text = ""
+        try:
+            segments_iter, info = self._start_transcription(
+                audio, language, task, initial_prompt, word_timestamps, vad_filter)
 
-            for seg in segments_raw:
-                text = seg.text.strip()
-                full_text += text + " "
-                segments.append(TranscriptSegment(
-                    start=seg.start,
-                    end=seg.end,
-                    text=text
-                ))
+            # Collect texts in a list and join once instead of growing a string
+            segments = list(segments_iter)
+            full_text = " ".join(seg.text for seg in segments)
 
             # Create result
             result = TranscriptResult(
@@ -262,10 +571,11 @@ class WhisperClient:
                 }
             )
 
-            logger.info(f"Transcription completed: {len(segments)} segments")
-            logger.info(
-                f"Detected language: {info.language} (probability: {info.language_probability:.2f})")
-            logger.info(f"Duration: {info.duration:.2f}s")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Transcription completed: {len(segments)} segments, "
+                    f"language {info.language} (probability: {info.language_probability:.2f}), "
+                    f"duration {info.duration:.2f}s")
 
             return result
 
@@ -286,7 +596,7 @@ class WhisperClient:
                 )
                 logger.error(fallback_msg)
                 raise RuntimeError(
-                    f"CUDA out of memory while transcribing {audio_path.name}. "
+                    f"CUDA out of memory while transcribing {name}. "
                     f"Try using a smaller model or CPU mode."
                 ) from e
 
@@ -296,7 +606,7 @@ class WhisperClient:
 
     def transcribe_with_video(
         self,
-        video_file_path: str,
+        video_file_path: Union[str, os.PathLike],
         language: str = None,
         task: str = "transcribe",
         initial_prompt: str = None,
@@ -317,23 +627,21 @@ class WhisperClient:
         Returns:
             TranscriptResult with language, full text, and segments
         """
-        # Import video converter
-        from video2md.utils.video_converter import VideoConverter
-        import tempfile
-
+        # Single Path object reused for the suffix/name checks below
         video_path = Path(video_file_path)
-        if not video_path.exists():
+        if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_file_path}")
 
-        converter = VideoConverter()
+        converter = get_default_converter()
 
         # Check if it's a video file
-        if not converter.is_video_file(video_path):
+        kind = converter.media_kind(video_path)
+        if kind != 'video':
             # If it's already an audio file, just transcribe directly
-            if converter.is_audio_file(video_path):
+            if kind == 'audio':
                 logger.info("File is already audio, transcribing directly")
                 return self.transcribe(
-                    audio_file_path=str(video_path),
+                    audio_file_path=video_path,
                     language=language,
                     task=task,
                     initial_prompt=initial_prompt,
@@ -344,22 +652,17 @@ class WhisperClient:
                 raise ValueError(
                     f"Unsupported file format: {video_path.suffix}")
 
-        logger.info(f"Extracting audio from video: {video_path.name}")
+        def run() -> TranscriptResult:
+            logger.info(f"Decoding audio from video: {video_path.name}")
 
-        # Convert video to audio
-        temp_dir = tempfile.gettempdir()
-        audio_file = converter.video_to_audio(
-            input_path=video_path,
-            output_dir=temp_dir,
-            audio_format='wav',
-            sample_rate=16000,  # Whisper recommended sample rate
-            channels=1          # Mono
-        )
+            # Decode straight into memory; faster-whisper accepts the samples
+            # directly, so no temporary WAV is written and decoded a second time
+            audio = load_audio(
+                video_path, lambda: converter.video_to_pcm(video_path, sample_rate=16000))
 
-        try:
-            # Transcribe the extracted audio
-            result = self.transcribe(
-                audio_file_path=audio_file,
+            return self._run_transcription(
+                audio,
+                video_path.name,
                 language=language,
                 task=task,
                 initial_prompt=initial_prompt,
@@ -367,15 +670,161 @@ class WhisperClient:
                 vad_filter=vad_filter,
             )
 
-            return result
+        # Cached by the video's content, so a hit also skips audio decoding
+        return self._cached_transcription(
+            video_path, (language, task, initial_prompt, word_timestamps, vad_filter), run)
 
-        finally:
-            # Clean up temporary audio file
-            try:
-                os.unlink(audio_file)
-                logger.info(f"Cleaned up temporary audio file")
-            except Exception as e:
-                logger.warning(f"Failed to clean up temporary file: {e}")
+    def transcribe_many(
+        self,
+        media_file_paths: List[str],
+        language: str = None,
+        task: str = "transcribe",
+        initial_prompt: str = None,
+        word_timestamps: bool = False,
+        vad_filter: bool = False,
+        sort_by_duration: bool = False,
+        concurrency: Optional[int] = None,
+    ) -> Dict[str, object]:
+        """
+        Transcribe multiple audio/video files, overlapping audio extraction with transcription
+
+        A background thread extracts audio for the next video with ffmpeg while the
+        model transcribes the current files, so the two stages run concurrently
+        instead of one after the other. Up to `concurrency` files are transcribed
+        at once, one per model worker.
+
+        Args:
+            media_file_paths: Paths to audio or video files
+            language: Language code (e.g., 'zh', 'en'). None for auto-detection
+            task: 'transcribe' or 'translate' (to English)
+            initial_prompt: Initial prompt to guide the model
+            word_timestamps: Enable word-level timestamps
+            vad_filter: Enable voice activity detection filter
+            sort_by_duration: Process files bucketed by duration, shortest first,
+                so short clips are not stuck behind long recordings
+            concurrency: Files transcribed at the same time (defaults to
+                num_workers; more than that only queues inside the model)
+
+        Returns:
+            Dict with 'results' (media path -> TranscriptResult) and 'failed'
+            (list of (media path, error message) tuples)
+        """
+        converter = get_default_converter()
+        results: Dict[str, TranscriptResult] = {}
+        failed: List[tuple] = []
+        options = (language, task, initial_prompt, word_timestamps, vad_filter)
+        concurrency = max(1, concurrency or self.num_workers)
+        results_lock = threading.Lock()
+
+        if sort_by_duration:
+            media_file_paths = [
+                str(p)
+                for bucket in converter.bucket_by_duration(media_file_paths)
+                for p in bucket
+            ]
+
+        # Small bound keeps at most a couple of extracted WAVs waiting on disk
+        audio_queue: "queue.Queue" = queue.Queue(maxsize=2)
+        # One slot per in-flight transcription, so extraction stays only a
+        # couple of files ahead of the model
+        slots = threading.BoundedSemaphore(concurrency)
+
+        with tempfile.TemporaryDirectory(prefix="video2md_") as temp_dir:
+
+            def extract_worker():
+                for idx, media_file in enumerate(media_file_paths):
+                    media_path = Path(media_file)
+                    try:
+                        if not media_path.exists():
+                            raise FileNotFoundError(
+                                f"Media file not found: {media_file}")
+                        # Hashing happens here, overlapped with transcription
+                        key = self._cache_key(media_path, options)
+                        cached = self.cache.get(key) if key is not None else None
+                        kind = converter.media_kind(media_path)
+                        if cached is not None:
+                            audio_queue.put((media_file, None, False, None, key, cached))
+                        elif kind == 'video':
+                            logger.info(
+                                f"Extracting audio from video: {media_path.name}")
+                            audio_file = converter.video_to_audio(
+                                input_path=media_path,
+                                # Index prefix keeps same-named inputs apart
+                                output_path=Path(temp_dir) /
+                                f"{idx}_{media_path.stem}.wav",
+                                audio_format='wav',
+                                sample_rate=16000,
+                                channels=1
+                            )
+                            audio_queue.put((media_file, audio_file, True, None, key, None))
+                        elif kind == 'audio':
+                            audio_queue.put(
+                                (media_file, str(media_path), False, None, key, None))
+                        else:
+                            raise ValueError(
+                                f"Unsupported file format: {media_path.suffix}")
+                    except Exception as e:
+                        audio_queue.put((media_file, None, False, e, None, None))
+                # Sentinel: no more files
+                audio_queue.put(None)
+
+            def transcribe_worker(media_file, audio_file, is_temp, key):
+                try:
+                    result = self._run_transcription(
+                        audio_file,
+                        os.path.basename(media_file),
+                        language=language,
+                        task=task,
+                        initial_prompt=initial_prompt,
+                        word_timestamps=word_timestamps,
+                        vad_filter=vad_filter,
+                    )
+                    # Cache under the original media file, not the temp WAV
+                    if key is not None:
+                        self.cache.set(key, result)
+                    with results_lock:
+                        results[media_file] = result
+                except Exception as e:
+                    logger.error(f"Failed to transcribe {media_file}: {e}")
+                    with results_lock:
+                        failed.append((media_file, str(e)))
+                finally:
+                    slots.release()
+                    if is_temp:
+                        try:
+                            os.unlink(audio_file)
+                        except Exception as e:
+                            logger.warning(
+                                f"Failed to clean up temporary file: {e}")
+
+            producer = threading.Thread(target=extract_worker, daemon=True)
+            producer.start()
+
+            with ThreadPoolExecutor(
+                    max_workers=concurrency,
+                    thread_name_prefix="whisper-batch") as executor:
+                while True:
+                    item = audio_queue.get()
+                    if item is None:
+                        break
+                    media_file, audio_file, is_temp, error, key, cached = item
+                    if error is not None:
+                        logger.error(f"Failed to prepare {media_file}: {error}")
+                        with results_lock:
+                            failed.append((media_file, str(error)))
+                        continue
+                    if cached is not None:
+                        logger.info(f"Using cached transcript for: {media_file}")
+                        with results_lock:
+                            results[media_file] = cached
+                        continue
+                    slots.acquire()
+                    executor.submit(
+                        transcribe_worker, media_file, audio_file, is_temp, key)
+
+            producer.join()
+
+        return {"results": results, "failed": failed}
 
 
 def main():
@@ -384,10 +833,20 @@ def main():
     """
     import argparse
 
+    logging.basicConfig(level=logging.WARNING)
+
     parser = argparse.ArgumentParser(
         description="Local Whisper transcription client")
-    parser.add_argument("input_file", type=str,
+    parser.add_argument("input_file", type=str, nargs="?",
                         help="Audio or video file to transcribe")
+    parser.add_argument(
+        "--batch",
+        type=str,
+        nargs="+",
+        metavar="FILE",
+        default=None,
+        help="Transcribe several audio/video files, extracting audio for the next file while the current one is transcribed"
+    )
     parser.add_argument(
         "--model-size",
         type=str,
@@ -419,7 +878,7 @@ def main():
         "--output",
         type=str,
         default=None,
-        help="Output file path (optional)"
+        help="Output file path (optional; output directory with --batch)"
     )
     parser.add_argument(
         "--format",
@@ -428,15 +887,39 @@ def main():
         choices=["txt", "json"],
         help="Output format (default: txt)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the persistent transcript cache"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Files transcribed at once with --batch (default: WHISPER_NUM_WORKERS)"
+    )
 
     args = parser.parse_args()
+    if not args.input_file and not args.batch:
+        parser.error("an input file or --batch is required")
 
     # Initialize client
     client = WhisperClient(
         model_size=args.model_size,
         device=args.device,
+        use_cache=not args.no_cache,
     )
 
+    if args.batch:
+        outcome = client.transcribe_many(
+            args.batch,
+            language=args.language,
+            task=args.task,
+            concurrency=args.concurrency,
+        )
+        write_batch_outputs(outcome, args.format, args.output)
+        return 1 if outcome["failed"] else 0
+
     # Transcribe
     input_path = Path(args.input_file)
     if not input_path.exists():
@@ -444,34 +927,31 @@ def main():
         return 1
 
     # Check if it's video or audio
-    from video2md.utils.video_converter import VideoConverter
     converter = VideoConverter()
 
     if converter.is_video_file(input_path):
         result = client.transcribe_with_video(
-            video_file_path=str(input_path),
+            video_file_path=input_path,
             language=args.language,
             task=args.task,
         )
     else:
         result = client.transcribe(
-            audio_file_path=str(input_path),
+            audio_file_path=input_path,
             language=args.language,
             task=args.task,
         )
 
     # Output results
     if args.format == "json":
-        import json
-        from dataclasses import asdict
-        output = json.dumps(asdict(result), ensure_ascii=False, indent=2)
+        output = transcript_to_json(result)
     else:
         output = result.full_text
 
     if args.output:
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(output, encoding="utf-8")
+        write_text_file(output_path, output)
         print(f"Results saved to: {args.output}")
     else:
         print(output)
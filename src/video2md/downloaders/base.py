@@ -5,13 +5,18 @@ This module defines the core abstractions for the downloader system:
 - Downloader: Abstract base class for all platform-specific downloaders
 - DownloadResult: Data class containing download result metadata
 - Custom exceptions for error handling
+- The thread pool and network options shared by the yt-dlp downloaders
 """
 
 from __future__ import annotations
 
+import atexit
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -55,11 +60,15 @@ class CookieRequiredError(DownloadError):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DownloadResult:
     """
     Immutable result of a successful video download.
     
+    The file is not checked on construction: downloaders build a result only
+    after writing or locating the file, and cached or dry-run flows can
+    describe a file that is not present locally.
+    
     Attributes:
         file_path: Path to the downloaded video file
         title: Video title extracted from source
@@ -78,13 +87,54 @@ class DownloadResult:
     raw_info: dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self) -> None:
-        """Validate required fields."""
-        if not self.file_path.exists():
-            raise ValueError(f"Downloaded file does not exist: {self.file_path}")
+        """Fall back to the video ID when no title was extracted."""
         if not self.title:
             object.__setattr__(self, 'title', self.video_id)
 
 
+@lru_cache(maxsize=1)
+def get_ytdlp_executor() -> ThreadPoolExecutor:
+    """
+    Return the thread pool shared by the yt-dlp based downloaders.
+    
+    yt-dlp blocks on many small HTTP requests, so downloads run on their own
+    pool instead of the event loop's default executor, where they would
+    compete with every other blocking call in the process.
+    V2M_YTDLP_WORKERS sets the pool size (default: 8).
+    
+    Returns:
+        Shared ThreadPoolExecutor, shut down at interpreter exit
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, int(os.getenv("V2M_YTDLP_WORKERS", "8"))),
+        thread_name_prefix="ytdlp",
+    )
+    atexit.register(executor.shutdown)
+    return executor
+
+
+def ytdlp_network_options() -> dict[str, Any]:
+    """
+    Return the yt-dlp options that control how media is fetched.
+    
+    DASH/HLS streams (Bilibili, YouTube) arrive as many small fragments;
+    fetching several at once keeps the connection busy instead of paying one
+    round trip per fragment. V2M_YTDLP_FRAG_CONC sets how many fragments are
+    downloaded in parallel (default: 8).
+    
+    Returns:
+        Options to merge into a downloader's ydl_opts
+    """
+    return {
+        'concurrent_fragment_downloads': max(1, int(os.getenv("V2M_YTDLP_FRAG_CONC", "8"))),
+        # Large non-fragmented files are requested in 10 MB ranges, which
+        # avoids server-side throttling of single long responses
+        'http_chunk_size': 10 * 1024 * 1024,
+        'retries': 3,
+        'socket_timeout': 30,
+    }
+
+
 class Downloader(ABC):
     """
     Abstract base class for video downloaders.
@@ -19,6 +19,8 @@ from video2md.downloaders.base import (
     DownloadFailedError,
     DownloadResult,
     Platform,
+    get_ytdlp_executor,
+    ytdlp_network_options,
 )
 
 logger = logging.getLogger(__name__)
@@ -135,16 +137,17 @@ class BilibiliDownloader(Downloader):
             }
             expected_ext = 'mp4'
         
+        ydl_opts.update(ytdlp_network_options())
+        
         # Add progress hook if provided
         if progress_hook:
             ydl_opts['progress_hooks'] = [progress_hook]
         
         try:
             # Run yt-dlp in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            info = await loop.run_in_executor(
-                None,
-                lambda: self._extract_and_download(yt_dlp, url, ydl_opts)
+            info = await asyncio.get_running_loop().run_in_executor(
+                get_ytdlp_executor(),
+                self._extract_and_download, yt_dlp, url, ydl_opts,
             )
             
             # Determine output file path
@@ -153,10 +156,10 @@ class BilibiliDownloader(Downloader):
             
             # Handle case where yt-dlp uses different extension
             if not file_path.exists():
-                # Try to find the actual downloaded file
-                possible_files = list(output_dir.glob(f"{video_id}.*"))
-                if possible_files:
-                    file_path = possible_files[0]
+                # Try to find the actual downloaded file (first match is enough)
+                found_file = next(output_dir.glob(f"{video_id}.*"), None)
+                if found_file is not None:
+                    file_path = found_file
                 else:
                     raise DownloadFailedError(url, f"Downloaded file not found: {file_path}")
             
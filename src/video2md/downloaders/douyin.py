@@ -4,9 +4,11 @@ Douyin video downloader using yt-dlp.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
+import time
 from pathlib import Path
 from typing import Any, Final, Optional
 
@@ -43,6 +45,21 @@ class DouyinDownloader(Downloader):
     Douyin video downloader using yt-dlp.
     """
     
+    # Hosts this downloader supports (also matches iesdouyin.com)
+    _HOST_PATTERN: Final[re.Pattern[str]] = re.compile(r"douyin\.com", re.IGNORECASE)
+    
+    # Video ID in standard /video/<id> URLs
+    _VIDEO_ID_PATTERN: Final[re.Pattern[str]] = re.compile(r"/video/(\d+)")
+    
+    # Characters not allowed in file names
+    _UNSAFE_FILENAME_PATTERN: Final[re.Pattern[str]] = re.compile(r'[<>:"/\\|?*]')
+    
+    # Bytes handed to the write loop per iteration
+    _CHUNK_SIZE: Final[int] = 4 * 1024 * 1024
+    
+    # Minimum seconds between progress_hook calls (at most 10 per second)
+    _PROGRESS_INTERVAL: Final[float] = 0.1
+    
     @property
     def platform(self) -> Platform:
         return Platform.DOUYIN
@@ -56,7 +73,9 @@ class DouyinDownloader(Downloader):
         return True
     
     def supports(self, url: str) -> bool:
-        return "douyin.com" in url or "iesdouyin.com" in url
+        if not url:
+            return False
+        return self._HOST_PATTERN.search(url) is not None
     
     async def download(
         self,
@@ -82,7 +101,7 @@ class DouyinDownloader(Downloader):
         if not video_id:
             # Fallback for standard URLs if regex didn't catch earlier
             # e.g. https://www.douyin.com/video/742...
-            match = re.search(r"/video/(\d+)", url)
+            match = self._VIDEO_ID_PATTERN.search(url)
             if match:
                 video_id = match.group(1)
             else:
@@ -115,7 +134,7 @@ class DouyinDownloader(Downloader):
                 # Filename
                 title = detail.get("desc", video_id)
                 # Sanitize filename
-                safe_title = re.sub(r'[<>:"/\\|?*]', '', title)[:50] # Limit length
+                safe_title = self._UNSAFE_FILENAME_PATTERN.sub('', title)[:50] # Limit length
                 filename = f"{safe_title}_{video_id}.mp4"
                 file_path = output_dir / filename
                 
@@ -126,24 +145,56 @@ class DouyinDownloader(Downloader):
                     async with api.client.stream("GET", video_url) as response:
                         response.raise_for_status()
                         total_size = int(response.headers.get("Content-Length", 0))
-                        downloaded = 0
+                        last_reported = 0.0
+                        
+                        # Video is normally sent unencoded, so skip httpx's
+                        # decoder; fall back to decoded bytes if the CDN did
+                        # compress it, or the file would be written compressed
+                        encoding = response.headers.get("Content-Encoding", "identity")
+                        if encoding.lower() == "identity":
+                            chunks = response.aiter_raw(chunk_size=self._CHUNK_SIZE)
+                        else:
+                            chunks = response.aiter_bytes(chunk_size=self._CHUNK_SIZE)
                         
-                        with open(file_path, "wb") as f:
-                            async for chunk in response.aiter_bytes(chunk_size=1024*1024):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                if progress_hook and total_size > 0:
-                                    # Simple progress report (could be improved)
-                                    status = {
+                        # Each chunk is written in a worker thread while the
+                        # next one is received, so disk writes neither block
+                        # the event loop nor stall the network stream
+                        f = await asyncio.to_thread(open, file_path, "wb")
+                        pending: Optional[asyncio.Future] = None
+                        try:
+                            async for chunk in chunks:
+                                if pending is not None:
+                                    await pending
+                                pending = asyncio.ensure_future(asyncio.to_thread(f.write, chunk))
+                                if not progress_hook:
+                                    continue
+                                now = time.monotonic()
+                                if now - last_reported >= self._PROGRESS_INTERVAL:
+                                    last_reported = now
+                                    # yt-dlp style status, like the other downloaders report
+                                    progress_hook({
                                         'status': 'downloading',
-                                        'downloaded_bytes': downloaded,
-                                        'total_bytes': total_size,
-                                        'filename': filename
-                                    }
-                                    # Adaptation for yt-dlp style hook if needed, or custom
-                                    # Since our UI expects simple prints or direct hook:
-                                    # We can try to format a yt-dlp like dict but for now we just log
-                                    pass
+                                        'downloaded_bytes': response.num_bytes_downloaded,
+                                        'total_bytes': total_size or None,
+                                        'filename': str(file_path),
+                                    })
+                            if pending is not None:
+                                await pending
+                                pending = None
+                        finally:
+                            if pending is not None:
+                                # Let an in-flight write finish before closing
+                                await asyncio.gather(pending, return_exceptions=True)
+                            await asyncio.to_thread(f.close)
+                        
+                        if progress_hook:
+                            downloaded = response.num_bytes_downloaded
+                            progress_hook({
+                                'status': 'finished',
+                                'downloaded_bytes': downloaded,
+                                'total_bytes': total_size or downloaded,
+                                'filename': str(file_path),
+                            })
 
                 return DownloadResult(
                     file_path=file_path,
@@ -1,3 +1,4 @@
+import importlib.util
 import logging
 import re
 from urllib.parse import urlencode, quote
@@ -18,6 +19,14 @@ DEFAULT_HEADERS = {
     "Accept-Encoding": "gzip, deflate, br",
 }
 
+# The metadata API and the CDN stream share one client; HTTP/2 (when h2 is
+# installed) multiplexes them instead of queueing on HTTP/1.1 connections.
+# No custom transport, so HTTP(S)_PROXY/ALL_PROXY from the environment apply
+_HTTP_OPTIONS = dict(
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0),
+)
+
 class LinkExtractor:
     DETAIL_LINK = re.compile(r"\S*?https://www\.douyin\.com/(?:video|note|slides)/([0-9]{19})\S*?")
     DETAIL_SHARE = re.compile(r"\S*?https://www\.iesdouyin\.com/share/(?:video|note|slides)/([0-9]{19})/\S*?")
@@ -37,13 +46,33 @@ class DouyinAPI:
     DOMAIN = "https://www.douyin.com/"
     API_URL = f"{DOMAIN}aweme/v1/web/aweme/detail/"
     
+    # Constant detail-API query parameters, encoded once; only aweme_id
+    # (between the two parts) changes per request
+    _QUERY_PREFIX = urlencode({
+        "device_platform": "webapp",
+        "aid": "6383",
+        "channel": "channel_pc_web",
+    }, quote_via=quote) + "&aweme_id="
+    _QUERY_SUFFIX = urlencode({
+        "version_code": "190500",
+        "version_name": "19.5.0",
+        "cookie_enabled": "true",
+        "platform": "PC",
+        "downlink": "10",
+    }, quote_via=quote)
+    
     def __init__(self, cookie: Optional[str] = None, timeout: int = 20):
         self.headers = DEFAULT_HEADERS.copy()
         if cookie:
             self.headers["Cookie"] = cookie
             
         self.abogus = ABogus(user_agent=self.headers["User-Agent"])
-        self.client = httpx.AsyncClient(headers=self.headers, follow_redirects=True, timeout=timeout)
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            follow_redirects=True,
+            timeout=timeout,
+            **_HTTP_OPTIONS,
+        )
 
     async def initialize(self):
         """Visit homepage to initialize cookies if no config cookie is provided."""
@@ -59,22 +88,11 @@ class DouyinAPI:
             logger.warning(f"Failed to initialize cookies: {e}")
 
     async def get_video_data(self, video_id: str) -> dict | None:
-        params = {
-            "device_platform": "webapp",
-            "aid": "6383",
-            "channel": "channel_pc_web",
-            "aweme_id": video_id,
-            "version_code": "190500",
-            "version_name": "19.5.0",
-            "cookie_enabled": "true",
-            "platform": "PC",
-            "downlink": "10",
-        }
-        
         # Determine referer based on video ID context if possible, otherwise generic
         self.client.headers["Referer"] = f"https://www.douyin.com/video/{video_id}"
 
-        query = urlencode(params, quote_via=quote)
+        # Same parameter order as before, since the a_bogus signature covers it
+        query = f"{self._QUERY_PREFIX}{quote(video_id, safe='')}&{self._QUERY_SUFFIX}"
         signed_query = query + f"&a_bogus={self.abogus.get_value(query)}"
         
         url = f"{self.API_URL}?{signed_query}"
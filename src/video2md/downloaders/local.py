@@ -8,11 +8,13 @@ pipeline to work with both remote URLs and local files.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import re
 import shutil
 from pathlib import Path
-from typing import Final
+from typing import Final, Literal
 
 from video2md.downloaders.base import (
     Downloader,
@@ -24,6 +26,61 @@ from video2md.downloaders.base import (
 logger = logging.getLogger(__name__)
 
 
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """
+    Copy src to dst inside the kernel with os.copy_file_range.
+    
+    On copy-on-write filesystems (btrfs, XFS with reflink) the kernel can
+    satisfy this with a reflink, which takes the same time for any file size.
+    
+    Returns:
+        True if the file was copied, False if copy_file_range is unavailable
+        or unsupported for these files and the caller should fall back
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        copied = 0
+        while remaining > 0:
+            try:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            except OSError:
+                if copied == 0:
+                    # e.g. EXDEV on older kernels, EOPNOTSUPP, ENOSYS
+                    return False
+                raise
+            if n == 0:
+                # Source shrank while copying
+                break
+            copied += n
+            remaining -= n
+    return True
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy a file's content as cheaply as the platform allows.
+    
+    Tries copy_file_range first, then shutil.copyfile (which uses sendfile
+    on Linux and fcopyfile on macOS). Unlike shutil.copy2 no permission bits
+    or extended attributes are copied; only the timestamps are kept.
+    
+    Args:
+        src: Source file
+        dst: Destination file (overwritten if it exists)
+    """
+    if not _copy_file_range(src, dst):
+        shutil.copyfile(src, dst)
+    st = src.stat()
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+# How LocalDownloader places a file in the output directory
+LinkMode = Literal["hardlink", "symlink", "copy"]
+
+
 class LocalDownloader(Downloader):
     """
     Local file handler.
@@ -44,6 +101,24 @@ class LocalDownloader(Downloader):
         '.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma',
     })
     
+    # Path-like input: Unix absolute, Windows absolute, ./ or ../ relative
+    _PATH_PATTERN: Final[re.Pattern[str]] = re.compile(r"(?:/|[A-Za-z]:\\|\./|\.\./)")
+    
+    # Longer input is never a usable path (PATH_MAX on Linux)
+    _MAX_PATH_LENGTH: Final[int] = 4096
+    
+    def __init__(self, link_mode: LinkMode = "hardlink") -> None:
+        """
+        Args:
+            link_mode: How files are placed in the output directory:
+                "hardlink" links them (falling back to a symlink across
+                filesystems, then to a copy), "symlink" symlinks them
+                (falling back to a copy), "copy" always copies
+        """
+        if link_mode not in ("hardlink", "symlink", "copy"):
+            raise ValueError(f"Unknown link_mode: {link_mode!r}")
+        self.link_mode = link_mode
+    
     @property
     def platform(self) -> Platform:
         return Platform.LOCAL
@@ -67,23 +142,42 @@ class LocalDownloader(Downloader):
         url = url.strip()
         
         # Check for path-like patterns
-        path_patterns = [
-            r"^/",            # Unix absolute path
-            r"^[A-Za-z]:\\",  # Windows absolute path
-            r"^\./",          # Relative path
-            r"^\.\./",        # Parent relative path
-        ]
+        if self._PATH_PATTERN.match(url):
+            return True
         
-        for pattern in path_patterns:
-            if re.match(pattern, url):
-                return True
+        # Also check if it's a file path without prefix that exists;
+        # URLs and oversized input are rejected without a stat call
+        if "://" in url or len(url) >= self._MAX_PATH_LENGTH:
+            return False
+        return Path(url).is_file()
+    
+    def _place_file(self, source_path: Path, dest_path: Path) -> str:
+        """
+        Make source_path available at dest_path without copying if possible.
         
-        # Also check if it's a file path without prefix that exists
-        path = Path(url)
-        if path.exists() and path.is_file():
-            return True
+        A hardlink costs no extra space or I/O but only works within one
+        filesystem; a symlink works across filesystems. An existing dest_path
+        is replaced in every mode.
         
-        return False
+        Returns:
+            The method that was used: "hardlink", "symlink" or "copy"
+        """
+        # Also drops a stale symlink, which a copy would otherwise write through
+        dest_path.unlink(missing_ok=True)
+        if self.link_mode == "hardlink":
+            try:
+                os.link(source_path, dest_path)
+                return "hardlink"
+            except OSError as e:
+                logger.debug(f"Hardlink failed, trying symlink: {e}")
+        if self.link_mode in ("hardlink", "symlink"):
+            try:
+                dest_path.symlink_to(source_path)
+                return "symlink"
+            except OSError as e:
+                logger.debug(f"Symlink failed, copying: {e}")
+        _fast_copy(source_path, dest_path)
+        return "copy"
     
     async def download(
         self,
@@ -96,16 +190,16 @@ class LocalDownloader(Downloader):
         cookie: Optional[str] = None,
     ) -> DownloadResult:
         """
-        "Download" a local file by copying it to the output directory.
+        "Download" a local file by linking or copying it to the output directory.
         
         Args:
             url: Path to the local file
-            output_dir: Directory to copy the file to
+            output_dir: Directory to place the file in
             download_video: Ignored for local files
             download_audio: Ignored for local files
         
         Returns:
-            DownloadResult with copied file path and metadata
+            DownloadResult with the placed file path and metadata
         
         Raises:
             DownloadFailedError: If file doesn't exist or can't be copied
@@ -135,14 +229,15 @@ class LocalDownloader(Downloader):
         dest_path = output_dir / source_path.name
         
         try:
-            # If source is already in output dir, just use it
-            if source_path.parent.resolve() == output_dir.resolve():
+            # If source is already in output dir, just use it; samefile
+            # compares device and inode, so symlinked paths match without
+            # resolving them (source_path itself is already resolved)
+            if os.path.samefile(source_path.parent, output_dir):
                 logger.info(f"File already in output directory: {source_path}")
                 dest_path = source_path
             else:
-                # Copy file to output directory
-                logger.info(f"Copying local file: {source_path} -> {dest_path}")
-                shutil.copy2(source_path, dest_path)
+                method = await asyncio.to_thread(self._place_file, source_path, dest_path)
+                logger.info(f"Placed local file ({method}): {source_path} -> {dest_path}")
             
             # Get file metadata
             stat = dest_path.stat()
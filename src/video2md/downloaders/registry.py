@@ -10,6 +10,7 @@ This module provides:
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Final, Optional
 
 from video2md.downloaders.base import (
@@ -54,6 +55,17 @@ _PLATFORM_PATTERNS: Final[dict[Platform, tuple[re.Pattern[str], ...]]] = {
     ),
 }
 
+# All platform patterns folded into one alternation with a named group per
+# platform, so detection is a single regex scan instead of one search per
+# pattern; the group that matched names the Platform member
+_COMBINED_PATTERN: Final[re.Pattern[str]] = re.compile(
+    "|".join(
+        f"(?P<{platform.name}>{'|'.join(p.pattern for p in patterns)})"
+        for platform, patterns in _PLATFORM_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+
 # Human-readable platform names
 SUPPORTED_PLATFORMS: Final[dict[Platform, str]] = {
     Platform.BILIBILI: "哔哩哔哩 (Bilibili)",
@@ -82,15 +94,16 @@ def detect_platform(url: str) -> Optional[Platform]:
     """
     if not url:
         return None
-    
-    url = url.strip()
-    
-    for platform, patterns in _PLATFORM_PATTERNS.items():
-        for pattern in patterns:
-            if pattern.search(url):
-                return platform
-    
-    return None
+    return _detect_stripped(url.strip())
+
+
+@lru_cache(maxsize=1024)
+def _detect_stripped(url: str) -> Optional[Platform]:
+    """Match a stripped URL; cached since the UI checks the same URL repeatedly"""
+    match = _COMBINED_PATTERN.search(url)
+    if match is None:
+        return None
+    return Platform[match.lastgroup]
 
 
 def is_supported_url(url: str) -> bool:
@@ -106,63 +119,56 @@ def is_supported_url(url: str) -> bool:
     return detect_platform(url) is not None
 
 
-# Lazy-loaded downloader instances
-# Using late binding to avoid circular imports and allow optional dependencies
-_downloaders: dict[Platform, Downloader] = {}
-_downloaders_initialized: bool = False
-
-
-def _initialize_downloaders() -> None:
+@lru_cache(maxsize=1)
+def _get_downloaders() -> dict[Platform, Downloader]:
     """
-    Initialize all available downloaders.
+    Create all available downloaders on first use.
     
-    This is called lazily on first access to avoid import-time side effects.
-    Downloaders that fail to initialize (e.g., missing dependencies) are skipped.
+    Called lazily to avoid import-time side effects; lru_cache makes every
+    later call a plain cached return instead of a flag check. Downloaders
+    that fail to initialize (e.g., missing dependencies) are skipped.
+    
+    Returns:
+        Platform -> downloader instance for every available downloader
     """
-    global _downloaders_initialized
+    import logging
     
-    if _downloaders_initialized:
-        return
+    downloaders: dict[Platform, Downloader] = {}
     
     # Import and register downloaders
     # Each import is wrapped in try-except to handle missing dependencies gracefully
     
     try:
         from video2md.downloaders.bilibili import BilibiliDownloader
-        _downloaders[Platform.BILIBILI] = BilibiliDownloader()
+        downloaders[Platform.BILIBILI] = BilibiliDownloader()
     except ImportError as e:
-        import logging
         logging.getLogger(__name__).warning(f"BilibiliDownloader not available: {e}")
     
     try:
         from video2md.downloaders.youtube import YoutubeDownloader
-        _downloaders[Platform.YOUTUBE] = YoutubeDownloader()
+        downloaders[Platform.YOUTUBE] = YoutubeDownloader()
     except ImportError as e:
-        import logging
         logging.getLogger(__name__).warning(f"YoutubeDownloader not available: {e}")
 
     try:
         from video2md.downloaders.douyin import DouyinDownloader
-        _downloaders[Platform.DOUYIN] = DouyinDownloader()
+        downloaders[Platform.DOUYIN] = DouyinDownloader()
     except ImportError as e:
-        import logging
         logging.getLogger(__name__).warning(f"DouyinDownloader not available: {e}")
 
     try:
         from video2md.downloaders.tiktok import TiktokDownloader
-        _downloaders[Platform.TIKTOK] = TiktokDownloader()
+        downloaders[Platform.TIKTOK] = TiktokDownloader()
     except ImportError as e:
-        import logging
         logging.getLogger(__name__).warning(f"TiktokDownloader not available: {e}")
     
     try:
         from video2md.downloaders.local import LocalDownloader
-        _downloaders[Platform.LOCAL] = LocalDownloader()
+        downloaders[Platform.LOCAL] = LocalDownloader()
     except ImportError as e:
-        import logging
         logging.getLogger(__name__).warning(f"LocalDownloader not available: {e}")
     
-    _downloaders_initialized = True
+    return downloaders
 
 
 def get_downloader(url: str) -> Downloader:
@@ -182,13 +188,11 @@ def get_downloader(url: str) -> Downloader:
         >>> downloader = get_downloader("https://www.bilibili.com/video/BV1xxx")
         >>> result = await downloader.download(url, output_dir)
     """
-    _initialize_downloaders()
-    
     platform = detect_platform(url)
     if platform is None:
         raise PlatformNotSupportedError(url)
     
-    downloader = _downloaders.get(platform)
+    downloader = _get_downloaders().get(platform)
     if downloader is None:
         raise PlatformNotSupportedError(url)
     
@@ -205,8 +209,7 @@ def get_downloader_for_platform(platform: Platform) -> Optional[Downloader]:
     Returns:
         Downloader instance or None if not available
     """
-    _initialize_downloaders()
-    return _downloaders.get(platform)
+    return _get_downloaders().get(platform)
 
 
 def get_all_downloaders() -> Sequence[Downloader]:
@@ -216,9 +219,8 @@ def get_all_downloaders() -> Sequence[Downloader]:
     Returns:
         Sequence of all registered downloader instances
     """
-    _initialize_downloaders()
     # Return unique downloaders (DouyinTikTok is registered twice)
-    return list(dict.fromkeys(_downloaders.values()))
+    return list(dict.fromkeys(_get_downloaders().values()))
 
 
 def get_available_platforms() -> list[Platform]:
@@ -228,5 +230,4 @@ def get_available_platforms() -> list[Platform]:
     Returns:
         List of Platform enum values that have working downloaders
     """
-    _initialize_downloaders()
-    return list(_downloaders.keys())
+    return list(_get_downloaders().keys())
@@ -15,6 +15,8 @@ from video2md.downloaders.base import (
     DownloadFailedError,
     DownloadResult,
     Platform,
+    get_ytdlp_executor,
+    ytdlp_network_options,
 )
 
 logger = logging.getLogger(__name__)
@@ -83,14 +85,15 @@ class TiktokDownloader(Downloader):
         if cookie:
             ydl_opts['http_headers'] = {'Cookie': cookie}
             
+        ydl_opts.update(ytdlp_network_options())
+        
         if progress_hook:
             ydl_opts['progress_hooks'] = [progress_hook]
 
         try:
-            loop = asyncio.get_event_loop()
-            info = await loop.run_in_executor(
-                None,
-                lambda: self._extract_and_download(yt_dlp, url, ydl_opts)
+            info = await asyncio.get_running_loop().run_in_executor(
+                get_ytdlp_executor(),
+                self._extract_and_download, yt_dlp, url, ydl_opts,
             )
             
             video_id = info.get('id', 'unknown')
@@ -99,9 +102,9 @@ class TiktokDownloader(Downloader):
             file_path = output_dir / f"{video_id}.{video_ext}"
             
             if not file_path.exists():
-                 found = list(output_dir.glob(f"{video_id}.*"))
-                 if found:
-                     file_path = found[0]
+                 found = next(output_dir.glob(f"{video_id}.*"), None)
+                 if found is not None:
+                     file_path = found
             
             if not file_path.exists():
                 raise DownloadFailedError(url, "Downloaded file not found")
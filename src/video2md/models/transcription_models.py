@@ -6,7 +6,10 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+# slots: segments are created by the thousand for long media, and slotted
+# instances carry no per-object __dict__; frozen: results are shared by the
+# transcript/audio caches, so they must not be modified in place
+@dataclass(slots=True, frozen=True)
 class TranscriptSegment:
     """Single transcription segment with timestamp"""
     start: float      # Start time in seconds
@@ -14,7 +17,7 @@ class TranscriptSegment:
     text: str         # Transcribed text for this segment
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptResult:
     """Complete transcription result"""
     language: Optional[str]                # Detected language (e.g., "zh", "en")
@@ -1,7 +1,28 @@
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 import importlib
 import importlib.util
+import json
+
+# orjson is optional (speedups extra); it encodes large prompt payloads
+# several times faster than the stdlib and emits UTF-8 directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def to_json(value: Any, indent: bool = False) -> str:
+    """Serialize a value for embedding in a prompt (non-ASCII kept as-is).
+
+    Uses orjson when installed, otherwise the stdlib json module; both give
+    the same text for plain dicts/lists of strings and numbers.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(value, option=option).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, indent=2 if indent else None,
+                      separators=None if indent else (",", ":"))
 
 
 class PromptLoader:
@@ -109,6 +130,35 @@ class PromptLoader:
         text = self.load(name)
         return self._replace_placeholders(text, kwargs)
 
+    def compile(self, name: str) -> Callable[..., str]:
+        """Resolve, read and parse a template once; return its render function.
+
+        Use this when the same prompt is rendered many times (e.g. once per
+        file in a batch) to skip the repeated path lookups, reads and parses
+        of render(). Output matches render(name, **kwargs).
+        """
+        path = self._resolve_path(name)
+        text = path.read_text(encoding="utf-8")
+        template = None
+        if self._jinja_env is not None:
+            try:
+                # Load by name like render(): from_string() would apply the
+                # env's string-template autoescaping and HTML-escape values
+                template = self._jinja_env.get_template(path.name)
+            except Exception:
+                # Same fallback as render(): use simple replacement
+                template = None
+
+        def render(**kwargs: Any) -> str:
+            if template is not None:
+                try:
+                    return template.render(**kwargs)
+                except Exception:
+                    pass
+            return self._replace_placeholders(text, kwargs)
+
+        return render
+
     @staticmethod
     def _replace_placeholders(text: str, values: Dict[str, Any]) -> str:
         rendered = text
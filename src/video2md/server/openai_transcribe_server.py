@@ -6,11 +6,14 @@ from mcp.server import Server
 from mcp.types import Tool, TextContent
 import json
 import logging
+import os
 from pathlib import Path
 import asyncio
 
 from video2md.clients.openai_transcribe_client import OpenAITranscribeClient
-from video2md.utils.transcript_converter import save_transcript, transcript_to_srt
+from video2md.utils.chinese_converter import get_text_converter
+from video2md.utils.transcript_converter import (
+    map_transcript_text, save_transcript_outputs, transcript_to_srt)
 
 # Set up logging
 logging.basicConfig(level=logging.WARNING)
@@ -18,6 +21,17 @@ logger = logging.getLogger(__name__)
 
 app = Server("openai-transcribe")
 
+# Shared client so every tool call reuses the same HTTP connection pool
+_openai_client = None
+
+
+def get_openai_client() -> OpenAITranscribeClient:
+    """Get or create the singleton OpenAI transcription client."""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAITranscribeClient()
+    return _openai_client
+
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
@@ -108,8 +122,8 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             )]
         
         try:
-            # Initialize client
-            client = OpenAITranscribeClient()
+            # Reuse the shared client (keeps TCP/TLS connections alive)
+            client = get_openai_client()
             
             # Run transcription in executor to avoid blocking
             loop = asyncio.get_event_loop()
@@ -122,32 +136,23 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                 )
             )
             
-            # Save to output directory if specified
+            # Convert Chinese script in memory so each artifact is written once
+            to_chinese = get_text_converter(os.getenv("CHINESE_OUTPUT_FORMAT"))
+            if to_chinese is not None:
+                result = map_transcript_text(result, to_chinese, joined=True)
+            
+            # Save to output directory if specified (SRT, TXT and JSON,
+            # matching local whisper behavior) in one worker-thread hop
             if output_dir:
-                output_path = Path(output_dir)
-                output_path.mkdir(parents=True, exist_ok=True)
-                
-                base_name = Path(file_path).stem
-                
-                # Save as SRT, TXT, and JSON (matching local whisper behavior)
-                await loop.run_in_executor(
-                    None,
-                    lambda: save_transcript(result, output_path / f"{base_name}.srt", format="srt")
-                )
-                await loop.run_in_executor(
-                    None,
-                    lambda: save_transcript(result, output_path / f"{base_name}.txt", format="txt")
-                )
-                await loop.run_in_executor(
+                srt_content = await loop.run_in_executor(
                     None,
-                    lambda: save_transcript(result, output_path / f"{base_name}.json", format="json")
+                    lambda: save_transcript_outputs(result, output_dir, Path(file_path).stem)
                 )
-                
-                logger.info(f"Saved transcription files to {output_path}")
+                logger.info(f"Saved transcription files to {output_dir}")
+            else:
+                srt_content = transcript_to_srt(result)
             
             # Return SRT content for backward compatibility (matching local whisper)
-            srt_content = transcript_to_srt(result)
-            
             return [TextContent(
                 type="text",
                 text=srt_content
@@ -179,8 +184,8 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             )]
         
         try:
-            # Initialize client
-            client = OpenAITranscribeClient()
+            # Reuse the shared client (keeps TCP/TLS connections alive)
+            client = get_openai_client()
             
             # Run transcription in executor to avoid blocking
             loop = asyncio.get_event_loop()
@@ -193,32 +198,23 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                 )
             )
             
-            # Save to output directory if specified
+            # Convert Chinese script in memory so each artifact is written once
+            to_chinese = get_text_converter(os.getenv("CHINESE_OUTPUT_FORMAT"))
+            if to_chinese is not None:
+                result = map_transcript_text(result, to_chinese, joined=True)
+            
+            # Save to output directory if specified (SRT, TXT and JSON,
+            # matching local whisper behavior) in one worker-thread hop
             if output_dir:
-                output_path = Path(output_dir)
-                output_path.mkdir(parents=True, exist_ok=True)
-                
-                base_name = Path(file_path).stem
-                
-                # Save as SRT, TXT, and JSON (matching local whisper behavior)
-                await loop.run_in_executor(
-                    None,
-                    lambda: save_transcript(result, output_path / f"{base_name}.srt", format="srt")
-                )
-                await loop.run_in_executor(
+                srt_content = await loop.run_in_executor(
                     None,
-                    lambda: save_transcript(result, output_path / f"{base_name}.txt", format="txt")
+                    lambda: save_transcript_outputs(result, output_dir, Path(file_path).stem)
                 )
-                await loop.run_in_executor(
-                    None,
-                    lambda: save_transcript(result, output_path / f"{base_name}.json", format="json")
-                )
-                
-                logger.info(f"Saved transcription files to {output_path}")
+                logger.info(f"Saved transcription files to {output_dir}")
+            else:
+                srt_content = transcript_to_srt(result)
             
             # Return SRT content for backward compatibility (matching local whisper)
-            srt_content = transcript_to_srt(result)
-            
             return [TextContent(
                 type="text",
                 text=srt_content
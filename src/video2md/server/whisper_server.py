@@ -1,22 +1,59 @@
 from video2md.clients.whisper_client import WhisperClient
-from video2md.utils.transcript_converter import save_transcript
+from video2md.models.transcription_models import TranscriptResult
+from video2md.utils.chinese_converter import get_text_converter
+from video2md.utils.transcript_converter import (
+    map_transcript_text, save_transcript_outputs, transcript_to_srt)
+from video2md.utils.video_converter import get_default_converter
 import asyncio
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from mcp.server.fastmcp import FastMCP
-from typing import Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 
 mcp = FastMCP("whisper_server")
 
-# Initialize Whisper client as a singleton
-_whisper_client = None
+# Whisper client singleton, loaded in the background so model loading
+# overlaps MCP startup instead of delaying the first tool call
+_whisper_client_future: Optional[Future] = None
+_whisper_client_lock = threading.Lock()
+
+
+def _start_whisper_client_load() -> Future:
+    """Start loading the Whisper client in a background thread (once)."""
+    global _whisper_client_future
+    with _whisper_client_lock:
+        if _whisper_client_future is None:
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="whisper-load")
+            _whisper_client_future = executor.submit(WhisperClient)
+            executor.shutdown(wait=False)
+        return _whisper_client_future
 
 
 def get_whisper_client() -> WhisperClient:
     """Get or create the singleton Whisper client."""
-    global _whisper_client
-    if _whisper_client is None:
-        _whisper_client = WhisperClient()
-    return _whisper_client
+    global _whisper_client_future
+    future = _start_whisper_client_load()
+    try:
+        return future.result()
+    except Exception:
+        # Allow the next call to retry a failed load
+        with _whisper_client_lock:
+            if _whisper_client_future is future:
+                _whisper_client_future = None
+        raise
+
+
+def _convert_chinese(result: TranscriptResult) -> TranscriptResult:
+    """Apply CHINESE_OUTPUT_FORMAT conversion in memory, if configured."""
+    to_chinese = get_text_converter(os.getenv("CHINESE_OUTPUT_FORMAT"))
+    if to_chinese is not None:
+        result = map_transcript_text(result, to_chinese, joined=True)
+    return result
 
 
 @mcp.tool()
@@ -53,37 +90,28 @@ async def transcribe_media(media_file_path: str, output_dir: Optional[str] = Non
                     f"Media file not found: {media_file_path}")
 
             # Check if it's a video or audio file
-            from video2md.utils.video_converter import VideoConverter
-            converter = VideoConverter()
+            converter = get_default_converter()
 
             # Transcribe (handles both video and audio)
             if converter.is_video_file(media_path):
                 result = client.transcribe_with_video(
-                    video_file_path=str(media_path),
+                    video_file_path=media_path,
                     language=None,  # Auto-detect
                 )
             else:
                 result = client.transcribe(
-                    audio_file_path=str(media_path),
+                    audio_file_path=media_path,
                     language=None,  # Auto-detect
                 )
 
-            # Save to output directory if specified
+            # Convert Chinese script in memory so each artifact is written once
+            result = _convert_chinese(result)
+
+            # Save to output directory if specified, reusing the saved SRT
             if output_dir:
-                output_path = Path(output_dir)
-                output_path.mkdir(parents=True, exist_ok=True)
-
-                # Save as SRT and TXT
-                base_name = media_path.stem
-                save_transcript(result, output_path /
-                                f"{base_name}.srt", format="srt")
-                save_transcript(result, output_path /
-                                f"{base_name}.txt", format="txt")
-                save_transcript(result, output_path /
-                                f"{base_name}.json", format="json")
+                return save_transcript_outputs(result, output_dir, media_path.stem)
 
             # Return SRT content for backward compatibility
-            from video2md.utils.transcript_converter import transcript_to_srt
             return transcript_to_srt(result)
 
         except Exception as e:
@@ -96,7 +124,59 @@ async def transcribe_media(media_file_path: str, output_dir: Optional[str] = Non
     return result
 
 
+@mcp.tool()
+async def transcribe_media_batch(media_file_paths: List[str], output_dirs: List[str]) -> str:
+    """Transcribe several media files in one call using local Whisper.
+
+    Audio extraction for the next video overlaps transcription of the current
+    one, and the model is invoked back to back without per-call round-trips.
+
+    Parameters
+    ----------
+    media_file_paths : List[str]
+      Absolute or relative paths to the media files.
+    output_dirs : List[str]
+      Directory for each file's transcript artifacts (.srt/.txt/.json), in the
+      same order as media_file_paths.
+
+    Returns
+    -------
+    str
+      JSON object mapping each media path to {"srt_path": ...} on success or
+      {"error": ...} on failure.
+    """
+    if len(media_file_paths) != len(output_dirs):
+        raise ValueError(
+            "media_file_paths and output_dirs must have the same length")
+
+    def _transcribe_batch():
+        client = get_whisper_client()
+        outcome = client.transcribe_many(media_file_paths, language=None)
+
+        report: Dict[str, Dict[str, str]] = {}
+        for media_file, error in outcome["failed"]:
+            report[media_file] = {"error": f"Transcription failed: {error}"}
+
+        for media_file, output_dir in zip(media_file_paths, output_dirs):
+            result = outcome["results"].get(media_file)
+            if result is None:
+                continue
+            try:
+                base_name = Path(media_file).stem
+                save_transcript_outputs(_convert_chinese(result), output_dir, base_name)
+                report[media_file] = {
+                    "srt_path": str(Path(output_dir) / f"{base_name}.srt")}
+            except Exception as e:
+                report[media_file] = {"error": f"Saving failed: {e}"}
+
+        return json.dumps(report, ensure_ascii=False)
+
+    return await asyncio.to_thread(_transcribe_batch)
+
+
 def main() -> None:
+    logging.basicConfig(level=logging.WARNING)
+    _start_whisper_client_load()
     mcp.run(transport="stdio")
 
 
@@ -1,11 +1,13 @@
 from pathlib import Path
 from typing import Optional
-import re
+
+from video2md.utils.file_scanner import iter_files
+from video2md.utils.text_io import read_text_file
 
 
 def read_srt_text(srt_path: Path) -> str:
     try:
-        return srt_path.read_text(encoding="utf-8")
+        return read_text_file(srt_path)
     except Exception as e:
         return f"[Error reading SRT {srt_path}: {e}]"
 
@@ -13,56 +15,53 @@ def read_srt_text(srt_path: Path) -> str:
 def _clean_srt_to_plain(text: str) -> str:
     """Convert SRT content to plain transcript by removing indices and timestamps.
 
-    - Drop lines that are only digits (block indices)
-    - Drop lines that contain SRT timecodes (e.g., "00:00:01,000 --> 00:00:05,000")
-    - Collapse multiple blank lines
+    Single pass over the lines with a small state machine:
+    - Drop the index line that starts a cue
+    - Drop the timecode line (e.g., "00:00:01,000 --> 00:00:05,000") after it
+    - Keep text lines; collapse runs of blank lines into one
     """
-    lines = text.splitlines()
     out_lines = []
-    timecode_re = re.compile(
-        r"\d{2}:\d{2}:\d{2},\d{3}\s+-->\s+\d{2}:\d{2}:\d{2},\d{3}")
-    for line in lines:
-        if not line:
-            # keep as separator (later dedup)
-            out_lines.append("")
+    expect_index, expect_timecode = True, False
+    # A UTF-8 BOM would hide the first cue's index from isdigit()
+    for line in text.lstrip("\ufeff").splitlines():
+        if not line.strip():
+            # Cue separator: keep one blank line, then expect a new cue
+            if out_lines and out_lines[-1]:
+                out_lines.append("")
+            expect_index, expect_timecode = True, False
             continue
-        if line.isdigit():
+        if expect_index and line.strip().isdigit():
+            expect_index, expect_timecode = False, True
             continue
-        if timecode_re.search(line):
+        if (expect_index or expect_timecode) and "-->" in line:
+            expect_index, expect_timecode = False, False
             continue
+        expect_index, expect_timecode = False, False
         out_lines.append(line)
-    # Deduplicate excessive blank lines
-    cleaned = []
-    last_blank = False
-    for l in out_lines:
-        if l.strip() == "":
-            if not last_blank:
-                cleaned.append("")
-            last_blank = True
-        else:
-            cleaned.append(l)
-            last_blank = False
-    return "\n".join(cleaned).strip()
+    return "\n".join(out_lines).strip()
 
 
 def read_transcript_text(transcript_or_srt_path: Path) -> str:
     """Read a transcript, preferring TXT if available; if SRT, return cleaned plain text.
 
     If given a .srt path, prefer a sibling .txt if it exists. If only SRT exists,
-    strip timecodes and indices to reduce tokens.
+    strip timecodes and indices to reduce tokens. Files are read as bytes and
+    decoded once (read_text_file) rather than through a text-mode stream.
     """
     p = Path(transcript_or_srt_path)
     try:
         if p.suffix.lower() == ".srt":
-            txt = p.with_suffix(".txt")
-            if txt.exists():
-                return txt.read_text(encoding="utf-8")
+            # Try the .txt directly instead of stat()ing it first
+            try:
+                return read_text_file(p.with_suffix(".txt"))
+            except FileNotFoundError:
+                pass
             # fallback: clean srt
-            return _clean_srt_to_plain(p.read_text(encoding="utf-8"))
+            return _clean_srt_to_plain(read_text_file(p))
         if p.suffix.lower() == ".txt":
-            return p.read_text(encoding="utf-8")
+            return read_text_file(p)
         # Unknown extension: try to read; if it looks like SRT, clean
-        data = p.read_text(encoding="utf-8")
+        data = read_text_file(p)
         if "-->" in data:
             return _clean_srt_to_plain(data)
         return data
@@ -70,35 +69,47 @@ def read_transcript_text(transcript_or_srt_path: Path) -> str:
         return f"[Error reading transcript {p}: {e}]"
 
 
+MEDIA_EXTENSIONS = frozenset({
+    ".mp4",
+    ".avi",
+    ".mkv",
+    ".mov",
+    ".wmv",
+    ".flv",
+    ".webm",
+    ".mp3",
+    ".wav",
+    ".flac",
+    ".aac",
+    ".ogg",
+    ".m4a",
+    ".wma",
+})
+
+_MEDIA_PATTERNS = tuple(f"*{ext}" for ext in MEDIA_EXTENSIONS)
+
+
 def find_moved_media(base_name: str, media_dir: Path) -> Optional[Path]:
-    if not media_dir.exists():
-        return None
-    exts = {
-        ".mp4",
-        ".avi",
-        ".mkv",
-        ".mov",
-        ".wmv",
-        ".flv",
-        ".webm",
-        ".mp3",
-        ".wav",
-        ".flac",
-        ".aac",
-        ".ogg",
-        ".m4a",
-        ".wma",
-    }
-    candidates = [
+    # One scandir pass over this folder only (a missing folder yields nothing).
+    # Names decide the match; mtimes are fetched only to break ties between
+    # suffixed copies when there is no exact match.
+    candidates = sorted(
         p
-        for p in media_dir.iterdir()
-        if p.is_file()
-        and p.suffix.lower() in exts
-        and (p.stem == base_name or p.stem.startswith(base_name + "_"))
-    ]
+        for p in iter_files(media_dir, _MEDIA_PATTERNS)
+        if p.stem == base_name or p.stem.startswith(base_name + "_")
+    )
     if not candidates:
         return None
-    exact = [p for p in candidates if p.stem == base_name]
-    if exact:
-        return exact[0]
-    return max(candidates, key=lambda p: p.stat().st_mtime)
+    for p in candidates:
+        if p.stem == base_name:
+            return p
+    if len(candidates) == 1:
+        return candidates[0]
+
+    def _mtime(p: Path) -> float:
+        try:
+            return p.stat().st_mtime
+        except OSError:
+            return float("-inf")
+
+    return max(candidates, key=_mtime)
@@ -4,6 +4,7 @@ Provides a minimal CLI to convert a video to audio using VideoConverter.
 """
 from __future__ import annotations
 from video2md.utils.video_converter import VideoConverter  # type: ignore
+from video2md.utils.file_scanner import DEFAULT_EXCLUDED_DIRS, iter_by_extension  # type: ignore
 
 import argparse
 from pathlib import Path
@@ -23,7 +24,8 @@ def main() -> int:
     parser = argparse.ArgumentParser(
         description="Convert a video to audio using FFmpeg (wrapper for VideoConverter)"
     )
-    parser.add_argument("input", help="Path to the input video file")
+    parser.add_argument("input", nargs="+",
+                        help="Path(s) to the input video file(s), or a directory to convert recursively")
     parser.add_argument("--format", default="wav",
                         help="Audio format (wav, mp3, flac, aac)")
     parser.add_argument("--out", dest="output", default=None,
@@ -36,13 +38,46 @@ def main() -> int:
                         help="Channels (1 or 2)")
     parser.add_argument("--no-overwrite", dest="overwrite",
                         action="store_false", help="Do not overwrite")
+    parser.add_argument("--workers", dest="max_workers", type=int, default=None,
+                        help="Parallel ffmpeg processes for multiple inputs (default: CPU count)")
 
     args = parser.parse_args()
 
     conv = VideoConverter()
+    is_dir_input = len(args.input) == 1 and Path(args.input[0]).is_dir()
+    if len(args.input) > 1 or is_dir_input:
+        if args.output:
+            print("Error: --out cannot be used with multiple inputs, use --out-dir")
+            return 1
+        if is_dir_input:
+            inputs = (
+                path for path, _ in iter_by_extension(
+                    args.input[0],
+                    {"video": VideoConverter.SUPPORTED_VIDEO_FORMATS},
+                    recursive=True,
+                    exclude_dirs=DEFAULT_EXCLUDED_DIRS,
+                )
+            )
+        else:
+            inputs = args.input
+        results = conv.batch_video_to_audio(
+            inputs,
+            output_dir=Path(args.output_dir) if args.output_dir else None,
+            audio_format=args.format,
+            max_workers=args.max_workers,
+            sample_rate=args.sample_rate,
+            channels=args.channels,
+            overwrite=args.overwrite,
+        )
+        for path in results["converted"]:
+            print(path)
+        for path, error in results["failed"]:
+            print(f"Error: {path}: {error}")
+        return 1 if results["failed"] else 0
+
     try:
         result = conv.video_to_audio(
-            input_path=Path(args.input),
+            input_path=Path(args.input[0]),
             output_path=Path(args.output) if args.output else None,
             output_dir=Path(args.output_dir) if args.output_dir else None,
             audio_format=args.format,
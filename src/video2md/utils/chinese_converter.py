@@ -5,20 +5,52 @@ Convert between Simplified and Traditional Chinese in text files
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
-# Import zhconv for Traditional/Simplified Chinese conversion
+from .file_scanner import find_files
+from .text_io import read_text_file, write_text_file
+
+# Import a Traditional/Simplified Chinese conversion backend.
+# Prefer zhconv-rs (Rust, single-pass Aho-Corasick) and fall back to pure-Python zhconv.
 try:
-    import zhconv
+    import zhconv_rs
+    ZHCONV_BACKEND = "zhconv-rs"
     ZHCONV_AVAILABLE = True
 except ImportError:
-    ZHCONV_AVAILABLE = False
+    try:
+        import zhconv
+        ZHCONV_BACKEND = "zhconv"
+        ZHCONV_AVAILABLE = True
+    except ImportError:
+        ZHCONV_BACKEND = None
+        ZHCONV_AVAILABLE = False
+
+# Target variant for each supported format
+_TARGET_VARIANTS = {
+    "simplified": "zh-cn",
+    "traditional": "zh-tw",
+}
+
+
+@lru_cache(maxsize=None)
+def _get_converter(variant: str) -> Callable[[str], str]:
+    """Build the conversion function for a variant once and reuse it"""
+    if ZHCONV_BACKEND == "zhconv-rs":
+        make_converter = getattr(zhconv_rs, "make_converter", None)
+        if make_converter is not None:
+            return make_converter(variant)
+        return lambda text: zhconv_rs.zhconv(text, variant)
+    return lambda text: zhconv.convert(text, variant)
 
 
 def convert_chinese_text(text: str, target_format: str = "simplified") -> str:
     """
-    Convert between Simplified and Traditional Chinese using zhconv
+    Convert between Simplified and Traditional Chinese using zhconv-rs or zhconv
 
     Args:
         text: Input Chinese text
@@ -29,23 +61,55 @@ def convert_chinese_text(text: str, target_format: str = "simplified") -> str:
     """
     if not ZHCONV_AVAILABLE:
         print("Error: zhconv not installed. Chinese conversion disabled.")
-        print("To enable conversion, install zhconv: pip install zhconv")
+        print("To enable conversion, install zhconv-rs or zhconv: pip install zhconv-rs")
+        return text
+
+    variant = _TARGET_VARIANTS.get(target_format.lower())
+    if variant is None:
+        print(
+            f"Warning: Unknown target format '{target_format}'. Supported: 'simplified', 'traditional'")
         return text
 
     try:
-        if target_format.lower() == "simplified":
-            return zhconv.convert(text, 'zh-cn')
-        elif target_format.lower() == "traditional":
-            return zhconv.convert(text, 'zh-tw')
-        else:
-            print(
-                f"Warning: Unknown target format '{target_format}'. Supported: 'simplified', 'traditional'")
-            return text
+        return _get_converter(variant)(text)
     except Exception as e:
         print(f"Warning: Chinese conversion failed: {e}")
         return text
 
 
+def get_text_converter(target_format: Optional[str]) -> Optional[Callable[[str], str]]:
+    """
+    Get an in-memory converter for target_format, if conversion is possible
+
+    Lets producers such as the transcription servers convert text before it is
+    first written, instead of re-reading and rewriting the files afterwards.
+    Warnings go to stderr so stdio MCP servers can call this safely.
+
+    Args:
+        target_format: "simplified", "traditional", or None/empty to disable
+
+    Returns:
+        Function converting a string, or None when conversion is disabled,
+        the format is unknown or no backend is installed
+    """
+    if not target_format:
+        return None
+
+    variant = _TARGET_VARIANTS.get(target_format.strip().lower())
+    if variant is None:
+        print(
+            f"Warning: Unknown target format '{target_format}'. Supported: 'simplified', 'traditional'",
+            file=sys.stderr)
+        return None
+
+    if not ZHCONV_AVAILABLE:
+        print("Warning: zhconv not installed. Chinese conversion disabled.",
+              file=sys.stderr)
+        return None
+
+    return _get_converter(variant)
+
+
 def convert_file(input_file: str, output_file: str = None, target_format: str = "simplified"):
     """
     Convert Chinese characters in a text file
@@ -59,8 +123,8 @@ def convert_file(input_file: str, output_file: str = None, target_format: str =
         Path to output file
     """
     if not ZHCONV_AVAILABLE:
-        print("Error: zhconv package is required for Chinese conversion.")
-        print("Please install it with: pip install zhconv")
+        print("Error: zhconv-rs or zhconv package is required for Chinese conversion.")
+        print("Please install it with: pip install zhconv-rs")
         sys.exit(1)
 
     input_path = Path(input_file)
@@ -69,8 +133,7 @@ def convert_file(input_file: str, output_file: str = None, target_format: str =
 
     # Read input file
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_text_file(input_path)
     except UnicodeDecodeError:
         print("Error: Failed to read file. Please ensure the file is UTF-8 encoded.")
         sys.exit(1)
@@ -85,10 +148,7 @@ def convert_file(input_file: str, output_file: str = None, target_format: str =
 
     # Write output file
     output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(converted_content)
+    write_text_file(output_path, converted_content)
 
     print(f"Converted {input_file} -> {output_file}")
     print(f"Format: {target_format} Chinese")
@@ -96,6 +156,64 @@ def convert_file(input_file: str, output_file: str = None, target_format: str =
     return str(output_path)
 
 
+def batch_convert_files(input_dir: str, target_format: str = "simplified",
+                        output_dir: str = None, max_workers: int = None) -> Dict[str, List]:
+    """
+    Convert all .srt, .txt and .vtt files in a directory in parallel
+
+    Files are independent, so they are converted concurrently: in threads when
+    zhconv-rs is used (it runs outside the GIL), otherwise in processes.
+
+    Args:
+        input_dir: Directory containing text files
+        target_format: "simplified" or "traditional"
+        output_dir: Directory for converted files (optional, defaults to
+            writing next to each input file with a format suffix)
+        max_workers: Maximum parallel conversions (default: CPU count)
+
+    Returns:
+        Dict with 'converted' (list of output paths) and 'failed'
+        (list of (input path, error message) tuples)
+    """
+    text_files = find_files(input_dir, ["*.srt", "*.txt", "*.vtt"])
+    results: Dict[str, List] = {"converted": [], "failed": []}
+    if not text_files:
+        return results
+
+    # Create the output directory once, before any worker starts
+    suffix = "_simplified" if target_format == "simplified" else "_traditional"
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(text_files))
+
+    use_threads = ZHCONV_BACKEND == "zhconv-rs" or len(text_files) == 1
+    executor_cls = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+
+    with executor_cls(max_workers=max_workers) as executor:
+        futures = {}
+        for file_path in text_files:
+            output_file = None
+            if output_dir is not None:
+                output_file = str(Path(output_dir) /
+                                  f"{file_path.stem}{suffix}{file_path.suffix}")
+            future = executor.submit(
+                convert_file, str(file_path), output_file, target_format)
+            futures[future] = file_path
+
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                results["converted"].append(future.result())
+            except (Exception, SystemExit) as e:
+                # convert_file exits on unreadable input; report it per file instead
+                print(f"Error converting {file_path}: {e}")
+                results["failed"].append((str(file_path), str(e)))
+
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert between Simplified and Traditional Chinese in text files"
@@ -106,7 +224,7 @@ def main():
     )
     parser.add_argument(
         "-o", "--output",
-        help="Output file path (optional)"
+        help="Output file path, or output directory with --batch (optional)"
     )
     parser.add_argument(
         "-f", "--format",
@@ -119,6 +237,12 @@ def main():
         action="store_true",
         help="Process all .srt and .txt files in the input directory"
     )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Parallel conversions in batch mode (default: CPU count)"
+    )
 
     args = parser.parse_args()
 
@@ -129,21 +253,19 @@ def main():
                 print("Error: For batch processing, input must be a directory")
                 sys.exit(1)
 
-            # Find all text files
-            text_files = []
-            for pattern in ["*.srt", "*.txt", "*.vtt"]:
-                text_files.extend(input_path.glob(pattern))
+            results = batch_convert_files(
+                str(input_path),
+                target_format=args.format,
+                output_dir=args.output,
+                max_workers=args.workers,
+            )
 
-            if not text_files:
+            if not results["converted"] and not results["failed"]:
                 print("No text files found in the directory")
                 sys.exit(1)
 
-            print(f"Found {len(text_files)} text files to convert...")
-            for file_path in text_files:
-                try:
-                    convert_file(str(file_path), target_format=args.format)
-                except Exception as e:
-                    print(f"Error converting {file_path}: {e}")
+            print(f"Converted {len(results['converted'])} text files, "
+                  f"{len(results['failed'])} failed")
         else:
             convert_file(args.input_file, args.output, args.format)
 
@@ -8,8 +8,18 @@ Validates that required external dependencies (ffmpeg, node.js) are installed
 import subprocess
 import sys
 import platform
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+# Seconds a command probe result stays valid
+_CHECK_CACHE_TTL = 30.0
+
+# (command, version args) -> (timestamp, result)
+_CHECK_CACHE: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, Tuple[bool, Optional[str]]]] = {}
+_CHECK_CACHE_LOCK = threading.Lock()
 
 
 class DependencyChecker:
@@ -29,7 +39,23 @@ class DependencyChecker:
         """
         if version_args is None:
             version_args = ['--version']
-        
+
+        # Probing spawns a subprocess; reuse a recent result for the same command
+        key = (command, tuple(version_args))
+        now = time.monotonic()
+        with _CHECK_CACHE_LOCK:
+            cached = _CHECK_CACHE.get(key)
+        if cached is not None and now - cached[0] < _CHECK_CACHE_TTL:
+            return cached[1]
+
+        result = DependencyChecker._run_version_command(command, version_args)
+        with _CHECK_CACHE_LOCK:
+            _CHECK_CACHE[key] = (now, result)
+        return result
+
+    @staticmethod
+    def _run_version_command(command: str, version_args: List[str]) -> Tuple[bool, Optional[str]]:
+        """Run '<command> <version_args>' and return (is_available, version_string)"""
         try:
             result = subprocess.run(
                 [command] + version_args,
@@ -128,19 +154,21 @@ class DependencyChecker:
         Returns:
             Tuple of (all_available, list_of_messages)
         """
-        messages = []
-        all_ok = True
-        
+        checks = []
         if require_ffmpeg:
-            ffmpeg_ok, ffmpeg_msg = DependencyChecker.check_ffmpeg()
-            messages.append(ffmpeg_msg)
-            all_ok = all_ok and ffmpeg_ok
-        
+            checks.append(DependencyChecker.check_ffmpeg)
         if require_node:
-            node_ok, node_msg = DependencyChecker.check_node()
-            messages.append(node_msg)
-            all_ok = all_ok and node_ok
-        
+            checks.append(DependencyChecker.check_node)
+
+        if not checks:
+            return True, []
+
+        # Probes are independent subprocesses, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = list(executor.map(lambda check: check(), checks))
+
+        all_ok = all(ok for ok, _ in results)
+        messages = [msg for _, msg in results]
         return all_ok, messages
 
     @staticmethod
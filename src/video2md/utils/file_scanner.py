@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File Scanner
+Find files matching glob patterns with a single directory traversal
+"""
+
+import fnmatch
+import os
+import re
+from pathlib import Path
+from typing import (AbstractSet, Callable, Iterable, Iterator, List, Mapping,
+                    Optional, Tuple, Union)
+
+# Directories that never hold user media; pass as exclude_dirs to prune them
+DEFAULT_EXCLUDED_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv"})
+
+# Extension part of a glob that can be matched with a set lookup ('*.srt')
+_PLAIN_EXTENSION = re.compile(r"\.[A-Za-z0-9_-]+")
+
+
+def _compile_patterns(patterns: Iterable[str]) -> Callable[[str], object]:
+    """
+    Build one name matcher for a set of glob patterns
+
+    Plain extension globs like '*.srt' become a single splitext plus set lookup;
+    anything else is combined into one case-insensitive regex.
+    """
+    patterns = list(patterns)
+    extensions = set()
+    for pattern in patterns:
+        ext = pattern[1:]
+        if not (pattern.startswith("*.") and _PLAIN_EXTENSION.fullmatch(ext)):
+            break
+        extensions.add(ext.lower())
+    else:
+        return lambda name: os.path.splitext(name)[1].lower() in extensions
+
+    return re.compile(
+        "|".join(fnmatch.translate(p) for p in patterns),
+        re.IGNORECASE
+    ).match
+
+
+def make_extension_classifier(
+        extension_sets: Mapping[str, AbstractSet[str]]) -> Callable[[str], Optional[str]]:
+    """
+    Build a function mapping a file name to its extension category
+
+    Args:
+        extension_sets: Category name -> set of extensions (with dot)
+
+    Returns:
+        Function returning the category for a name, or None if it matches
+        none; a file matching several categories gets the first one
+    """
+    lookup = {}
+    for category, extensions in extension_sets.items():
+        for ext in extensions:
+            lookup.setdefault(ext.lower(), category)
+
+    def classify(name: str) -> Optional[str]:
+        return lookup.get(os.path.splitext(name)[1].lower())
+
+    return classify
+
+
+def _iter_entries(directory: Union[str, Path],
+                  matcher: Callable[[str], object],
+                  recursive: bool,
+                  exclude_dirs: AbstractSet[str] = frozenset()) -> Iterator[Tuple[os.DirEntry, object]]:
+    """
+    Yield (entry, match) for files accepted by matcher, walking the tree once
+    with os.scandir; match is the matcher's truthy result for the entry name.
+    Subdirectories named in exclude_dirs are pruned before they are opened.
+    """
+    pending = [os.fspath(directory)]
+
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and entry.name not in exclude_dirs:
+                            pending.append(entry.path)
+                    elif entry.is_file():
+                        match = matcher(entry.name)
+                        if match:
+                            yield entry, match
+        except OSError:
+            # Unreadable directory: skip it like glob does
+            continue
+
+
+def iter_files(directory: Union[str, Path],
+               patterns: Iterable[str],
+               recursive: bool = False,
+               exclude_dirs: AbstractSet[str] = frozenset()) -> Iterator[Path]:
+    """
+    Yield files whose names match any of the glob patterns as they are found
+
+    Unlike find_files, nothing is collected or sorted, so callers can start
+    working on the first match while the rest of the tree is still being walked.
+
+    Args:
+        directory: Directory to search
+        patterns: Glob patterns matched against file names
+        recursive: Whether to descend into subdirectories
+        exclude_dirs: Subdirectory names not to descend into
+
+    Yields:
+        Matching file paths in directory scan order
+    """
+    matcher = _compile_patterns(patterns)
+    for entry, _ in _iter_entries(directory, matcher, recursive, exclude_dirs):
+        yield Path(entry.path)
+
+
+def find_files(directory: Union[str, Path],
+               patterns: Iterable[str],
+               recursive: bool = False,
+               exclude_dirs: AbstractSet[str] = frozenset()) -> List[Path]:
+    """
+    Find files whose names match any of the glob patterns
+
+    The directory tree is walked once with os.scandir and every entry name is
+    tested against one precompiled matcher, instead of one glob walk per pattern.
+
+    Args:
+        directory: Directory to search
+        patterns: Glob patterns matched against file names (e.g. ['*.srt', '*.txt'])
+        recursive: Whether to descend into subdirectories
+        exclude_dirs: Subdirectory names not to descend into
+
+    Returns:
+        Sorted list of matching file paths
+    """
+    return sorted(iter_files(directory, patterns, recursive, exclude_dirs))
+
+
+def find_files_with_stats(directory: Union[str, Path],
+                          patterns: Iterable[str],
+                          recursive: bool = False,
+                          exclude_dirs: AbstractSet[str] = frozenset()) -> List[Tuple[Path, os.stat_result]]:
+    """
+    Find matching files together with their stat results
+
+    Stats come from DirEntry.stat() during the walk, which reuses what the
+    directory scan already fetched where the OS allows, so callers that need
+    sizes or mtimes do not stat every path a second time.
+
+    Args:
+        directory: Directory to search
+        patterns: Glob patterns matched against file names
+        recursive: Whether to descend into subdirectories
+        exclude_dirs: Subdirectory names not to descend into
+
+    Returns:
+        Sorted list of (path, stat_result) tuples
+    """
+    matcher = _compile_patterns(patterns)
+    found = []
+    for entry, _ in _iter_entries(directory, matcher, recursive, exclude_dirs):
+        try:
+            found.append((Path(entry.path), entry.stat()))
+        except OSError:
+            # File vanished between listing and stat
+            continue
+    return sorted(found, key=lambda item: item[0])
+
+
+def iter_by_extension(directory: Union[str, Path],
+                      extension_sets: Mapping[str, AbstractSet[str]],
+                      recursive: bool = False,
+                      exclude_dirs: AbstractSet[str] = frozenset()) -> Iterator[Tuple[Path, str]]:
+    """
+    Yield files whose extension is in one of several categories
+
+    One walk classifies every file, so callers that need e.g. video, audio and
+    subtitle files do not scan the tree once per category or per pattern.
+
+    Args:
+        directory: Directory to search
+        extension_sets: Category name -> set of lowercase extensions (with dot)
+        recursive: Whether to descend into subdirectories
+        exclude_dirs: Subdirectory names not to descend into
+
+    Yields:
+        (path, category) tuples in directory scan order; a file matching
+        several categories is reported for the first one
+    """
+    classify = make_extension_classifier(extension_sets)
+    for entry, category in _iter_entries(directory, classify, recursive, exclude_dirs):
+        yield Path(entry.path), category
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Text File I/O
+Read and write whole UTF-8 text files with large buffers
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Union
+
+# Transcripts are read and written whole, so use 64 KiB buffers instead of
+# the default 4-8 KiB to cut the number of read/write syscalls
+IO_BUFFER_SIZE = 64 * 1024
+
+# Inputs above this size get a sequential read-ahead hint where supported
+_FADVISE_THRESHOLD = 1024 * 1024
+
+
+def read_text_file(path: Union[str, Path], encoding: str = 'utf-8') -> str:
+    """
+    Read a whole text file and decode it once
+
+    Args:
+        path: File to read
+        encoding: Text encoding (default: utf-8)
+
+    Returns:
+        File content
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid in the given encoding
+    """
+    with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                if os.fstat(f.fileno()).st_size > _FADVISE_THRESHOLD:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                # The hint is advisory; ignore filesystems that reject it
+                pass
+        data = f.read()
+    return data.decode(encoding)
+
+
+def write_text_file(path: Union[str, Path], content: str, encoding: str = 'utf-8') -> None:
+    """
+    Encode text once and write it with a single buffered write
+
+    The data goes to a sibling temporary file that is then renamed over path
+    with os.replace, so an interrupted run never leaves a truncated file that
+    a later run would mistake for finished output. The parent directory is
+    created only if opening the file fails because it is missing, so repeated
+    writes into one directory cost no mkdir calls.
+
+    Args:
+        path: File to write (overwritten if it exists)
+        content: Text to write
+        encoding: Text encoding (default: utf-8)
+    """
+    data = content.encode(encoding)
+    # Per-process and per-thread name so concurrent writers (including
+    # asyncio.to_thread workers in one process) never share a temporary file;
+    # unlike mkstemp, open() keeps the usual umask-based permissions
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        f = open(tmp_path, 'wb', buffering=IO_BUFFER_SIZE)
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        f = open(tmp_path, 'wb', buffering=IO_BUFFER_SIZE)
+    try:
+        with f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
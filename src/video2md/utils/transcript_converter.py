@@ -6,13 +6,24 @@ import json
 import logging
 from datetime import timedelta
 from pathlib import Path
-from typing import Union
+from typing import Callable, Dict, Optional, Union
 from dataclasses import asdict
 
 from video2md.models.transcription_models import TranscriptResult, TranscriptSegment
+from video2md.utils.text_io import read_text_file, write_text_file
+
+# orjson serializes dataclasses natively and emits UTF-8 directly; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# ASCII record separator; never appears in transcripts and is left alone by
+# character-level transforms
+_RECORD_SEPARATOR = "\x1e"
+
 
 def format_timestamp_srt(seconds: float) -> str:
     """
@@ -151,6 +162,12 @@ def transcript_to_json(transcript: TranscriptResult, pretty: bool = True) -> str
     Returns:
         JSON formatted string
     """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(transcript, option=option).decode("utf-8")
+
     data = asdict(transcript)
     
     if pretty:
@@ -159,6 +176,47 @@ def transcript_to_json(transcript: TranscriptResult, pretty: bool = True) -> str
         return json.dumps(data, ensure_ascii=False)
 
 
+def map_transcript_text(
+    transcript: TranscriptResult,
+    func: Callable[[str], str],
+    joined: bool = False
+) -> TranscriptResult:
+    """
+    Apply a text transformation to the full text and every segment
+    
+    Args:
+        transcript: Transcript result to transform
+        func: Function applied to each text string (e.g. Chinese conversion)
+        joined: Call func once on all texts joined by a record separator and
+                split the output, instead of once per segment. Only valid for
+                transforms that map characters independently (like Chinese
+                script conversion); falls back to per-text calls if the
+                separator count changes
+        
+    Returns:
+        New TranscriptResult with transformed text and unchanged timings
+    """
+    texts = [transcript.full_text] + [seg.text for seg in transcript.segments]
+    converted = None
+    if joined:
+        # One call instead of thousands amortizes the per-call (FFI) overhead
+        converted = func(_RECORD_SEPARATOR.join(texts)).split(_RECORD_SEPARATOR)
+        if len(converted) != len(texts):
+            converted = None
+    if converted is None:
+        converted = [func(text) for text in texts]
+    
+    return TranscriptResult(
+        language=transcript.language,
+        full_text=converted[0],
+        segments=[
+            TranscriptSegment(start=seg.start, end=seg.end, text=text)
+            for seg, text in zip(transcript.segments, converted[1:])
+        ],
+        raw=transcript.raw
+    )
+
+
 def save_transcript(
     transcript: TranscriptResult,
     output_path: Union[str, Path],
@@ -176,7 +234,6 @@ def save_transcript(
         **kwargs: Additional arguments passed to format-specific functions
     """
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Auto-detect format from extension
     if format == "auto":
@@ -201,12 +258,62 @@ def save_transcript(
     else:
         raise ValueError(f"Unsupported format: {format}")
     
-    # Write to file
-    output_path.write_text(content, encoding="utf-8")
+    # Write to file (creates the parent directory on first use)
+    write_text_file(output_path, content)
     
     return str(output_path)
 
 
+def save_transcript_outputs(
+    transcript: TranscriptResult,
+    output_dir: Union[str, Path],
+    base_name: str
+) -> str:
+    """
+    Save a transcript as <base_name>.txt, .json and .srt under output_dir
+    
+    Every format is rendered from the in-memory result; the SRT is written
+    last because its presence marks a media file as transcribed.
+    
+    Args:
+        transcript: Transcript result to save
+        output_dir: Directory for the files (created on first write)
+        base_name: File name without extension
+        
+    Returns:
+        The SRT content, so callers replying with it need not render it again
+    """
+    output_dir = Path(output_dir)
+    srt_content = transcript_to_srt(transcript)
+    write_text_file(output_dir / f"{base_name}.txt", transcript_to_txt(transcript))
+    write_text_file(output_dir / f"{base_name}.json", transcript_to_json(transcript))
+    write_text_file(output_dir / f"{base_name}.srt", srt_content)
+    return srt_content
+
+
+def write_batch_outputs(outcome: Dict[str, object], fmt: str, output_dir: Optional[str]) -> None:
+    """
+    Save or print each result of a client CLI --batch run and report failures
+    
+    Args:
+        outcome: transcribe_many result with "results" and "failed" entries
+        fmt: "json" for JSON output, anything else for plain text
+        output_dir: Directory for <stem>.json/.txt files, or None to print
+    """
+    suffix = ".json" if fmt == "json" else ".txt"
+    for media_file, result in outcome["results"].items():
+        output = transcript_to_json(result) if fmt == "json" else result.full_text
+        if output_dir:
+            output_path = Path(output_dir) / f"{Path(media_file).stem}{suffix}"
+            write_text_file(output_path, output)
+            print(f"Results saved to: {output_path}")
+        else:
+            print(f"==> {media_file} <==")
+            print(output)
+    for media_file, error in outcome["failed"]:
+        print(f"Error: {media_file}: {error}")
+
+
 def load_transcript_from_json(json_path: Union[str, Path]) -> TranscriptResult:
     """
     Load TranscriptResult from JSON file
@@ -222,7 +329,20 @@ def load_transcript_from_json(json_path: Union[str, Path]) -> TranscriptResult:
     if not json_path.exists():
         raise FileNotFoundError(f"JSON file not found: {json_path}")
     
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+    return transcript_from_json(read_text_file(json_path))
+
+
+def transcript_from_json(text: str) -> TranscriptResult:
+    """
+    Parse a transcript_to_json() string back into a TranscriptResult
+    
+    Args:
+        text: JSON text
+        
+    Returns:
+        TranscriptResult object
+    """
+    data = json.loads(text)
     
     # Reconstruct segments
     segments = [
@@ -5,30 +5,61 @@ Video to Audio Converter Tool
 Supports converting various video formats to audio formats for Whisper transcription
 """
 
+import os
+import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 import logging
 from .dependency_checker import DependencyChecker
 
 # Get logger (don't configure here, let the application configure it)
 logger = logging.getLogger(__name__)
 
+# Probed durations keyed by (path, mtime_ns, size), so unchanged files are
+# not probed again within a process
+_DURATION_CACHE: Dict[Tuple[str, int, int], Optional[float]] = {}
+_DURATION_CACHE_LOCK = threading.Lock()
+
+# "silence_start: 12.34" / "silence_end: 15.6 | ..." lines from silencedetect
+_SILENCE_EVENT = re.compile(r"silence_(start|end): (-?\d+(?:\.\d+)?)")
+
 
 class VideoConverter:
     """Video to Audio Converter"""
 
     # Supported video formats
-    SUPPORTED_VIDEO_FORMATS = {
+    SUPPORTED_VIDEO_FORMATS = frozenset({
         '.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm',
         '.m4v', '.3gp', '.ogv', '.ts', '.mts', '.m2ts'
-    }
+    })
 
     # Supported audio formats
-    SUPPORTED_AUDIO_FORMATS = {
+    SUPPORTED_AUDIO_FORMATS = frozenset({
         '.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma'
+    })
+
+    # Extension -> 'video' / 'audio', so a file is classified with one lookup
+    _MEDIA_KINDS = {
+        **dict.fromkeys(SUPPORTED_AUDIO_FORMATS, 'audio'),
+        **dict.fromkeys(SUPPORTED_VIDEO_FORMATS, 'video'),
+    }
+
+    # Audio codecs that can be stream-copied into a pipeable container,
+    # mapped to (ffmpeg output format, file extension)
+    COPYABLE_AUDIO_CODECS = {
+        'mp3': ('mp3', 'mp3'),
+        'opus': ('ogg', 'ogg'),
+        'vorbis': ('ogg', 'ogg'),
+        'flac': ('flac', 'flac'),
     }
 
+    # Duration buckets in seconds used to group media of similar length
+    DURATION_BUCKETS = ((0, 10), (10, 30), (30, 120), (120, float('inf')))
+
     def __init__(self):
         """Initialize converter, check if ffmpeg is available"""
         self._check_ffmpeg()
@@ -43,11 +74,26 @@ class VideoConverter:
 
     def is_video_file(self, file_path: Union[str, Path]) -> bool:
         """Check if file is a supported video format"""
-        return Path(file_path).suffix.lower() in self.SUPPORTED_VIDEO_FORMATS
+        return self.media_kind(file_path) == 'video'
 
     def is_audio_file(self, file_path: Union[str, Path]) -> bool:
         """Check if file is a supported audio format"""
-        return Path(file_path).suffix.lower() in self.SUPPORTED_AUDIO_FORMATS
+        return self.media_kind(file_path) == 'audio'
+
+    def media_kind(self, file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Classify a file by its extension
+
+        Callers that branch on video vs. audio should call this once instead
+        of is_video_file() followed by is_audio_file().
+
+        Args:
+            file_path: File path (only the extension is looked at)
+
+        Returns:
+            'video', 'audio', or None if the format is not supported
+        """
+        return self._MEDIA_KINDS.get(os.path.splitext(file_path)[1].lower())
 
     def video_to_audio(self,
                        input_path: Union[str, Path],
@@ -156,6 +202,391 @@ class VideoConverter:
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def _pipe_audio(self,
+                    input_path: Union[str, Path],
+                    output_args: List[str],
+                    input_args: Sequence[str] = ()) -> bytes:
+        """
+        Run ffmpeg on a media file and return the encoded audio from its stdout
+
+        Args:
+            input_path: Input video or audio file path
+            output_args: ffmpeg output options (codec, rate, channels, -f format)
+            input_args: ffmpeg input options placed before -i (e.g. -ss/-t)
+
+        Returns:
+            Encoded audio bytes
+
+        Raises:
+            FileNotFoundError: Input file does not exist
+            ValueError: Unsupported format
+            RuntimeError: Error during conversion process
+        """
+        input_path = Path(input_path)
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file does not exist: {input_path}")
+
+        if not (self.is_video_file(input_path) or self.is_audio_file(input_path)):
+            raise ValueError(f"Unsupported media format: {input_path.suffix}")
+
+        cmd = [
+            'ffmpeg',
+            '-loglevel', 'error',
+            *input_args,
+            '-i', str(input_path),
+            '-vn',
+            *output_args,
+            'pipe:1'                      # Write to stdout instead of a file
+        ]
+
+        logger.info(f"Decoding audio in memory: {input_path.name}")
+        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+                timeout=600  # 10 minutes timeout
+            )
+        except subprocess.TimeoutExpired as e:
+            error_msg = f"FFmpeg conversion timed out after 600 seconds"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+        except subprocess.CalledProcessError as e:
+            error_msg = f"FFmpeg conversion failed with exit code {e.returncode}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        if not result.stdout:
+            raise RuntimeError("Conversion completed but produced no audio")
+        return result.stdout
+
+    def video_to_pcm(self,
+                     input_path: Union[str, Path],
+                     sample_rate: int = 16000):
+        """
+        Decode a video's audio track to mono float32 samples in memory
+
+        The result can be passed to faster-whisper directly, which avoids
+        writing a WAV file and decoding it again.
+
+        Args:
+            input_path: Input video file path
+            sample_rate: Sample rate (default 16000Hz, what Whisper expects)
+
+        Returns:
+            numpy float32 array of samples in [-1.0, 1.0)
+        """
+        import numpy as np
+
+        data = self._pipe_audio(input_path, [
+            '-f', 's16le',
+            '-acodec', 'pcm_s16le',
+            '-ar', str(sample_rate),
+            '-ac', '1',
+        ])
+        return np.frombuffer(data, np.int16).astype(np.float32) / 32768.0
+
+    def video_to_audio_bytes(self,
+                             input_path: Union[str, Path],
+                             audio_format: str = 'mp3',
+                             sample_rate: int = 16000,
+                             channels: int = 1,
+                             start: Optional[float] = None,
+                             duration: Optional[float] = None) -> bytes:
+        """
+        Encode a media file's audio track (or a slice of it) into an in-memory audio file
+
+        Args:
+            input_path: Input video or audio file path
+            audio_format: Container format ('mp3', 'flac', 'ogg', 'wav')
+            sample_rate: Sample rate (default 16000Hz)
+            channels: Number of channels (1=mono, 2=stereo)
+            start: Offset in seconds to start from (default: beginning)
+            duration: Seconds of audio to encode (default: until the end)
+
+        Returns:
+            Encoded audio file content
+        """
+        input_args = []
+        if start:
+            input_args += ['-ss', f"{start:.3f}"]
+        if duration is not None:
+            input_args += ['-t', f"{duration:.3f}"]
+        return self._pipe_audio(input_path, [
+            '-f', audio_format,
+            '-acodec', self._get_audio_codec(audio_format),
+            '-ar', str(sample_rate),
+            '-ac', str(channels),
+        ], input_args)
+
+    def probe_audio_codec(self, file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Get the codec name of the first audio stream using ffprobe
+
+        Args:
+            file_path: Audio or video file path
+
+        Returns:
+            Codec name (e.g. 'aac', 'mp3', 'opus'), or None if there is no
+            audio stream or it cannot be determined
+        """
+        cmd = [
+            'ffprobe',
+            '-v', 'error',
+            '-select_streams', 'a:0',
+            '-show_entries', 'stream=codec_name',
+            '-of', 'csv=p=0',
+            str(file_path)
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=30
+            )
+        except (subprocess.SubprocessError, FileNotFoundError) as e:
+            logger.debug(f"Could not probe audio codec of {file_path}: {e}")
+            return None
+        return result.stdout.strip() or None
+
+    def copy_audio_bytes(self, input_path: Union[str, Path]) -> Optional[Tuple[bytes, str]]:
+        """
+        Extract the audio track without re-encoding when its codec allows it
+
+        Stream copy (-c:a copy) only demuxes, so it is limited by disk speed
+        rather than encoder CPU time.
+
+        Args:
+            input_path: Input video or audio file path
+
+        Returns:
+            (audio file content, file extension) if the track was copied, or
+            None if the codec is not in COPYABLE_AUDIO_CODECS or copying failed
+        """
+        target = self.COPYABLE_AUDIO_CODECS.get(self.probe_audio_codec(input_path))
+        if target is None:
+            return None
+        output_format, extension = target
+        try:
+            data = self._pipe_audio(input_path, ['-f', output_format, '-c:a', 'copy'])
+        except RuntimeError as e:
+            logger.debug(f"Audio stream copy failed for {input_path}, re-encoding: {e}")
+            return None
+        return data, extension
+
+    def detect_silences(self,
+                        file_path: Union[str, Path],
+                        noise_db: float = -30.0,
+                        min_duration: float = 0.5) -> List[Tuple[float, float]]:
+        """
+        Find silent stretches with ffmpeg's silencedetect filter
+
+        Args:
+            file_path: Audio or video file path
+            noise_db: Level below which audio counts as silence (dB)
+            min_duration: Shortest silence to report in seconds
+
+        Returns:
+            (start, end) seconds of each silence in order; empty if detection fails
+        """
+        cmd = [
+            'ffmpeg',
+            '-hide_banner', '-nostats',
+            '-i', str(file_path),
+            '-vn',
+            '-af', f"silencedetect=noise={noise_db}dB:d={min_duration}",
+            '-f', 'null', '-'
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors='replace',
+                check=True,
+                timeout=600
+            )
+        except (subprocess.SubprocessError, FileNotFoundError) as e:
+            logger.warning(f"Silence detection failed for {file_path}: {e}")
+            return []
+
+        silences = []
+        start = None
+        for match in _SILENCE_EVENT.finditer(result.stderr):
+            value = float(match.group(2))
+            if match.group(1) == 'start':
+                start = value
+            elif start is not None:
+                silences.append((start, value))
+                start = None
+        return silences
+
+    def probe_duration(self, file_path: Union[str, Path]) -> Optional[float]:
+        """
+        Get media duration in seconds using ffprobe
+
+        Args:
+            file_path: Audio or video file path
+
+        Returns:
+            Duration in seconds, or None if it cannot be determined
+        """
+        cmd = [
+            'ffprobe',
+            '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'csv=p=0',
+            str(file_path)
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=30
+            )
+            return float(result.stdout.strip())
+        except (subprocess.SubprocessError, FileNotFoundError, ValueError) as e:
+            logger.debug(f"Could not probe duration of {file_path}: {e}")
+            return None
+
+    def probe_durations(self,
+                        file_paths: Iterable[Union[str, Path]],
+                        max_workers: Optional[int] = None) -> Dict[str, Optional[float]]:
+        """
+        Get durations of many media files, running ffprobe processes in parallel
+
+        Successful results are cached per (path, mtime, size), so files probed
+        earlier in this process are not probed again unless they changed.
+
+        Args:
+            file_paths: Audio or video file paths
+            max_workers: Maximum concurrent ffprobe processes (default: CPU count)
+
+        Returns:
+            Dict mapping each path (as str, in input order) to its duration in
+            seconds, or None if it cannot be determined
+        """
+        durations: Dict[str, Optional[float]] = {}
+        to_probe: Dict[str, Tuple[str, int, int]] = {}
+        for file_path in file_paths:
+            path = str(file_path)
+            durations[path] = None
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            key = (path, st.st_mtime_ns, st.st_size)
+            with _DURATION_CACHE_LOCK:
+                cached = key in _DURATION_CACHE
+                if cached:
+                    durations[path] = _DURATION_CACHE[key]
+            if not cached:
+                to_probe[path] = key
+
+        if to_probe:
+            workers = max_workers or min(os.cpu_count() or 1, len(to_probe))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for path, duration in zip(to_probe, executor.map(self.probe_duration, to_probe)):
+                    durations[path] = duration
+                    # Failures are not cached so a transient error can be retried
+                    if duration is not None:
+                        with _DURATION_CACHE_LOCK:
+                            _DURATION_CACHE[to_probe[path]] = duration
+
+        return durations
+
+    def bucket_by_duration(self,
+                           file_paths: Iterable[Union[str, Path]],
+                           buckets: Tuple[Tuple[float, float], ...] = DURATION_BUCKETS
+                           ) -> List[List[str]]:
+        """
+        Group media files into duration buckets, shortest bucket first
+
+        Files whose duration cannot be probed go into the last bucket.
+
+        Args:
+            file_paths: Audio or video file paths
+            buckets: (min, max) duration ranges in seconds
+
+        Returns:
+            One list of file paths per bucket, in bucket order
+        """
+        durations = self.probe_durations(file_paths)
+        grouped: List[List[str]] = [[] for _ in buckets]
+        for file_path, duration in durations.items():
+            index = len(buckets) - 1
+            if duration is not None:
+                for i, (low, high) in enumerate(buckets):
+                    if low <= duration < high:
+                        index = i
+                        break
+            grouped[index].append(file_path)
+        return grouped
+
+    def batch_video_to_audio(self,
+                             input_paths: Iterable[Union[str, Path]],
+                             output_dir: Optional[Union[str, Path]] = None,
+                             audio_format: str = 'wav',
+                             max_workers: Optional[int] = None,
+                             **kwargs) -> Dict[str, List]:
+        """
+        Convert multiple video files to audio in parallel
+
+        Each conversion is an independent ffmpeg subprocess, so a thread pool is
+        enough to keep several of them running at once.
+
+        Args:
+            input_paths: Input video file paths (any iterable, consumed lazily)
+            output_dir: Output directory (optional, default 'whisper_output')
+            audio_format: Audio format ('wav', 'mp3', 'flac', 'aac')
+            max_workers: Maximum concurrent ffmpeg processes (default: CPU count)
+            **kwargs: Other conversion parameters passed to video_to_audio
+
+        Returns:
+            Dict with 'converted' (list of output paths) and 'failed'
+            (list of (input path, error message) tuples)
+        """
+        results: Dict[str, List] = {'converted': [], 'failed': []}
+
+        if max_workers is None:
+            if isinstance(input_paths, (list, tuple, set, frozenset)):
+                max_workers = min(os.cpu_count() or 1, len(input_paths)) or 1
+            else:
+                max_workers = os.cpu_count() or 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Submit while iterating so a lazy source (e.g. iter_files) keeps
+            # ffmpeg busy before the directory walk has finished
+            futures = {}
+            for input_path in input_paths:
+                input_path = Path(input_path)
+                future = executor.submit(self.video_to_audio,
+                                         input_path,
+                                         output_dir=output_dir,
+                                         audio_format=audio_format,
+                                         **kwargs)
+                futures[future] = input_path
+            for future in as_completed(futures):
+                input_path = futures[future]
+                try:
+                    results['converted'].append(future.result())
+                except Exception as e:
+                    logger.error(f"Failed to convert {input_path.name}: {e}")
+                    results['failed'].append((str(input_path), str(e)))
+
+        logger.info(
+            f"Batch conversion finished: {len(results['converted'])} converted, "
+            f"{len(results['failed'])} failed")
+        return results
+
     def _get_audio_codec(self, audio_format: str) -> str:
         """Get audio codec based on audio format"""
         codec_map = {
@@ -169,6 +600,20 @@ class VideoConverter:
         return codec_map.get(audio_format.lower(), 'pcm_s16le')
 
 
+@lru_cache(maxsize=1)
+def get_default_converter() -> VideoConverter:
+    """
+    Return a process-wide VideoConverter
+
+    Converters hold no per-call state, so transcription paths share this one
+    instead of constructing (and re-checking ffmpeg for) one per file.
+
+    Raises:
+        RuntimeError: If FFmpeg is not available (not cached; retried next call)
+    """
+    return VideoConverter()
+
+
 def convert_video_to_audio(input_path: Union[str, Path],
                            output_path: Optional[Union[str, Path]] = None,
                            output_dir: Optional[Union[str, Path]] = None,
@@ -185,5 +630,5 @@ def convert_video_to_audio(input_path: Union[str, Path],
     Returns:
         Path of the converted audio file
     """
-    converter = VideoConverter()
+    converter = get_default_converter()
     return converter.video_to_audio(input_path, output_path, output_dir, **kwargs)
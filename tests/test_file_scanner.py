@@ -0,0 +1,64 @@
+"""Tests for the single-pass file scanner"""
+
+from pathlib import Path
+
+import pytest
+
+from video2md.utils.file_scanner import DEFAULT_EXCLUDED_DIRS, find_files, iter_by_extension
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for name in ("a.srt", "b.TXT", "notes.md", "sub/c.srt", "sub/deep/d.srt",
+                 ".git/e.srt", "node_modules/f.srt"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    return tmp_path
+
+
+def test_find_files_top_level_only(tree):
+    found = find_files(tree, ["*.srt", "*.txt"])
+    assert found == [tree / "a.srt", tree / "b.TXT"]
+
+
+def test_find_files_recursive(tree):
+    found = find_files(tree, ["*.srt"], recursive=True)
+    assert found == sorted([
+        tree / "a.srt", tree / "sub/c.srt", tree / "sub/deep/d.srt",
+        tree / ".git/e.srt", tree / "node_modules/f.srt",
+    ])
+
+
+def test_find_files_prunes_excluded_dirs(tree):
+    found = find_files(tree, ["*.srt"], recursive=True, exclude_dirs=DEFAULT_EXCLUDED_DIRS)
+    assert found == [tree / "a.srt", tree / "sub/c.srt", tree / "sub/deep/d.srt"]
+
+
+def test_find_files_keeps_relative_paths(tree, monkeypatch):
+    monkeypatch.chdir(tree)
+    found = find_files("sub", ["*.srt"], recursive=True)
+    assert found == [Path("sub/c.srt"), Path("sub/deep/d.srt")]
+
+
+def test_find_files_non_extension_pattern(tree):
+    assert find_files(tree, ["note*"]) == [tree / "notes.md"]
+
+
+def test_iter_by_extension_classifies(tree):
+    sets = {"subtitle": {".srt"}, "text": {".txt", ".md"}}
+    found = sorted(iter_by_extension(tree, sets, recursive=True,
+                                     exclude_dirs=DEFAULT_EXCLUDED_DIRS))
+    assert found == [
+        (tree / "a.srt", "subtitle"),
+        (tree / "b.TXT", "text"),
+        (tree / "notes.md", "text"),
+        (tree / "sub/c.srt", "subtitle"),
+        (tree / "sub/deep/d.srt", "subtitle"),
+    ]
+
+
+def test_iter_by_extension_relative_paths(tree, monkeypatch):
+    monkeypatch.chdir(tree)
+    found = list(iter_by_extension(".", {"subtitle": {".srt"}}))
+    assert found == [(Path("a.srt"), "subtitle")]
@@ -0,0 +1,21 @@
+"""Tests for SRT cleaning in media_utils"""
+
+from video2md.services.media_utils import _clean_srt_to_plain
+
+_SRT = (
+    "1\n"
+    "00:00:00,000 --> 00:00:01,000\n"
+    "Hello there\n"
+    "\n"
+    "2\n"
+    "00:00:01,000 --> 00:00:02,500\n"
+    "Second line\n"
+)
+
+
+def test_clean_srt_drops_indices_and_timecodes():
+    assert _clean_srt_to_plain(_SRT) == "Hello there\n\nSecond line"
+
+
+def test_clean_srt_ignores_leading_bom():
+    assert _clean_srt_to_plain("\ufeff" + _SRT) == _clean_srt_to_plain(_SRT)
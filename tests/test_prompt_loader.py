@@ -0,0 +1,67 @@
+"""Tests for PromptLoader.compile() against render()"""
+
+import re
+
+import pytest
+
+from video2md.prompt_loader import PromptLoader
+
+# Values that HTML autoescaping would change
+_TRICKY_VALUE = 'input/a&b "don\'t" <x>.mp4'
+
+_MESSAGE_PROMPTS = (
+    "researcher_input",
+    "summarizer_input",
+    "whisper_batch_message",
+    "whisper_host_message",
+)
+
+
+def _placeholders(loader: PromptLoader, name: str) -> dict:
+    names = set(re.findall(r"\{\{\s*(\w+)\s*\}\}", loader.load(name)))
+    return {key: _TRICKY_VALUE for key in names}
+
+
+@pytest.mark.parametrize("name", _MESSAGE_PROMPTS)
+def test_compile_matches_render(name):
+    loader = PromptLoader()
+    kwargs = _placeholders(loader, name)
+    assert kwargs
+
+    assert loader.compile(name)(**kwargs) == loader.render(name, **kwargs)
+
+
+@pytest.mark.parametrize("name", _MESSAGE_PROMPTS)
+def test_compile_does_not_escape_values(name):
+    loader = PromptLoader()
+    rendered = loader.compile(name)(**_placeholders(loader, name))
+
+    assert _TRICKY_VALUE in rendered
+
+
+def test_batch_message_embeds_valid_json():
+    import json
+
+    from video2md.prompt_loader import to_json
+
+    items = [
+        {
+            "MEDIA_PATH": 'input/a&b "1".mp4',
+            "SRT_PATH": 'output/a&b "1"/a&b "1".srt',
+            "DEST_DIR": 'output/a&b "1"',
+            "BASENAME": 'a&b "1"',
+        },
+        {
+            "MEDIA_PATH": "input/<clip>.mp4",
+            "SRT_PATH": "output/<clip>/<clip>.srt",
+            "DEST_DIR": "output/<clip>",
+            "BASENAME": "<clip>",
+        },
+    ]
+    message = PromptLoader().compile("whisper_batch_message")(
+        ITEMS_JSON=to_json(items, indent=True),
+    )
+
+    start = message.index("[")
+    end = message.index("\nUnified output layout")
+    assert json.loads(message[start:end]) == items
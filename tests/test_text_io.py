@@ -0,0 +1,44 @@
+"""Tests for whole-file text I/O"""
+
+import pytest
+
+from video2md.utils import text_io
+from video2md.utils.text_io import read_text_file, write_text_file
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "out.srt"
+    write_text_file(path, "字幕\nline two\n")
+    assert read_text_file(path) == "字幕\nline two\n"
+
+
+def test_overwrites_existing_file(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_text("old content that is longer")
+    write_text_file(path, "new")
+    assert read_text_file(path) == "new"
+
+
+def test_creates_missing_parents(tmp_path):
+    path = tmp_path / "a" / "b" / "out.txt"
+    write_text_file(path, "hello")
+    assert path.read_text(encoding="utf-8") == "hello"
+
+
+def test_leaves_no_temp_file(tmp_path):
+    write_text_file(tmp_path / "out.txt", "hello")
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+
+
+def test_failed_write_keeps_original_and_removes_temp(tmp_path, monkeypatch):
+    path = tmp_path / "out.txt"
+    path.write_text("original")
+
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(text_io.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        write_text_file(path, "new")
+    assert path.read_text() == "original"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
@@ -0,0 +1,89 @@
+"""Tests for the persistent transcript cache"""
+
+import os
+
+import pytest
+
+from video2md.clients import _transcript_cache
+from video2md.clients._transcript_cache import TranscriptCache, get_default_cache, make_key
+from video2md.models.transcription_models import TranscriptResult, TranscriptSegment
+
+_RESULT = TranscriptResult(
+    language="en",
+    full_text="Hello there",
+    segments=[TranscriptSegment(start=0.0, end=1.0, text="Hello there")],
+)
+
+
+@pytest.fixture
+def media(tmp_path):
+    path = tmp_path / "clip.wav"
+    path.write_bytes(b"audio-one")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TranscriptCache(tmp_path / "cache")
+
+
+def test_hit_returns_stored_result(cache, media):
+    key = make_key(media, "model", "en")
+    assert cache.get(key) is None
+    cache.set(key, _RESULT)
+
+    cached = cache.get(make_key(media, "model", "en"))
+    assert cached.full_text == _RESULT.full_text
+    assert cached.segments == _RESULT.segments
+
+
+def test_options_are_part_of_the_key(cache, media):
+    cache.set(make_key(media, "model", "en"), _RESULT)
+    assert cache.get(make_key(media, "model", "zh")) is None
+
+
+def test_miss_after_size_change(cache, media):
+    cache.set(make_key(media, "model"), _RESULT)
+    media.write_bytes(b"audio-one-longer")
+    assert cache.get(make_key(media, "model")) is None
+
+
+def test_miss_after_mtime_change(cache, media):
+    cache.set(make_key(media, "model"), _RESULT)
+    # Same size, new content: only the mtime tells the digest cache to rehash
+    st = media.stat()
+    media.write_bytes(b"audio-two")
+    os.utime(media, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert cache.get(make_key(media, "model")) is None
+
+
+def test_entry_expires_after_ttl(tmp_path, media, monkeypatch):
+    cache = TranscriptCache(tmp_path / "cache", ttl=60)
+    key = make_key(media, "model")
+    now = 1_000_000.0
+    monkeypatch.setattr(_transcript_cache.time, "time", lambda: now)
+    cache.set(key, _RESULT)
+
+    now += 30
+    assert cache.get(key) is not None
+    now += 31
+    assert cache.get(key) is None
+
+
+@pytest.fixture
+def fresh_default_cache():
+    get_default_cache.cache_clear()
+    yield
+    get_default_cache.cache_clear()
+
+
+def test_disabled_via_env(monkeypatch, fresh_default_cache):
+    monkeypatch.setenv("V2M_CACHE_ENABLED", "false")
+    assert get_default_cache() is None
+
+
+def test_enabled_uses_cache_dir(tmp_path, monkeypatch, fresh_default_cache):
+    monkeypatch.setenv("V2M_CACHE_ENABLED", "true")
+    monkeypatch.setenv("V2M_CACHE_DIR", str(tmp_path))
+    assert isinstance(get_default_cache(), TranscriptCache)
+    assert (tmp_path / "transcripts.sqlite3").exists()
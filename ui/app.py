@@ -15,6 +15,7 @@ To run locally:
 
 from pathlib import Path
 from typing import List
+import logging
 import sys
 
 try:
@@ -59,6 +60,10 @@ except ImportError:
 def main():  # pragma: no cover
     """Main entry point for the Gradio UI."""
     
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    # Per-file progress from the agents is logged at INFO
+    logging.getLogger("video2md.agents").setLevel(logging.INFO)
+    
     # Check dependencies before starting UI
     print("Checking dependencies...")
     DependencyChecker.validate_or_exit(require_ffmpeg=True, require_node=True)
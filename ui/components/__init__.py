@@ -6,6 +6,7 @@ from .shared import (
     OUTPUT_DIR,
     MEDIA_EXTENSIONS,
     VIDEO_EXTENSIONS,
+    list_media_files,
     list_media_in_input,
     list_basenames,
     is_video_file,
@@ -57,6 +58,7 @@ __all__ = [
     "OUTPUT_DIR",
     "MEDIA_EXTENSIONS",
     "VIDEO_EXTENSIONS",
+    "list_media_files",
     "list_media_in_input",
     "list_basenames",
     "is_video_file",
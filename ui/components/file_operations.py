@@ -10,10 +10,13 @@ Following SOLID principles - Single Responsibility for file operations.
 """
 
 from pathlib import Path
+import os
 import shutil
 import tempfile
 from typing import List, Optional, Tuple, Callable
 
+from .shared import has_output_files, list_media_files
+
 try:
     import gradio as gr  # type: ignore
 except Exception:  # pragma: no cover
@@ -31,29 +34,20 @@ OUTPUT_DIR = Path("output")
 
 def list_input_files() -> List[str]:
     """List all media files in the input directory."""
-    media_exts = {
-        ".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv", ".webm",
-        ".mp3", ".wav", ".flac", ".aac", ".ogg", ".m4a", ".wma",
-    }
     INPUT_DIR.mkdir(parents=True, exist_ok=True)
-    return [
-        str(p.relative_to(INPUT_DIR))
-        for p in INPUT_DIR.rglob("*")
-        if p.is_file() and p.suffix.lower() in media_exts
-    ]
+    return list_media_files(INPUT_DIR)
 
 
 def list_output_folders() -> List[str]:
     """List all output folders that contain processed files."""
     names = []
     if OUTPUT_DIR.exists():
-        for sub in sorted(OUTPUT_DIR.iterdir()):
-            if not sub.is_dir():
-                continue
-            name = sub.name
+        with os.scandir(OUTPUT_DIR) as it:
+            subdirs = sorted(Path(entry.path) for entry in it if entry.is_dir())
+        for sub in subdirs:
             # Check if folder has any expected output files
-            if (sub / f"{name}.md").exists() or (sub / f"{name}.txt").exists() or (sub / f"{name}.srt").exists() or (sub / f"{name}.json").exists():
-                names.append(name)
+            if has_output_files(sub):
+                names.append(sub.name)
     return names
 
 
@@ -20,6 +20,9 @@ except Exception:  # pragma: no cover
 
 from .shared import INPUT_DIR, OUTPUT_DIR, list_media_in_input, is_video_file
 
+# Buffer for streaming uploaded file objects to disk
+COPY_BUFFER_SIZE = 1024 * 1024
+
 # Import downloaders if available
 try:
     from video2md.downloaders import (
@@ -192,10 +195,13 @@ def handle_upload(files) -> Tuple[str, object]:
             continue
         dest = INPUT_DIR / path.name
         try:
+            # Stream the copy instead of loading the whole video into memory;
+            # copyfile uses os.sendfile on Linux (no user-space copy)
             if hasattr(f, "read"):
-                dest.write_bytes(f.read())
+                with dest.open("wb") as out:
+                    shutil.copyfileobj(f, out, COPY_BUFFER_SIZE)
             else:
-                dest.write_bytes(Path(f).read_bytes())
+                shutil.copyfile(Path(f), dest)
             saved.append(dest.name)
         except Exception as e:
             wrong.append(f"{path.name} (save failed: {e})")
@@ -214,7 +214,9 @@ def create_on_run_handler(list_basenames_func, list_media_func):
                                 input_dir=str(INPUT_DIR),
                                 selected_files=[media_file],
                                 transcribe_method=transcribe_method,
-                                enable_trace=False
+                                enable_trace=False,
+                                # Keep the MCP servers warm between files and runs
+                                reuse_mcp_servers=True,
                             )
                             
                             if not srts:
@@ -9,6 +9,7 @@ This module contains:
 
 from pathlib import Path
 from typing import List, Optional
+import os
 import re
 
 try:
@@ -24,26 +25,64 @@ except Exception:  # pragma: no cover
 INPUT_DIR = Path("input")
 OUTPUT_DIR = Path("output")
 
-MEDIA_EXTENSIONS = {
+MEDIA_EXTENSIONS = frozenset({
     ".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv", ".webm",
     ".mp3", ".wav", ".flac", ".aac", ".ogg", ".m4a", ".wma",
-}
+})
 
-VIDEO_EXTENSIONS = {".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv", ".webm"}
+VIDEO_EXTENSIONS = frozenset({".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv", ".webm"})
+
+# Files that mark an output folder as processed
+OUTPUT_EXTENSIONS = (".md", ".txt", ".srt", ".json")
 
 
 # ============================================================
 # File Listing Functions
 # ============================================================
 
+def list_media_files(directory: Path) -> List[str]:
+    """List media files under a directory, relative to it.
+    
+    Walks the tree once with os.scandir and matches names against
+    MEDIA_EXTENSIONS, so non-media files are never stat()ed. Hidden
+    directories (e.g. .git) are not descended into.
+    """
+    found = []
+    pending = [os.fspath(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            pending.append(entry.path)
+                    elif (os.path.splitext(entry.name)[1].lower() in MEDIA_EXTENSIONS
+                          and entry.is_file()):
+                        found.append(os.path.relpath(entry.path, directory))
+        except OSError:
+            continue
+    return found
+
+
 def list_media_in_input() -> List[str]:
     """List all media files in the input directory."""
     INPUT_DIR.mkdir(parents=True, exist_ok=True)
-    return [
-        str(p.relative_to(INPUT_DIR))
-        for p in INPUT_DIR.rglob("*")
-        if p.is_file() and p.suffix.lower() in MEDIA_EXTENSIONS
-    ]
+    return list_media_files(INPUT_DIR)
+
+
+def has_output_files(folder: Path) -> bool:
+    """Check if a folder contains <name>.md, <name>.txt, <name>.srt or <name>.json.
+    
+    Reads the folder listing once instead of probing each candidate with stat().
+    """
+    name = folder.name
+    expected = {f"{name}{ext}" for ext in OUTPUT_EXTENSIONS}
+    try:
+        with os.scandir(folder) as it:
+            return any(entry.name in expected for entry in it)
+    except OSError:
+        return False
 
 
 def list_basenames() -> List[str]:
@@ -52,23 +91,16 @@ def list_basenames() -> List[str]:
     A folder is considered valid if it contains any of:
     <name>.md, <name>.txt, <name>.srt, or <name>.json
     """
-    names = set()
-    if OUTPUT_DIR.exists():
-        for sub in OUTPUT_DIR.iterdir():
-            if not sub.is_dir():
-                continue
-            name = sub.name
-            if (sub / f"{name}.md").exists() or \
-               (sub / f"{name}.txt").exists() or \
-               (sub / f"{name}.srt").exists() or \
-               (sub / f"{name}.json").exists():
-                names.add(name)
-    return sorted(names)
+    if not OUTPUT_DIR.exists():
+        return []
+    with os.scandir(OUTPUT_DIR) as it:
+        subdirs = [Path(entry.path) for entry in it if entry.is_dir()]
+    return sorted(sub.name for sub in subdirs if has_output_files(sub))
 
 
 def is_video_file(name: str) -> bool:
     """Check if a file is a video file based on extension."""
-    return Path(name).suffix.lower() in VIDEO_EXTENSIONS
+    return os.path.splitext(name)[1].lower() in VIDEO_EXTENSIONS
 
 
 # ============================================================